@@ -0,0 +1,254 @@
+"""
+Rolling Correlation Engine for AuraTrade Bot
+Incremental N x N return correlation and pair spread z-scores
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from utils.logger import Logger
+
+class CorrelationEngine:
+    """Rolling correlation/cointegration engine over many symbols
+
+    Each ``update`` pushes one synchronized row of mid prices (one value per
+    tracked symbol). Running sums of log returns and log prices, and of their
+    outer products, are maintained so the full correlation matrix, OLS hedge
+    ratios and spread z-scores for every pair are available from a handful of
+    vectorized O(N^2) operations instead of per-pair Python loops.
+    """
+
+    def __init__(self, window: int = 20, cointegration_window: int = 100):
+        self.logger = Logger().get_logger()
+
+        self.window = window                              # returns per correlation
+        self.cointegration_window = cointegration_window  # prices per hedge ratio
+        self.capacity = max(window + 1, cointegration_window) + 1
+
+        # Symbol registry
+        self.symbols: List[str] = []
+        self.symbol_index: Dict[str, int] = {}
+        self.first_seen = np.zeros(0, dtype=np.int64)
+        self.reference = np.zeros(0, dtype=np.float64)
+
+        # Ring of centred log prices, shape (capacity, N)
+        self.rows = np.zeros((self.capacity, 0), dtype=np.float64)
+        self.updates = 0
+
+        # Running sums over the return and log-price windows
+        self.sum_returns = np.zeros(0)
+        self.sum_returns_sq = np.zeros((0, 0))
+        self.sum_prices = np.zeros(0)
+        self.sum_prices_sq = np.zeros((0, 0))
+
+        # Cached results, invalidated on every update
+        self._correlation = None
+        self._zscores = None
+        self._hedge_ratios = None
+
+    def update(self, prices: Dict[str, float]):
+        """Push one row of mid prices; missing symbols carry their last price"""
+        try:
+            for symbol, price in prices.items():
+                if symbol not in self.symbol_index and price and price > 0:
+                    self._add_symbol(symbol, price)
+
+            if not self.symbols:
+                return
+
+            t = self.updates
+            row = self.rows[(t - 1) % self.capacity].copy() if t > 0 else np.zeros(len(self.symbols))
+            for symbol, price in prices.items():
+                if price and price > 0:
+                    i = self.symbol_index[symbol]
+                    row[i] = np.log(price) - self.reference[i]
+
+            self.rows[t % self.capacity] = row
+
+            # Returns window: returns at k in (t - window, t]
+            if t >= 1:
+                ret = row - self.rows[(t - 1) % self.capacity]
+                self.sum_returns += ret
+                self.sum_returns_sq += np.outer(ret, ret)
+                if t - self.window >= 1:
+                    old = (self.rows[(t - self.window) % self.capacity] -
+                           self.rows[(t - self.window - 1) % self.capacity])
+                    self.sum_returns -= old
+                    self.sum_returns_sq -= np.outer(old, old)
+
+            # Log-price window: prices at k in (t - cointegration_window, t]
+            self.sum_prices += row
+            self.sum_prices_sq += np.outer(row, row)
+            if t - self.cointegration_window >= 0:
+                old = self.rows[(t - self.cointegration_window) % self.capacity]
+                self.sum_prices -= old
+                self.sum_prices_sq -= np.outer(old, old)
+
+            self.updates += 1
+
+            # Periodically rebuild the sums to cancel floating-point drift
+            if self.updates % self.capacity == 0:
+                self._resync()
+
+            self._correlation = None
+            self._zscores = None
+            self._hedge_ratios = None
+
+        except Exception as e:
+            self.logger.error(f"Error updating correlation engine: {e}")
+
+    def _add_symbol(self, symbol: str, price: float):
+        """Register a new symbol with a flat history at its first price"""
+        n = len(self.symbols)
+        self.symbol_index[symbol] = n
+        self.symbols.append(symbol)
+        self.first_seen = np.append(self.first_seen, self.updates)
+        self.reference = np.append(self.reference, np.log(price))
+        self.rows = np.hstack([self.rows, np.zeros((self.capacity, 1))])
+        self._resync()
+
+    def _resync(self):
+        """Recompute running sums from the stored rows"""
+        n = len(self.symbols)
+        t = self.updates
+
+        price_count = min(t, self.cointegration_window)
+        if price_count > 0:
+            idx = [(k % self.capacity) for k in range(t - price_count, t)]
+            prices = self.rows[idx]
+            self.sum_prices = prices.sum(axis=0)
+            self.sum_prices_sq = prices.T @ prices
+        else:
+            self.sum_prices = np.zeros(n)
+            self.sum_prices_sq = np.zeros((n, n))
+
+        return_count = min(max(t - 1, 0), self.window)
+        if return_count > 0:
+            idx = [(k % self.capacity) for k in range(t - return_count - 1, t)]
+            returns = np.diff(self.rows[idx], axis=0)
+            self.sum_returns = returns.sum(axis=0)
+            self.sum_returns_sq = returns.T @ returns
+        else:
+            self.sum_returns = np.zeros(n)
+            self.sum_returns_sq = np.zeros((n, n))
+
+    def _ready_mask(self) -> np.ndarray:
+        """Symbols with a full return window of real observations"""
+        return (self.updates - self.first_seen) > self.window
+
+    def correlation_matrix(self) -> np.ndarray:
+        """N x N correlation of log returns over the rolling window"""
+        if self._correlation is not None:
+            return self._correlation
+
+        n = len(self.symbols)
+        count = min(max(self.updates - 1, 0), self.window)
+        if n == 0 or count < 2:
+            self._correlation = np.zeros((n, n))
+            return self._correlation
+
+        mean = self.sum_returns / count
+        cov = self.sum_returns_sq / count - np.outer(mean, mean)
+        std = np.sqrt(np.clip(np.diag(cov), 0, None))
+        denom = np.outer(std, std)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.where(denom > 0, cov / denom, 0.0)
+
+        ready = self._ready_mask()
+        corr[~ready, :] = 0.0
+        corr[:, ~ready] = 0.0
+        np.clip(corr, -1.0, 1.0, out=corr)
+
+        self._correlation = corr
+        return corr
+
+    def _compute_spreads(self):
+        """Compute OLS hedge ratios and spread z-scores for all pairs"""
+        n = len(self.symbols)
+        count = min(self.updates, self.cointegration_window)
+        if n == 0 or count < 3:
+            self._hedge_ratios = np.zeros((n, n))
+            self._zscores = np.zeros((n, n))
+            return
+
+        mean = self.sum_prices / count
+        cov = self.sum_prices_sq / count - np.outer(mean, mean)
+        var = np.clip(np.diag(cov), 0, None)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # beta[i, j]: hedge ratio of symbol i against symbol j
+            beta = np.where(var[None, :] > 0, cov / var[None, :], 0.0)
+            resid_var = var[:, None] - beta * cov
+
+            current = self.rows[(self.updates - 1) % self.capacity]
+            deviation = current - mean
+            spread_dev = deviation[:, None] - beta * deviation[None, :]
+
+            resid_std = np.sqrt(np.clip(resid_var, 0, None))
+            zscores = np.where(resid_std > 1e-12, spread_dev / resid_std, 0.0)
+
+        np.fill_diagonal(zscores, 0.0)
+        self._hedge_ratios = beta
+        self._zscores = zscores
+
+    def spread_zscores(self) -> np.ndarray:
+        """N x N matrix of spread z-scores (log p_i - beta_ij * log p_j)"""
+        if self._zscores is None:
+            self._compute_spreads()
+        return self._zscores
+
+    def hedge_ratios(self) -> np.ndarray:
+        """N x N matrix of OLS hedge ratios over the cointegration window"""
+        if self._hedge_ratios is None:
+            self._compute_spreads()
+        return self._hedge_ratios
+
+    def correlation(self, symbol1: str, symbol2: str) -> float:
+        """Correlation of returns between two symbols"""
+        i = self.symbol_index.get(symbol1)
+        j = self.symbol_index.get(symbol2)
+        if i is None or j is None:
+            return 0.0
+        return float(self.correlation_matrix()[i, j])
+
+    def spread_zscore(self, symbol1: str, symbol2: str) -> float:
+        """Spread z-score of symbol1 hedged against symbol2"""
+        i = self.symbol_index.get(symbol1)
+        j = self.symbol_index.get(symbol2)
+        if i is None or j is None:
+            return 0.0
+        return float(self.spread_zscores()[i, j])
+
+    def divergent_pairs(self, correlation_threshold: float,
+                        zscore_threshold: float) -> List[Tuple[str, str, float, float, float]]:
+        """Pairs that are highly correlated but whose spread has diverged
+
+        Returns (symbol1, symbol2, correlation, zscore, hedge_ratio) tuples
+        for the upper triangle of the matrices.
+        """
+        n = len(self.symbols)
+        if n < 2:
+            return []
+
+        corr = self.correlation_matrix()
+        zscores = self.spread_zscores()
+        beta = self.hedge_ratios()
+
+        rows, cols = np.triu_indices(n, k=1)
+        mask = ((np.abs(corr[rows, cols]) > correlation_threshold) &
+                (np.abs(zscores[rows, cols]) > zscore_threshold))
+
+        return [
+            (self.symbols[i], self.symbols[j], float(corr[i, j]), float(zscores[i, j]), float(beta[i, j]))
+            for i, j in zip(rows[mask], cols[mask])
+        ]
+
+    def get_status(self) -> Dict[str, Optional[int]]:
+        """Get engine status information"""
+        return {
+            'symbols': len(self.symbols),
+            'updates': self.updates,
+            'ready_symbols': int(self._ready_mask().sum()) if self.symbols else 0,
+            'window': self.window,
+            'cointegration_window': self.cointegration_window
+        }
@@ -9,6 +9,7 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 from utils.logger import Logger
+from analysis.swing_points import swing_detector
 
 class CandlestickPatternRecognition:
     """Candlestick pattern recognition engine"""
@@ -619,19 +620,10 @@ class ChartPatternRecognition:
             if len(rates) < 30:
                 return patterns
             
-            recent = rates.tail(30)
-            highs = recent['high'].values
-            lows = recent['low'].values
-            
             # Find local extremes
-            peaks = []
-            troughs = []
-            
-            for i in range(2, len(highs) - 2):
-                if highs[i] > highs[i-1] and highs[i] > highs[i+1]:
-                    peaks.append((i, highs[i]))
-                if lows[i] < lows[i-1] and lows[i] < lows[i+1]:
-                    troughs.append((i, lows[i]))
+            points = swing_detector.swings(rates, order=1, lookback=30, edge=2)
+            peaks = list(zip(points.high_indices, points.high_values))
+            troughs = list(zip(points.low_indices, points.low_values))
             
             # Head and Shoulders Top
             if len(peaks) >= 3:
@@ -680,22 +672,10 @@ class ChartPatternRecognition:
             if len(rates) < 20:
                 return patterns
             
-            recent = rates.tail(20)
-            highs = recent['high'].values
-            lows = recent['low'].values
-            
             # Find significant peaks and troughs
-            peaks = []
-            troughs = []
-            
-            for i in range(3, len(highs) - 3):
-                if (highs[i] > highs[i-1] and highs[i] > highs[i+1] and
-                    highs[i] > highs[i-2] and highs[i] > highs[i+2]):
-                    peaks.append(highs[i])
-                
-                if (lows[i] < lows[i-1] and lows[i] < lows[i+1] and
-                    lows[i] < lows[i-2] and lows[i] < lows[i+2]):
-                    troughs.append(lows[i])
+            points = swing_detector.swings(rates, order=2, lookback=20, edge=3)
+            peaks = points.high_values
+            troughs = points.low_values
             
             # Double Top
             if len(peaks) >= 2:
@@ -1015,28 +995,12 @@ class PatternRecognition:
     def _find_support_resistance(self, rates: pd.DataFrame) -> Dict[str, List[float]]:
         """Find support and resistance levels"""
         try:
-            highs = rates['high'].values
-            lows = rates['low'].values
-            
-            # Find local peaks and troughs
-            resistance_levels = []
-            support_levels = []
-            
-            # Simple peak/trough detection
-            for i in range(2, len(highs) - 2):
-                # Resistance (local high)
-                if (highs[i] > highs[i-1] and highs[i] > highs[i-2] and
-                    highs[i] > highs[i+1] and highs[i] > highs[i+2]):
-                    resistance_levels.append(highs[i])
-                
-                # Support (local low)
-                if (lows[i] < lows[i-1] and lows[i] < lows[i-2] and
-                    lows[i] < lows[i+1] and lows[i] < lows[i+2]):
-                    support_levels.append(lows[i])
+            # Local peaks (resistance) and troughs (support)
+            points = swing_detector.swings(rates, order=2)
             
             # Remove duplicates and sort
-            resistance_levels = sorted(list(set(resistance_levels)))[-5:]  # Keep last 5
-            support_levels = sorted(list(set(support_levels)))[-5:]  # Keep last 5
+            resistance_levels = sorted(set(points.high_values.tolist()))[-5:]  # Keep last 5
+            support_levels = sorted(set(points.low_values.tolist()))[-5:]  # Keep last 5
             
             return {
                 'resistance': resistance_levels,
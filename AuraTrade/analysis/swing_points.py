@@ -0,0 +1,144 @@
+"""
+Swing Point Detection for AuraTrade Bot
+Vectorized local extrema, cached per bar, and support/resistance zones
+"""
+
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+def find_swing_points(values: np.ndarray, order: int = 2, kind: str = 'high',
+                      edge: Optional[int] = None) -> np.ndarray:
+    """Indices of strict local extrema over ``order`` bars on each side
+
+    A swing high is strictly greater (a swing low strictly lower) than every
+    neighbour within ``order`` bars. Only indices in ``[edge, n - edge)``
+    are returned; ``edge`` defaults to ``order``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    edge = order if edge is None else max(edge, order)
+    n = len(values)
+    if n < 2 * order + 1 or n <= 2 * edge:
+        return np.zeros(0, dtype=np.int64)
+
+    windows = np.lib.stride_tricks.sliding_window_view(values, 2 * order + 1)
+    center = windows[:, order]
+    neighbours = np.concatenate([windows[:, :order], windows[:, order + 1:]], axis=1)
+
+    if kind == 'high':
+        mask = center > neighbours.max(axis=1)
+    else:
+        mask = center < neighbours.min(axis=1)
+
+    indices = np.nonzero(mask)[0] + order
+    return indices[(indices >= edge) & (indices < n - edge)]
+
+def cluster_levels(prices: np.ndarray, tolerance: float = 0.0005) -> List[Dict[str, float]]:
+    """Group price levels into zones no wider than ``tolerance`` (relative to price)
+
+    Levels are swept in ascending order and a new zone starts whenever a
+    level is more than ``tolerance`` above the first level of the current
+    zone, so zones cannot chain into wide bands. Returns zones sorted by
+    number of touches (most significant first) with their mean level and
+    bounds.
+    """
+    prices = np.sort(np.asarray(prices, dtype=np.float64))
+    if prices.size == 0:
+        return []
+
+    starts = [0]
+    for i in range(1, prices.size):
+        if prices[i] > prices[starts[-1]] * (1 + tolerance):
+            starts.append(i)
+
+    starts = np.asarray(starts)
+    touches = np.diff(np.append(starts, prices.size))
+    levels = np.add.reduceat(prices, starts) / touches
+    ends = starts + touches - 1
+
+    zones = [
+        {'level': float(level), 'low': float(prices[start]), 'high': float(prices[end]), 'touches': int(count)}
+        for level, start, end, count in zip(levels, starts, ends, touches)
+    ]
+    zones.sort(key=lambda zone: zone['touches'], reverse=True)
+    return zones
+
+@dataclass(frozen=True)
+class SwingPoints:
+    """Swing highs and lows of one rates window (indices relative to the window)"""
+    high_indices: np.ndarray
+    high_values: np.ndarray
+    low_indices: np.ndarray
+    low_values: np.ndarray
+
+class SwingPointDetector:
+    """Swing point detector with a small per-bar result cache
+
+    Results are keyed on the rates window (length, first/last bar and a
+    hash of the full high/low series) and the detection parameters, so
+    every module asking for the same window during one bar shares a single
+    computation, while another symbol or a corrected bar never hits a stale
+    entry.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[tuple, SwingPoints]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _window_key(rates: pd.DataFrame, highs: np.ndarray, lows: np.ndarray) -> tuple:
+        return (len(rates), rates.index[0], rates.index[-1],
+                hash(highs.tobytes()), hash(lows.tobytes()))
+
+    def swings(self, rates: pd.DataFrame, order: int = 2, lookback: Optional[int] = None,
+               edge: Optional[int] = None) -> SwingPoints:
+        """Swing highs/lows of the last ``lookback`` bars of ``rates``"""
+        window = rates.tail(lookback) if lookback else rates
+        if len(window) == 0:
+            empty = np.zeros(0)
+            return SwingPoints(empty.astype(np.int64), empty, empty.astype(np.int64), empty)
+
+        highs = np.ascontiguousarray(window['high'].values, dtype=np.float64)
+        lows = np.ascontiguousarray(window['low'].values, dtype=np.float64)
+        key = self._window_key(window, highs, lows) + (order, edge)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        high_idx = find_swing_points(highs, order, 'high', edge)
+        low_idx = find_swing_points(lows, order, 'low', edge)
+        points = SwingPoints(high_idx, highs[high_idx], low_idx, lows[low_idx])
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = points
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+        return points
+
+    def zones(self, rates: pd.DataFrame, order: int = 2, lookback: Optional[int] = None,
+              tolerance: float = 0.0005) -> Dict[str, List[Dict[str, float]]]:
+        """Support and resistance zones clustered from swing lows/highs"""
+        points = self.swings(rates, order, lookback)
+        return {
+            'resistance': cluster_levels(points.high_values, tolerance),
+            'support': cluster_levels(points.low_values, tolerance)
+        }
+
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._cache.clear()
+
+# Shared by all analysis modules and strategies
+swing_detector = SwingPointDetector()
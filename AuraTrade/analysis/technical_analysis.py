@@ -9,6 +9,36 @@ import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from utils.logger import Logger
+from analysis.swing_points import swing_detector
+
+# Field order of the (symbols, bars, fields) arrays taken by analyze_batch
+BATCH_FIELDS = ('open', 'high', 'low', 'close', 'tick_volume')
+
+# Latest indicator values and signals per symbol returned by analyze_batch
+BATCH_DTYPE = np.dtype([
+    ('symbol', 'U32'),
+    ('close', 'f8'),
+    ('rsi', 'f8'),
+    ('macd', 'f8'),
+    ('macd_signal', 'f8'),
+    ('macd_histogram', 'f8'),
+    ('sma20', 'f8'),
+    ('sma50', 'f8'),
+    ('bb_upper', 'f8'),
+    ('bb_lower', 'f8'),
+    ('stoch_k', 'f8'),
+    ('stoch_d', 'f8'),
+    ('atr', 'f8'),
+    ('momentum', 'f8'),
+    ('volatility', 'f8'),
+    ('trend', 'U12'),
+    ('bollinger_position', 'U12'),
+    ('volume_trend', 'U6'),
+    ('signal_strength', 'f8'),
+    ('market_condition', 'U16'),
+    ('overall_signal', 'U7'),
+    ('confidence', 'f8')
+])
 
 class TechnicalAnalysis:
     """Technical analysis with multiple indicators"""
@@ -441,25 +471,14 @@ class TechnicalAnalysis:
     def _calculate_support_resistance(self, rates: pd.DataFrame) -> Dict[str, float]:
         """Calculate support and resistance levels"""
         try:
+            # Local maxima and minima (2 bars each side)
+            points = swing_detector.swings(rates, order=2, lookback=50)
             highs = rates['high'].tail(50)
             lows = rates['low'].tail(50)
             
-            # Find local maxima and minima
-            resistance_levels = []
-            support_levels = []
-            
-            for i in range(2, len(highs) - 2):
-                if (highs.iloc[i] > highs.iloc[i-1] and highs.iloc[i] > highs.iloc[i-2] and
-                    highs.iloc[i] > highs.iloc[i+1] and highs.iloc[i] > highs.iloc[i+2]):
-                    resistance_levels.append(highs.iloc[i])
-                
-                if (lows.iloc[i] < lows.iloc[i-1] and lows.iloc[i] < lows.iloc[i-2] and
-                    lows.iloc[i] < lows.iloc[i+1] and lows.iloc[i] < lows.iloc[i+2]):
-                    support_levels.append(lows.iloc[i])
-            
             return {
-                'resistance': float(np.mean(resistance_levels)) if resistance_levels else float(highs.max()),
-                'support': float(np.mean(support_levels)) if support_levels else float(lows.min())
+                'resistance': float(points.high_values.mean()) if points.high_values.size else float(highs.max()),
+                'support': float(points.low_values.mean()) if points.low_values.size else float(lows.min())
             }
             
         except Exception as e:
@@ -723,3 +742,183 @@ class TechnicalAnalysis:
                 'overall_signal': 'NEUTRAL',
                 'confidence': 0.0
             }
+
+    @staticmethod
+    def stack_rates(rates_by_symbol: Dict[str, pd.DataFrame], bars: int = 200) -> Tuple[List[str], np.ndarray]:
+        """Stack the last ``bars`` rows of each symbol into a (symbols, bars, fields) array
+
+        Symbols with fewer than ``bars`` rows are left out; missing
+        ``tick_volume`` columns are filled with NaN.
+        """
+        symbols = []
+        blocks = []
+        for symbol, rates in rates_by_symbol.items():
+            if rates is None or len(rates) < bars:
+                continue
+            tail = rates.tail(bars)
+            blocks.append(np.column_stack([
+                tail[field].values if field in tail.columns else np.full(bars, np.nan)
+                for field in BATCH_FIELDS
+            ]).astype(np.float64))
+            symbols.append(symbol)
+
+        if not blocks:
+            return [], np.zeros((0, bars, len(BATCH_FIELDS)))
+        return symbols, np.stack(blocks)
+
+    @staticmethod
+    def _ewm_batch(values: np.ndarray, span: int) -> np.ndarray:
+        """Adjusted EWM (pandas ``ewm(span).mean()``) along bars for all rows"""
+        decay = 1 - 2 / (span + 1)
+        result = np.empty_like(values)
+        num = np.zeros(values.shape[0])
+        den = 0.0
+        for t in range(values.shape[1]):
+            num = values[:, t] + decay * num
+            den = 1.0 + decay * den
+            result[:, t] = num / den
+        return result
+
+    def analyze_batch(self, ohlcv: np.ndarray, symbols: Optional[List[str]] = None) -> np.ndarray:
+        """Analyze many symbols of one timeframe in vectorized passes
+
+        ``ohlcv`` is a (symbols, bars, fields) array with fields ordered as
+        ``BATCH_FIELDS`` and bars aligned oldest to newest. Every indicator is
+        computed for all symbols at once (reductions along the bar axis) and
+        the latest values are returned as a ``BATCH_DTYPE`` structured array
+        matching ``analyze_trends``/``get_trading_signals`` per symbol.
+        """
+        n_symbols = ohlcv.shape[0] if ohlcv.ndim == 3 else 0
+        result = np.zeros(n_symbols, dtype=BATCH_DTYPE)
+        if symbols is not None:
+            result['symbol'] = symbols[:n_symbols]
+
+        try:
+            if n_symbols == 0 or ohlcv.shape[1] < 50:
+                result['rsi'] = 50.0
+                result['trend'] = 'NEUTRAL'
+                result['bollinger_position'] = 'MIDDLE'
+                result['volume_trend'] = 'NORMAL'
+                result['market_condition'] = 'SIDEWAYS'
+                result['overall_signal'] = 'NEUTRAL'
+                return result
+
+            highs = ohlcv[:, :, 1]
+            lows = ohlcv[:, :, 2]
+            closes = ohlcv[:, :, 3]
+            volumes = ohlcv[:, :, 4]
+            close = closes[:, -1]
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # RSI (simple rolling means of gains/losses)
+                delta = np.diff(closes[:, -15:], axis=1)
+                gain = np.where(delta > 0, delta, 0.0).mean(axis=1)
+                loss = np.where(delta < 0, -delta, 0.0).mean(axis=1)
+                rsi = 100 - 100 / (1 + gain / loss)
+
+                # MACD
+                macd_line = self._ewm_batch(closes, 12) - self._ewm_batch(closes, 26)
+                macd = macd_line[:, -1]
+                macd_signal = self._ewm_batch(macd_line, 9)[:, -1]
+
+                # Moving averages and Bollinger Bands
+                sma20 = closes[:, -20:].mean(axis=1)
+                sma50 = closes[:, -50:].mean(axis=1)
+                std20 = closes[:, -20:].std(axis=1, ddof=1)
+                bb_upper = sma20 + 2 * std20
+                bb_lower = sma20 - 2 * std20
+
+                # Stochastic %K over the last 3 bars and its %D
+                hh = np.lib.stride_tricks.sliding_window_view(highs[:, -16:], 14, axis=1).max(axis=2)
+                ll = np.lib.stride_tricks.sliding_window_view(lows[:, -16:], 14, axis=1).min(axis=2)
+                k_percent = 100 * (closes[:, -3:] - ll) / (hh - ll)
+
+                # ATR (simple mean of true range)
+                prev_close = closes[:, -15:-1]
+                true_range = np.maximum(highs[:, -14:] - lows[:, -14:],
+                                        np.maximum(np.abs(highs[:, -14:] - prev_close),
+                                                   np.abs(lows[:, -14:] - prev_close)))
+
+                momentum = (close - closes[:, -14]) / closes[:, -14] * 100
+                returns = closes[:, -20:] / closes[:, -21:-1] - 1
+                volatility = returns.std(axis=1, ddof=1) * np.sqrt(20) * 100
+
+                # Trend: short/medium SMA agreement and 20-bar change
+                price_change = (close - closes[:, -20]) / closes[:, -20] * 100
+                short_bull = close > sma20
+                agree = short_bull == (close > sma50)
+                direction = np.where(short_bull, 'BULLISH', 'BEARISH')
+                trend = np.where(agree, np.where(np.abs(price_change) > 1.0,
+                                                 direction, np.char.add('WEAK_', direction)), 'NEUTRAL')
+
+                bb_position = np.select(
+                    [close >= bb_upper, close <= bb_lower, close > sma20],
+                    ['UPPER', 'LOWER', 'UPPER_MIDDLE'], 'LOWER_MIDDLE'
+                )
+
+                recent_volume = volumes[:, -5:].mean(axis=1)
+                baseline_volume = volumes[:, -20:].mean(axis=1)
+                volume_trend = np.select(
+                    [recent_volume > baseline_volume * 1.5, recent_volume < baseline_volume * 0.7],
+                    ['HIGH', 'LOW'], 'NORMAL'
+                )
+
+            # Signal strength (same weights as _calculate_signal_strength)
+            strength = np.select([rsi > 70, rsi < 30, (rsi > 40) & (rsi < 60)], [15.0, 15.0, 5.0], 0.0)
+            strength += np.where(macd != macd_signal, 10.0, 0.0)
+            strength += np.select([np.isin(trend, ['BULLISH', 'BEARISH']),
+                                   np.isin(trend, ['WEAK_BULLISH', 'WEAK_BEARISH'])], [20.0, 10.0], 0.0)
+            strength += np.where(np.isin(bb_position, ['UPPER', 'LOWER']), 15.0, 0.0)
+            strength += np.where(volume_trend == 'HIGH', 10.0, 0.0)
+            strength = np.minimum(strength, 100.0)
+
+            bullish = np.char.find(trend, 'BULLISH') >= 0
+            bearish = np.char.find(trend, 'BEARISH') >= 0
+            market_condition = np.select(
+                [(strength > 70) & bullish, (strength > 70) & bearish, strength > 70,
+                 (strength > 40) & bullish, (strength > 40) & bearish, strength > 40],
+                ['STRONG_UPTREND', 'STRONG_DOWNTREND', 'VOLATILE', 'UPTREND', 'DOWNTREND', 'SIDEWAYS'],
+                'CONSOLIDATION'
+            )
+
+            # Signal votes (same rules as get_trading_signals)
+            buy_count = ((rsi < 30).astype(int) + ((macd > macd_signal) & (macd > 0)) + bullish)
+            sell_count = ((rsi > 70).astype(int) + ((macd < macd_signal) & (macd < 0)) + bearish)
+            buy = (buy_count > sell_count) & (buy_count >= 2)
+            sell = (sell_count > buy_count) & (sell_count >= 2)
+
+            result['close'] = close
+            result['rsi'] = rsi
+            result['macd'] = macd
+            result['macd_signal'] = macd_signal
+            result['macd_histogram'] = macd - macd_signal
+            result['sma20'] = sma20
+            result['sma50'] = sma50
+            result['bb_upper'] = bb_upper
+            result['bb_lower'] = bb_lower
+            result['stoch_k'] = k_percent[:, -1]
+            result['stoch_d'] = k_percent.mean(axis=1)
+            result['atr'] = true_range.mean(axis=1)
+            result['momentum'] = momentum
+            result['volatility'] = volatility
+            result['trend'] = trend
+            result['bollinger_position'] = bb_position
+            result['volume_trend'] = volume_trend
+            result['signal_strength'] = strength
+            result['market_condition'] = market_condition
+            result['overall_signal'] = np.select([buy, sell], ['BUY', 'SELL'], 'NEUTRAL')
+            result['confidence'] = np.select(
+                [buy, sell],
+                [np.minimum(buy_count / 5.0 * 100, 95), np.minimum(sell_count / 5.0 * 100, 95)],
+                strength / 2
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error in batch analysis: {e}")
+
+        return result
+
+    def analyze_watchlist(self, rates_by_symbol: Dict[str, pd.DataFrame], bars: int = 200) -> np.ndarray:
+        """Batch-analyze a watchlist of per-symbol rate DataFrames for one timeframe"""
+        symbols, ohlcv = self.stack_rates(rates_by_symbol, bars)
+        return self.analyze_batch(ohlcv, symbols)
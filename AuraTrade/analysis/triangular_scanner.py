@@ -0,0 +1,197 @@
+"""
+Triangular Arbitrage Scanner for AuraTrade Bot
+Currency graph with precomputed 3- and 4-leg cycles
+"""
+
+import re
+import numpy as np
+from typing import Dict, List, Optional, Set, Tuple
+from utils.logger import Logger
+
+class TriangularArbitrageScanner:
+    """Cross-rate mispricing scanner over a currency graph
+
+    Every symbol ``BASEQUOTE`` is a pair of directed edges: selling the base
+    at the bid (weight ``log(bid)``) and buying it back at the ask (weight
+    ``-log(ask)``). All 3- and 4-leg currency cycles are enumerated once when
+    the graph is built; a cycle is profitable when its summed edge weights are
+    positive. On each tick only the cycles that use the changed symbol are
+    re-evaluated, so the per-tick cost does not grow with the universe size.
+    """
+
+    def __init__(self, min_profit: float = 0.0001, max_legs: int = 4):
+        self.logger = Logger().get_logger()
+
+        self.min_profit = min_profit  # minimum log return of a cycle
+        self.max_legs = max_legs
+
+        # Graph
+        self.symbols: List[str] = []
+        self.symbol_index: Dict[str, int] = {}
+        self.symbol_currencies: List[Tuple[str, str]] = []
+
+        # Edge weights: 2k = sell symbol k at bid, 2k + 1 = buy at ask,
+        # last slot is a zero-weight pad for cycles shorter than max_legs
+        self.edge_weights = np.zeros(1, dtype=np.float64)
+        self.last_quotes: Dict[str, Tuple[float, float]] = {}
+
+        # Cycles: (n_cycles, max_legs) edge indices and per-symbol cycle ids
+        self.cycle_edges = np.zeros((0, max_legs), dtype=np.int64)
+        self.cycle_lengths = np.zeros(0, dtype=np.int64)
+        self.symbol_cycles: Dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def parse_symbol(symbol: str) -> Optional[Tuple[str, str]]:
+        """Split a symbol like 'EURUSD' or 'EURUSD.m' into (base, quote)"""
+        letters = re.match(r'^([A-Z]{3})([A-Z]{3})', symbol.upper())
+        if not letters:
+            return None
+        base, quote = letters.group(1), letters.group(2)
+        if base == quote:
+            return None
+        return base, quote
+
+    def build(self, symbols: List[str]):
+        """Build the currency graph and precompute all cycles"""
+        try:
+            self.symbols = []
+            self.symbol_index = {}
+            self.symbol_currencies = []
+            self.last_quotes = {}
+
+            for symbol in symbols:
+                currencies = self.parse_symbol(symbol)
+                if currencies is None or symbol in self.symbol_index:
+                    continue
+                self.symbol_index[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+                self.symbol_currencies.append(currencies)
+
+            pad = 2 * len(self.symbols)
+            self.edge_weights = np.full(pad + 1, np.nan, dtype=np.float64)
+            self.edge_weights[pad] = 0.0
+
+            cycles = self._enumerate_cycles()
+
+            self.cycle_edges = np.full((len(cycles), self.max_legs), pad, dtype=np.int64)
+            self.cycle_lengths = np.zeros(len(cycles), dtype=np.int64)
+            members: Dict[str, List[int]] = {symbol: [] for symbol in self.symbols}
+
+            for cycle_id, edges in enumerate(cycles):
+                self.cycle_edges[cycle_id, :len(edges)] = edges
+                self.cycle_lengths[cycle_id] = len(edges)
+                for edge in edges:
+                    members[self.symbols[edge // 2]].append(cycle_id)
+
+            self.symbol_cycles = {
+                symbol: np.array(sorted(set(ids)), dtype=np.int64)
+                for symbol, ids in members.items()
+            }
+
+            self.logger.info(f"Currency graph built: {len(self.symbols)} symbols, "
+                             f"{len(cycles)} cycles up to {self.max_legs} legs")
+
+        except Exception as e:
+            self.logger.error(f"Error building currency graph: {e}")
+
+    def _enumerate_cycles(self) -> List[List[int]]:
+        """Enumerate simple directed currency cycles of 3..max_legs legs"""
+        # Adjacency: currency -> [(next_currency, edge_index)]
+        adjacency: Dict[str, List[Tuple[str, int]]] = {}
+        for k, (base, quote) in enumerate(self.symbol_currencies):
+            adjacency.setdefault(base, []).append((quote, 2 * k))
+            adjacency.setdefault(quote, []).append((base, 2 * k + 1))
+
+        currencies = sorted(adjacency)
+        order = {currency: i for i, currency in enumerate(currencies)}
+        cycles = []
+
+        def extend(start: str, current: str, visited: Set[str], path: List[int]):
+            for nxt, edge in adjacency.get(current, []):
+                if edge // 2 in {e // 2 for e in path}:
+                    continue
+                if nxt == start and len(path) + 1 >= 3:
+                    cycles.append(path + [edge])
+                elif (nxt not in visited and order[nxt] > order[start]
+                      and len(path) + 1 < self.max_legs):
+                    extend(start, nxt, visited | {nxt}, path + [edge])
+
+        # Each directed cycle is generated once, from its lowest currency
+        for start in currencies:
+            extend(start, start, {start}, [])
+
+        return cycles
+
+    def update(self, symbol: str, bid: float, ask: float) -> bool:
+        """Update edge weights for a symbol; returns True if the quote changed"""
+        k = self.symbol_index.get(symbol)
+        if k is None or bid <= 0 or ask <= 0:
+            return False
+
+        if self.last_quotes.get(symbol) == (bid, ask):
+            return False
+
+        self.last_quotes[symbol] = (bid, ask)
+        self.edge_weights[2 * k] = np.log(bid)
+        self.edge_weights[2 * k + 1] = -np.log(ask)
+        return True
+
+    def scan(self, changed_symbols: List[str]) -> List[Dict]:
+        """Evaluate only the cycles touching the changed symbols"""
+        results = []
+
+        try:
+            id_arrays = [self.symbol_cycles[s] for s in changed_symbols if s in self.symbol_cycles]
+            if not id_arrays:
+                return results
+
+            cycle_ids = np.unique(np.concatenate(id_arrays))
+            if cycle_ids.size == 0:
+                return results
+
+            edges = self.cycle_edges[cycle_ids]
+            weights = self.edge_weights[edges]
+            profits = weights.sum(axis=1)
+
+            # NaN profits (legs without quotes yet) compare False
+            hits = np.nonzero(profits > self.min_profit)[0]
+
+            changed = set(changed_symbols)
+            for h in hits:
+                cycle_edges = edges[h, :self.cycle_lengths[cycle_ids[h]]]
+                legs = [(self.symbols[e // 2], 'sell' if e % 2 == 0 else 'buy') for e in cycle_edges]
+
+                # Anchor the trade on a changed leg, priced against the synthetic
+                anchor = next((i for i, (s, _) in enumerate(legs) if s in changed), 0)
+                anchor_edge = int(cycle_edges[anchor])
+                rest = float(profits[h] - self.edge_weights[anchor_edge])
+                symbol, action = legs[anchor]
+                bid, ask = self.last_quotes[symbol]
+
+                if action == 'sell':
+                    entry_price, fair_price = bid, float(np.exp(-rest))
+                else:
+                    entry_price, fair_price = ask, float(np.exp(rest))
+
+                results.append({
+                    'symbol': symbol,
+                    'action': action,
+                    'legs': legs,
+                    'profit': float(profits[h]),
+                    'entry_price': entry_price,
+                    'fair_price': fair_price
+                })
+
+        except Exception as e:
+            self.logger.error(f"Error scanning arbitrage cycles: {e}")
+
+        return results
+
+    def get_status(self) -> Dict[str, int]:
+        """Get scanner status information"""
+        return {
+            'symbols': len(self.symbols),
+            'cycles': int(len(self.cycle_lengths)),
+            'triangles': int(np.count_nonzero(self.cycle_lengths == 3)),
+            'four_leg_cycles': int(np.count_nonzero(self.cycle_lengths == 4))
+        }
@@ -9,63 +9,77 @@ import os
 import threading
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, List, Any, Optional
 
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from utils.startup_timer import StartupTimer
+
+# Import/initialization timings for the startup report
+startup_timer = StartupTimer()
+
 # Core imports
 try:
-    from core.mt5_connector import MT5Connector
-    from core.order_manager import OrderManager
-    from core.risk_manager import RiskManager
-    from core.position_sizing import PositionSizing
-    from core.trading_engine import TradingEngine
-    from core.portfolio import Portfolio
+    with startup_timer.measure('core', 'import'):
+        from core.mt5_connector import MT5Connector
+        from core.order_manager import OrderManager
+        from core.risk_manager import RiskManager
+        from core.position_sizing import PositionSizing
+        from core.trading_engine import TradingEngine
+        from core.portfolio import Portfolio
 except ImportError as e:
     print(f"Error importing core modules: {e}")
     sys.exit(1)
 
-# Strategy imports
-try:
-    from strategies.scalping_strategy import ScalpingStrategy
-    from strategies.hft_strategy import HFTStrategy
-    from strategies.pattern_strategy import PatternStrategy
-    from strategies.swing_strategy import SwingStrategy
-    from strategies.arbitrage_strategy import ArbitrageStrategy
-except ImportError as e:
-    print(f"Error importing strategies: {e}")
-    print("Some strategies may not be available")
-
 # Analysis imports
 try:
-    from analysis.technical_analysis import TechnicalAnalysis
-    from analysis.pattern_recognition import PatternRecognition
+    with startup_timer.measure('analysis', 'import'):
+        from analysis.technical_analysis import TechnicalAnalysis
+        from analysis.pattern_recognition import PatternRecognition
 except ImportError as e:
     print(f"Error importing analysis modules: {e}")
     sys.exit(1)
 
 # Data and utilities
 try:
-    from data.data_manager import DataManager
-    from utils.logger import Logger, log_system, log_error
-    from utils.notifier import TelegramNotifier
-    from utils.ml_engine import MLEngine
-    from config.config import Config
-    from config.credentials import Credentials
-    from config.settings import Settings
+    with startup_timer.measure('data/config', 'import'):
+        from data.data_manager import DataManager
+        from utils.logger import Logger, configure_logging, log_system, log_error
+        from config.config import Config
+        from config.credentials import Credentials
+        from config.settings import Settings
 except ImportError as e:
     print(f"Error importing data/utility modules: {e}")
     sys.exit(1)
 
-# GUI imports (optional)
-try:
-    from gui.main_window import MainWindow
-    from PyQt5.QtWidgets import QApplication
-    GUI_AVAILABLE = True
-except ImportError as e:
-    print(f"GUI not available: {e}")
-    GUI_AVAILABLE = False
+# Optional components, imported only when enabled: name -> (module, class)
+STRATEGY_PLUGINS = {
+    'scalping': ('strategies.scalping_strategy', 'ScalpingStrategy'),
+    'hft': ('strategies.hft_strategy', 'HFTStrategy'),
+    'pattern': ('strategies.pattern_strategy', 'PatternStrategy'),
+    'swing': ('strategies.swing_strategy', 'SwingStrategy'),
+    'arbitrage': ('strategies.arbitrage_strategy', 'ArbitrageStrategy')
+}
+ML_ENGINE_PLUGIN = ('utils.ml_engine', 'MLEngine')
+NOTIFIER_PLUGIN = ('utils.notifier', 'TelegramNotifier')
+
+# GUI imports (optional, loaded only in GUI mode so headless runs never import Qt)
+MainWindow = None
+QApplication = None
+
+def load_gui() -> bool:
+    """Import the PyQt5 GUI on demand"""
+    global MainWindow, QApplication
+    if MainWindow is not None:
+        return True
+    try:
+        MainWindow = startup_timer.load('gui', 'gui.main_window', 'MainWindow')
+        QApplication = startup_timer.load('gui', 'PyQt5.QtWidgets', 'QApplication')
+        return True
+    except ImportError as e:
+        print(f"GUI not available: {e}")
+        return False
 
 class AuraTradeBot:
     """Main AuraTrade Bot class"""
@@ -76,13 +90,16 @@ class AuraTradeBot:
         
         # Initialize logger first
         self.logger = Logger().get_logger()
+        self.startup_timer = startup_timer
         self.logger.info("AuraTrade Bot starting up...")
         
         # Initialize configuration
         try:
-            self.config = Config()
-            self.credentials = Credentials()
-            self.settings = Settings()
+            with self.startup_timer.measure('config'):
+                self.config = Config()
+                self.credentials = Credentials()
+                self.settings = Settings()
+            configure_logging(self.config.LOGGING_CONFIG)
             self.logger.info("Configuration loaded successfully")
         except Exception as e:
             self.logger.error(f"Error loading configuration: {e}")
@@ -115,6 +132,7 @@ class AuraTradeBot:
         # GUI components
         self.gui_app = None
         self.main_window = None
+        self.status_server = None
         
         # Bot state
         self.running = False
@@ -128,52 +146,74 @@ class AuraTradeBot:
     def _initialize_components(self):
         """Initialize all bot components"""
         try:
+            timer = self.startup_timer
+            
             # Initialize MT5 connector
             self.logger.info("Initializing MT5 connector...")
-            self.mt5_connector = MT5Connector(self.credentials.get_mt5_credentials())
+            with timer.measure('mt5_connector'):
+                self.mt5_connector = MT5Connector(self.credentials.get_mt5_credentials())
             
             # Initialize order manager
             self.logger.info("Initializing order manager...")
-            self.order_manager = OrderManager(self.mt5_connector)</old_str>
-</old_str>
-<new_str>            # Initialize order manager
-            self.logger.info("Initializing order manager...")
-            self.order_manager = OrderManager(self.mt5_connector)
+            with timer.measure('order_manager'):
+                self.order_manager = OrderManager(self.mt5_connector)
             
             # Initialize risk manager
             self.logger.info("Initializing risk manager...")
-            self.risk_manager = RiskManager(self.mt5_connector)
+            with timer.measure('risk_manager'):
+                self.risk_manager = RiskManager(self.mt5_connector)
             
             # Initialize position sizing
             self.logger.info("Initializing position sizing...")
-            self.position_sizing = PositionSizing(self.mt5_connector)
+            with timer.measure('position_sizing'):
+                self.position_sizing = PositionSizing(self.mt5_connector)
             
             # Initialize portfolio
             self.logger.info("Initializing portfolio manager...")
-            self.portfolio = Portfolio(self.mt5_connector)
+            with timer.measure('portfolio'):
+                self.portfolio = Portfolio(self.mt5_connector)
             
             # Initialize data manager
             self.logger.info("Initializing data manager...")
-            self.data_manager = DataManager(self.mt5_connector)
+            with timer.measure('data_manager'):
+                self.data_manager = DataManager(self.mt5_connector)
+                self.data_manager.set_active_symbols(self._get_trading_symbols())
+                self.position_sizing.set_data_manager(self.data_manager)
             
             # Initialize analysis components
             self.logger.info("Initializing technical analysis...")
-            self.technical_analysis = TechnicalAnalysis()
+            with timer.measure('technical_analysis'):
+                self.technical_analysis = TechnicalAnalysis()
             
             self.logger.info("Initializing pattern recognition...")
-            self.pattern_recognition = PatternRecognition()
+            with timer.measure('pattern_recognition'):
+                self.pattern_recognition = PatternRecognition()
             
-            # Initialize ML engine
-            self.logger.info("Initializing ML engine...")
-            try:
-                self.ml_engine = MLEngine()
-            except Exception as e:
-                self.logger.warning(f"ML engine initialization failed: {e}")
-                self.ml_engine = None
+            # Initialize ML engine (sklearn) only when enabled
+            if self._is_enabled('strategies.ml_enabled', self.config.STRATEGY_CONFIG.get('ML_ENABLED', True)):
+                self.logger.info("Initializing ML engine...")
+                try:
+                    ml_engine_class = timer.load('ml_engine', *ML_ENGINE_PLUGIN)
+                    with timer.measure('ml_engine'):
+                        self.ml_engine = ml_engine_class()
+                except Exception as e:
+                    self.logger.warning(f"ML engine initialization failed: {e}")
+                    self.ml_engine = None
+            else:
+                timer.skip('ml_engine')
             
-            # Initialize notifier
-            self.logger.info("Initializing notifier...")
-            self.notifier = TelegramNotifier(self.credentials.get_telegram_credentials())
+            # Initialize notifier (requests) only when Telegram is enabled or configured
+            telegram_enabled = self._is_enabled(
+                'notifications.telegram_enabled',
+                self.config.NOTIFICATION_CONFIG.get('TELEGRAM_ENABLED', False)
+            )
+            if telegram_enabled or self.credentials.validate_telegram_credentials():
+                self.logger.info("Initializing notifier...")
+                notifier_class = timer.load('notifier', *NOTIFIER_PLUGIN)
+                with timer.measure('notifier'):
+                    self.notifier = notifier_class(self.credentials.get_telegram_credentials())
+            else:
+                timer.skip('notifier')
             
             # Link components
             self.order_manager.set_components(self.risk_manager, self.notifier)
@@ -181,44 +221,67 @@ class AuraTradeBot:
             # Initialize strategies
             self._initialize_strategies()
             
+            # Cross-pair arbitrage scans the traded symbols for currency triangles
+            if 'arbitrage' in self.strategies:
+                self.strategies['arbitrage'].set_symbol_universe(self.data_manager.get_active_symbols())
+            
             # Initialize trading engine
             self.logger.info("Initializing trading engine...")
-            self.trading_engine = TradingEngine(
-                mt5_connector=self.mt5_connector,
-                order_manager=self.order_manager,
-                risk_manager=self.risk_manager,
-                position_sizing=self.position_sizing,
-                data_manager=self.data_manager,
-                ml_engine=self.ml_engine,
-                notifier=self.notifier,
-                strategies=self.strategies,
-                technical_analysis=self.technical_analysis
+            with timer.measure('trading_engine'):
+                self.trading_engine = TradingEngine(
+                    mt5_connector=self.mt5_connector,
+                    order_manager=self.order_manager,
+                    risk_manager=self.risk_manager,
+                    position_sizing=self.position_sizing,
+                    data_manager=self.data_manager,
+                    ml_engine=self.ml_engine,
+                    notifier=self.notifier,
+                    strategies=self.strategies,
+                    technical_analysis=self.technical_analysis
+                )
+                self.trading_engine.set_symbols(self.data_manager.get_active_symbols())
+            
+            latency_config = self.config.LATENCY_CONFIG
+            self.trading_engine.set_latency_tracking(
+                latency_config.get('ENABLED', False),
+                dump_interval=latency_config.get('DUMP_INTERVAL', 60)
             )
             
             self.startup_complete = True
             self.logger.info("All components initialized successfully")
+            self.logger.info("Startup report:\n" + timer.format_report())
             
         except Exception as e:
             self.logger.error(f"Error initializing components: {e}")
             raise
     
+    def _get_trading_symbols(self) -> List[str]:
+        """Symbols to trade from Settings, falling back to Config"""
+        symbols = self.settings.get('symbols.enabled_symbols')
+        return list(symbols) if symbols else list(self.config.SYMBOLS_CONFIG['DEFAULT_SYMBOLS'])
+    
+    def _is_enabled(self, setting_key: str, config_default: bool) -> bool:
+        """Feature flag from Settings, falling back to Config"""
+        value = self.settings.get(setting_key)
+        return config_default if value is None else bool(value)
+    
     def _initialize_strategies(self):
         """Initialize trading strategies"""
         try:
             self.logger.info("Initializing trading strategies...")
-            
-            # Initialize available strategies
-            strategy_classes = {
-                'scalping': ScalpingStrategy,
-                'hft': HFTStrategy,
-                'pattern': PatternStrategy,
-                'swing': SwingStrategy,
-                'arbitrage': ArbitrageStrategy
-            }
-            
-            for name, strategy_class in strategy_classes.items():
+            timer = self.startup_timer
+            
+            # Import and initialize enabled strategies only
+            for name, (module, class_name) in STRATEGY_PLUGINS.items():
+                config_default = self.config.STRATEGY_CONFIG.get(f'{name.upper()}_ENABLED', True)
+                if not self._is_enabled(f'strategies.{name}_enabled', config_default):
+                    timer.skip(f'strategy:{name}')
+                    continue
+                
                 try:
-                    self.strategies[name] = strategy_class()
+                    strategy_class = timer.load(f'strategy:{name}', module, class_name)
+                    with timer.measure(f'strategy:{name}'):
+                        self.strategies[name] = strategy_class()
                     self.logger.info(f"Strategy '{name}' initialized successfully")
                 except Exception as e:
                     self.logger.error(f"Error initializing {name} strategy: {e}")
@@ -232,7 +295,7 @@ class AuraTradeBot:
             self.logger.error(f"Error initializing strategies: {e}")
             raise
     
-    def start(self, gui_mode: bool = True):
+    def start(self, gui_mode: bool = True, headless: bool = False, status_server: bool = False):
         """Start the trading bot"""
         try:
             if not self.startup_complete:
@@ -260,8 +323,14 @@ class AuraTradeBot:
                     f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
                 )
             
+            # Optional JSON status endpoint (always on when headless)
+            if status_server or headless or self.config.STATUS_SERVER_CONFIG.get('ENABLED', False):
+                self._start_status_server()
+            
             # Start GUI if available and requested
-            if gui_mode and GUI_AVAILABLE:
+            if headless:
+                self._start_headless_mode()
+            elif gui_mode and load_gui():
                 self._start_gui()
             else:
                 self._start_console_mode()
@@ -281,18 +350,21 @@ class AuraTradeBot:
             self.gui_app.setApplicationName("AuraTrade Bot")
             
             # Create main window
-            self.main_window = MainWindow(
-                mt5_connector=self.mt5_connector,
-                trading_engine=self.trading_engine,
-                order_manager=self.order_manager,
-                portfolio=self.portfolio,
-                strategies=self.strategies,
-                technical_analysis=self.technical_analysis,
-                data_manager=self.data_manager
-            )
-            
-            # Show main window
-            self.main_window.show()
+            with self.startup_timer.measure('gui'):
+                self.main_window = MainWindow(
+                    mt5_connector=self.mt5_connector,
+                    trading_engine=self.trading_engine,
+                    order_manager=self.order_manager,
+                    portfolio=self.portfolio,
+                    strategies=self.strategies,
+                    technical_analysis=self.technical_analysis,
+                    data_manager=self.data_manager,
+                    log_max_lines=self.config.GUI_CONFIG.get('LOG_MAX_LINES', 1000)
+                )
+                
+                # Show main window
+                self.main_window.show()
+            self.logger.info("Startup report (GUI):\n" + self.startup_timer.format_report())
             
             # Start trading engine in background thread
             self._start_trading_engine()
@@ -320,6 +392,45 @@ class AuraTradeBot:
             self.logger.error(f"Error in console mode: {e}")
             raise
     
+    def _start_status_server(self):
+        """Start the HTTP/WebSocket status server"""
+        try:
+            from utils.status_server import StatusServer
+            
+            server_config = self.config.STATUS_SERVER_CONFIG
+            self.status_server = StatusServer(
+                mt5_connector=self.mt5_connector,
+                trading_engine=self.trading_engine,
+                host=server_config.get('HOST', '127.0.0.1'),
+                port=server_config.get('PORT', 8765),
+                interval=server_config.get('PUSH_INTERVAL', 1.0)
+            )
+            if not self.status_server.start():
+                self.logger.warning("Status server could not be started")
+                self.status_server = None
+                
+        except Exception as e:
+            self.logger.error(f"Error starting status server: {e}")
+            self.status_server = None
+    
+    def _start_headless_mode(self):
+        """Start bot without GUI or console input (monitor via the status server)"""
+        try:
+            self.logger.info("Starting headless mode...")
+            
+            self._start_trading_engine()
+            
+            while self.running:
+                time.sleep(1)
+                
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            self.logger.error(f"Error in headless mode: {e}")
+            raise
+        finally:
+            self.stop()
+    
     def _start_trading_engine(self):
         """Start the trading engine in a separate thread"""
         try:
@@ -521,6 +632,14 @@ class AuraTradeBot:
             if self.trading_engine:
                 self.trading_engine.stop()
             
+            # Stop status server
+            if self.status_server:
+                self.status_server.stop()
+            
+            # Stop the watched-symbol tick feed
+            if self.data_manager:
+                self.data_manager.stop_tick_feed()
+            
             # Disconnect from MT5
             if self.mt5_connector:
                 self.mt5_connector.disconnect()
@@ -537,6 +656,10 @@ class AuraTradeBot:
                     f"🛑 AuraTrade Bot Stopped{final_stats}"
                 )
             
+            # Deliver queued notifications before exiting
+            if self.notifier:
+                self.notifier.stop()
+            
             log_system("AuraTrade Bot stopped successfully")
             print("\n✅ AuraTrade Bot stopped successfully")
             
@@ -552,13 +675,15 @@ def main():
         
         # Check for command line arguments
         gui_mode = True
+        headless = '--headless' in sys.argv
+        status_server = '--status-server' in sys.argv
         if len(sys.argv) > 1:
-            if '--console' in sys.argv or '--no-gui' in sys.argv:
+            if '--console' in sys.argv or '--no-gui' in sys.argv or headless:
                 gui_mode = False
         
         # Create and start bot
         bot = AuraTradeBot()
-        bot.start(gui_mode=gui_mode)
+        bot.start(gui_mode=gui_mode, headless=headless, status_server=status_server)
         
     except KeyboardInterrupt:
         print("\n🛑 Interrupted by user")
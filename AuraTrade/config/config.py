@@ -47,6 +47,9 @@ class Config:
             'SCALPING_ENABLED': True,
             'HFT_ENABLED': True,
             'PATTERN_ENABLED': True,
+            'SWING_ENABLED': True,
+            'ARBITRAGE_ENABLED': True,
+            'ML_ENABLED': True,
             'SCALPING_TP_PIPS': 8,
             'SCALPING_SL_PIPS': 12,
             'HFT_TP_PIPS': 3,
@@ -80,6 +83,20 @@ class Config:
             'LOG_MAX_LINES': 1000,
         }
 
+        # Headless status server (HTTP/WebSocket JSON)
+        self.STATUS_SERVER_CONFIG = {
+            'ENABLED': False,
+            'HOST': '127.0.0.1',
+            'PORT': 8765,
+            'PUSH_INTERVAL': 1.0,           # seconds between state polls
+        }
+
+        # Hot-path latency histograms (tick -> analyze -> risk -> send_order -> fill)
+        self.LATENCY_CONFIG = {
+            'ENABLED': False,
+            'DUMP_INTERVAL': 60,            # seconds between log dumps, 0 disables
+        }
+
         # Logging configuration
         self.LOGGING_CONFIG = {
             'LEVEL': 'INFO',
@@ -128,7 +145,7 @@ class Config:
             'EXOTIC_PAIRS': ['EURTRY', 'USDMXN', 'USDZAR'],
             'METALS': ['XAUUSD', 'XAGUSD'],
             'CRYPTO': ['BTCUSD', 'ETHUSD'],
-            'DEFAULT_SYMBOLS': ['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD'],
+            'DEFAULT_SYMBOLS': ['EURUSD', 'GBPUSD', 'USDJPY', 'EURGBP', 'EURJPY', 'GBPJPY', 'XAUUSD'],
             'AUTO_DETECT_SYMBOLS': True,
         }
 
@@ -158,6 +175,8 @@ class Config:
             'strategy': self.STRATEGY_CONFIG,
             'data': self.DATA_CONFIG,
             'gui': self.GUI_CONFIG,
+            'status_server': self.STATUS_SERVER_CONFIG,
+            'latency': self.LATENCY_CONFIG,
             'logging': self.LOGGING_CONFIG,
             'notification': self.NOTIFICATION_CONFIG,
             'paths': self.PATHS,
@@ -176,6 +195,8 @@ class Config:
             'strategy': self.STRATEGY_CONFIG,
             'data': self.DATA_CONFIG,
             'gui': self.GUI_CONFIG,
+            'status_server': self.STATUS_SERVER_CONFIG,
+            'latency': self.LATENCY_CONFIG,
             'logging': self.LOGGING_CONFIG,
             'notification': self.NOTIFICATION_CONFIG,
             'sessions': self.TRADING_SESSIONS,
@@ -264,6 +285,8 @@ class Config:
             'strategy': self.STRATEGY_CONFIG,
             'data': self.DATA_CONFIG,
             'gui': self.GUI_CONFIG,
+            'status_server': self.STATUS_SERVER_CONFIG,
+            'latency': self.LATENCY_CONFIG,
             'logging': self.LOGGING_CONFIG,
             'notification': self.NOTIFICATION_CONFIG,
             'sessions': self.TRADING_SESSIONS,
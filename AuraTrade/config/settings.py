@@ -54,7 +54,7 @@ class Settings:
                 }
             },
             'symbols': {
-                'enabled_symbols': ['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD'],
+                'enabled_symbols': ['EURUSD', 'GBPUSD', 'USDJPY', 'EURGBP', 'EURJPY', 'GBPJPY', 'XAUUSD'],
                 'auto_detect_symbols': True,
                 'major_pairs_only': True,
                 'include_metals': True,
@@ -234,7 +234,31 @@ class MT5Connector:
         except Exception as e:
             self.logger.error(f"Error getting ticks for {symbol}: {e}")
             return None
-    
+
+    def get_tick(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Get the latest tick"""
+        try:
+            if not self.check_connection():
+                return None
+
+            tick = mt5.symbol_info_tick(symbol)
+            if tick is None:
+                return None
+
+            return {
+                'symbol': symbol,
+                'time': tick.time,
+                'time_msc': tick.time_msc,
+                'bid': tick.bid,
+                'ask': tick.ask,
+                'last': tick.last,
+                'volume': tick.volume
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error getting tick for {symbol}: {e}")
+            return None
+
     def send_order(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Send trading order"""
         try:
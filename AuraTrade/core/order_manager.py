@@ -68,6 +68,9 @@ class OrderManager:
         self.risk_manager = None
         self.notifier = None
         
+        # Optional latency recorder (utils.latency.LatencyRecorder)
+        self.latency = None
+        
         # Order execution settings
         self.max_retries = 3
         self.retry_delay = 1.0  # seconds
@@ -86,6 +89,10 @@ class OrderManager:
         self.risk_manager = risk_manager
         self.notifier = notifier
     
+    def set_latency_recorder(self, recorder):
+        """Record risk-check and order-send latencies into ``recorder``"""
+        self.latency = recorder
+    
     def start_monitoring(self):
         """Start order monitoring thread"""
         if not self.monitoring_active:
@@ -156,8 +163,15 @@ class OrderManager:
                 return OrderResult(False, message="Invalid order parameters")
             
             # Check risk limits
-            if self.risk_manager and not self.risk_manager.check_trade_risk(symbol, volume):
-                return OrderResult(False, message="Risk limits exceeded")
+            if self.risk_manager:
+                timing = self.latency is not None and self.latency.enabled
+                if timing:
+                    risk_started = time.perf_counter_ns()
+                risk_ok = self.risk_manager.check_trade_risk(symbol, volume)
+                if timing:
+                    self.latency.record('risk', time.perf_counter_ns() - risk_started, symbol)
+                if not risk_ok:
+                    return OrderResult(False, message="Risk limits exceeded")
             
             # Get current prices
             symbol_info = self.mt5.get_symbol_info(symbol)
@@ -195,7 +209,8 @@ class OrderManager:
             
             # Log trade
             if result.success:
-                log_trade(symbol, order_type.name, volume, result.executed_price, sl, tp, "OPENED")
+                log_trade(order_type.name, symbol, volume, result.executed_price, sl=sl, tp=tp, status="OPENED",
+                          ticket=result.order_id)
                 
                 # Send notification
                 if self.notifier:
@@ -275,11 +290,25 @@ class OrderManager:
         """Execute order with retry mechanism"""
         last_error = ""
         
+        latency = self.latency if self.latency is not None and self.latency.enabled else None
+        symbol = request.get('symbol')
+        
         for attempt in range(self.max_retries):
             try:
+                if latency:
+                    send_started = time.perf_counter_ns()
+                    if attempt == 0:
+                        latency.record_since_origin('tick_to_send', send_started, symbol)
+                
                 result = self.mt5.send_order(request)
                 
+                if latency:
+                    send_done = time.perf_counter_ns()
+                    latency.record('send_order', send_done - send_started, symbol)
+                
                 if result and result.get('retcode') == mt5.TRADE_RETCODE_DONE:
+                    if latency:
+                        latency.record_since_origin('tick_to_fill', send_done, symbol)
                     return OrderResult(
                         success=True,
                         order_id=result.get('order'),
@@ -314,13 +343,15 @@ class OrderManager:
                 for pos in positions:
                     if pos['ticket'] == ticket:
                         log_trade(
-                            pos['symbol'], 
-                            "CLOSE", 
-                            pos['volume'], 
+                            "CLOSE",
+                            pos['symbol'],
+                            pos['volume'],
                             result_dict.get('price', 0),
-                            pos.get('sl', 0),
-                            pos.get('tp', 0),
-                            "CLOSED"
+                            sl=pos.get('sl', 0),
+                            tp=pos.get('tp', 0),
+                            status="CLOSED",
+                            ticket=ticket,
+                            profit=pos.get('profit', 0)
                         )
                         break
                 
@@ -23,6 +23,7 @@ class PositionSizing:
 
     def __init__(self, mt5_connector: MT5Connector):
         self.mt5 = mt5_connector
+        self.data_manager = None  # local bar source, falls back to the broker
         self.logger = Logger().get_logger()
 
         # Default settings
@@ -35,6 +36,10 @@ class PositionSizing:
 
         self.logger.info("PositionSizing initialized")
 
+    def set_data_manager(self, data_manager):
+        """Use the data manager's locally built bars for historical data"""
+        self.data_manager = data_manager
+
     def calculate_position_size(self, symbol: str, entry_price: float, 
                               stop_loss: float, method: SizingMethod = None,
                               risk_percent: float = None) -> float:
@@ -182,7 +187,8 @@ class PositionSizing:
         """Volatility-based position sizing"""
         try:
             # Get historical data
-            rates = self.mt5.get_rates(symbol, 'H1', self.volatility_period * 24)
+            source = self.data_manager or self.mt5
+            rates = source.get_rates(symbol, 'H1', self.volatility_period * 24)
             if rates is None or len(rates) < self.volatility_period:
                 return self._percent_risk_sizing(symbol, 0, 0, risk_percent)
 
@@ -0,0 +1,572 @@
+"""
+Trading Engine for AuraTrade Bot
+Event-driven strategy scheduling, signal execution and performance tracking
+"""
+
+import threading
+import time
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Any, Tuple, Union
+from datetime import datetime, date
+from dataclasses import dataclass
+from enum import Enum
+from core.order_manager import OrderType
+from utils.logger import Logger
+from utils.latency import LatencyRecorder
+
+class TriggerType(Enum):
+    TICK = "tick"
+    BAR_CLOSE = "bar_close"
+    ATR_MOVE = "atr_move"
+
+@dataclass
+class StrategyTrigger:
+    """When a strategy is re-evaluated for a symbol
+
+    ``timeframe`` is both the bar series handed to the strategy and, for
+    ``BAR_CLOSE``/``ATR_MOVE``, the series the trigger watches.
+    """
+    type: TriggerType = TriggerType.TICK
+    timeframe: str = 'M1'
+    atr_multiple: float = 0.5
+    atr_period: int = 14
+
+    @classmethod
+    def from_spec(cls, spec: Union['StrategyTrigger', Dict, str, None], timeframe: str = 'M1') -> 'StrategyTrigger':
+        """Build a trigger from a strategy declaration
+
+        Accepts a ``StrategyTrigger``, a trigger type name (``'tick'``,
+        ``'bar_close'``, ``'atr_move'``) or a dict such as
+        ``{'type': 'atr_move', 'timeframe': 'M1', 'atr_multiple': 0.3}``.
+        """
+        if isinstance(spec, cls):
+            return spec
+        if spec is None:
+            return cls(TriggerType.TICK, timeframe)
+        if isinstance(spec, str):
+            spec = {'type': spec}
+
+        return cls(
+            type=TriggerType(spec.get('type', TriggerType.TICK.value)),
+            timeframe=spec.get('timeframe', timeframe),
+            atr_multiple=float(spec.get('atr_multiple', 0.5)),
+            atr_period=int(spec.get('atr_period', 14))
+        )
+
+    def describe(self) -> str:
+        if self.type == TriggerType.TICK:
+            return 'every tick'
+        if self.type == TriggerType.BAR_CLOSE:
+            return f'{self.timeframe} bar close'
+        return f'{self.atr_multiple:g} x ATR({self.atr_period}) {self.timeframe} move'
+
+class TradingEngine:
+    """Main trading engine
+
+    Strategies are only evaluated when their inputs changed: each one
+    declares a trigger (``strategy.trigger``) - every new tick, the close
+    of a bar on its timeframe, or a price move larger than ``k`` x ATR
+    since its last evaluation. Bar closes come from the DataManager's
+    tick-built bars, so a poll cycle without a new tick or a closed bar
+    costs no strategy work at all.
+    """
+
+    # Used when a strategy does not declare a trigger itself
+    DEFAULT_TRIGGERS = {
+        'hft': {'type': 'tick', 'timeframe': 'M1'},
+        'arbitrage': {'type': 'tick', 'timeframe': 'M1'},
+        'scalping': {'type': 'atr_move', 'timeframe': 'M1', 'atr_multiple': 0.3},
+        'pattern': {'type': 'bar_close', 'timeframe': 'M5'},
+        'swing': {'type': 'bar_close', 'timeframe': 'H1'}
+    }
+
+    def __init__(self, mt5_connector, order_manager, risk_manager, position_sizing, data_manager,
+                 ml_engine=None, notifier=None, strategies: Dict[str, Any] = None, technical_analysis=None):
+        self.logger = Logger().get_logger()
+        self.mt5_connector = mt5_connector
+        self.order_manager = order_manager
+        self.risk_manager = risk_manager
+        self.position_sizing = position_sizing
+        self.data_manager = data_manager
+        self.ml_engine = ml_engine
+        self.notifier = notifier
+        self.strategies = strategies or {}
+        self.technical_analysis = technical_analysis
+
+        # Engine settings
+        active_symbols = getattr(data_manager, 'active_symbols', None)
+        self.symbols = list(active_symbols) if active_symbols else ['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD']
+        self.loop_interval = 0.1
+        self.history_bars = 100
+        self.min_confidence = 0.65
+        self.analysis_timeframe = 'M1'
+        self.stats_interval = 10.0
+
+        # None runs every strategy, otherwise only the named one trades
+        self.active_strategy: Optional[str] = None
+
+        # Trigger state
+        self.triggers: Dict[str, StrategyTrigger] = {}
+        self.pending_bars: set = set()          # (symbol, timeframe) closed since last cycle
+        self.last_tick_key: Dict[str, tuple] = {}
+        self.last_ticks: Dict[str, Dict] = {}
+        self.reference_prices: Dict[Tuple[str, str], float] = {}
+        self.atr_cache: Dict[Tuple[str, str, int], float] = {}
+        self.registered_timeframes: List[str] = []
+        self._lock = threading.Lock()
+
+        # Results and statistics
+        self.latest_analysis: Dict[str, Dict[str, Any]] = {}
+        self.strategy_stats: Dict[str, Dict[str, Any]] = {}
+        self.trades_today = 0
+        self.win_rate = 0.0
+        self.daily_pnl = 0.0
+        self.max_drawdown = 0.0
+        self.last_stats_update = 0.0
+        self.cycles = 0
+        self.started_at: Optional[datetime] = None
+
+        # Hot-path latency histograms (off unless enabled)
+        self.latency = LatencyRecorder(enabled=False)
+        self.latency_dump_interval = 60.0
+        self.last_latency_dump = 0.0
+        self.tick_received: Dict[str, int] = {}  # symbol -> perf_counter_ns of the newest tick
+        if hasattr(self.order_manager, 'set_latency_recorder'):
+            self.order_manager.set_latency_recorder(self.latency)
+
+        # Threading
+        self.running = False
+        self.engine_thread = None
+
+        for name, strategy in self.strategies.items():
+            self._init_strategy(name, strategy)
+
+        self.logger.info(f"Trading Engine initialized with {len(self.strategies)} strategies")
+
+    def _init_strategy(self, name: str, strategy: Any):
+        """Resolve the trigger of a strategy and reset its counters"""
+        spec = getattr(strategy, 'trigger', None) or self.DEFAULT_TRIGGERS.get(name)
+        timeframe = getattr(strategy, 'timeframe', 'M1')
+        self.triggers[name] = StrategyTrigger.from_spec(spec, timeframe)
+        self.strategy_stats[name] = {
+            'trigger': self.triggers[name].describe(),
+            'evaluations': 0,
+            'skipped': 0,
+            'signals': 0,
+            'trades': 0,
+            'eval_time_ms': 0.0,
+            'last_evaluation': None
+        }
+
+    def set_trigger(self, name: str, spec: Union[StrategyTrigger, Dict, str]):
+        """Override the trigger of a strategy"""
+        if name not in self.strategies:
+            self.logger.warning(f"Unknown strategy: {name}")
+            return
+        self.triggers[name] = StrategyTrigger.from_spec(spec, self.triggers[name].timeframe)
+        self.strategy_stats[name]['trigger'] = self.triggers[name].describe()
+        if self.running:
+            self._register_bar_callbacks()
+
+    def set_strategy(self, name: Optional[str]):
+        """Trade with one strategy only (None or 'all' enables every strategy)"""
+        if name in (None, 'all'):
+            self.active_strategy = None
+        elif name in self.strategies:
+            self.active_strategy = name
+        else:
+            self.logger.warning(f"Unknown strategy: {name}")
+            return
+        self.logger.info(f"Active strategy: {self.active_strategy or 'all'}")
+
+    def set_latency_tracking(self, enabled: bool, dump_interval: Optional[float] = None):
+        """Turn latency histograms on/off; ``dump_interval`` seconds between log dumps (0 disables)"""
+        if enabled and not self.latency.enabled:
+            self.latency.reset()
+            self.last_latency_dump = time.time()
+        self.latency.enabled = enabled
+        if dump_interval is not None:
+            self.latency_dump_interval = dump_interval
+
+    def set_symbols(self, symbols: List[str]):
+        """Set the symbols the engine trades"""
+        self.symbols = list(symbols)
+
+    def start(self):
+        """Start the engine loop"""
+        if self.running:
+            return
+
+        self.running = True
+        self.started_at = datetime.now()
+        self._register_bar_callbacks()
+        self.engine_thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.engine_thread.start()
+        self.logger.info("Trading engine started")
+
+    def stop(self):
+        """Stop the engine loop"""
+        self.running = False
+        if self.engine_thread and self.engine_thread.is_alive():
+            self.engine_thread.join(timeout=5)
+        self._unregister_bar_callbacks()
+        if self.latency.enabled:
+            self.logger.info("Latency report:\n" + self.latency.format_report())
+        self.logger.info("Trading engine stopped")
+
+    def _register_bar_callbacks(self):
+        """Subscribe to bar closes on every timeframe a trigger watches"""
+        if not hasattr(self.data_manager, 'register_bar_close_callback'):
+            return
+
+        timeframes = {self.analysis_timeframe}
+        timeframes.update(t.timeframe for t in self.triggers.values() if t.type != TriggerType.TICK)
+
+        self._unregister_bar_callbacks()
+        for timeframe in sorted(timeframes):
+            self.data_manager.register_bar_close_callback(self._on_bar_close, timeframe)
+        self.registered_timeframes = sorted(timeframes)
+
+    def _unregister_bar_callbacks(self):
+        if not hasattr(self.data_manager, 'unregister_bar_close_callback'):
+            return
+        for timeframe in self.registered_timeframes:
+            self.data_manager.unregister_bar_close_callback(self._on_bar_close, timeframe)
+        self.registered_timeframes = []
+
+    def _on_bar_close(self, symbol: str, timeframe: str, bar: Dict):
+        """Bar-close callback: mark the symbol/timeframe dirty"""
+        with self._lock:
+            self.pending_bars.add((symbol, timeframe))
+            # ATR moves one step per closed bar
+            for key in [k for k in self.atr_cache if k[0] == symbol and k[1] == timeframe]:
+                del self.atr_cache[key]
+
+    def _run_loop(self):
+        """Poll ticks and evaluate the strategies whose triggers fired"""
+        while self.running:
+            started = time.time()
+            try:
+                self.run_cycle()
+                if started - self.last_stats_update >= self.stats_interval:
+                    self._update_performance()
+                    self.last_stats_update = started
+                if (self.latency.enabled and self.latency_dump_interval
+                        and started - self.last_latency_dump >= self.latency_dump_interval):
+                    self.logger.info("Latency report:\n" + self.latency.format_report())
+                    self.last_latency_dump = started
+            except Exception as e:
+                self.logger.error(f"Error in trading engine loop: {e}")
+
+            time.sleep(max(0.0, self.loop_interval - (time.time() - started)))
+
+    def run_cycle(self):
+        """One scheduling pass over all symbols"""
+        self.cycles += 1
+        new_ticks: Dict[str, Dict] = {}
+
+        # Fetching the tick feeds the bar builder, which fires bar closes
+        timing = self.latency.enabled
+        for symbol in self.symbols:
+            tick = self.data_manager.get_current_tick(symbol)
+            if not tick:
+                continue
+            key = (tick.get('time_msc') or tick.get('time'), tick.get('bid'), tick.get('ask'))
+            if self.last_tick_key.get(symbol) != key:
+                self.last_tick_key[symbol] = key
+                self.last_ticks[symbol] = tick
+                new_ticks[symbol] = tick
+                if timing:
+                    self.tick_received[symbol] = time.perf_counter_ns()
+
+        with self._lock:
+            closed = self.pending_bars
+            self.pending_bars = set()
+
+        for symbol in self.symbols:
+            if (symbol, self.analysis_timeframe) in closed or symbol not in self.latest_analysis:
+                if symbol in self.last_ticks:
+                    self._update_analysis(symbol)
+
+        for name, strategy in self.strategies.items():
+            if self.active_strategy and name != self.active_strategy:
+                continue
+
+            trigger = self.triggers[name]
+            if not hasattr(strategy, 'analyze') and hasattr(strategy, 'analyze_market'):
+                # Market-wide strategies see all symbols at once
+                if new_ticks:
+                    self._evaluate_market(name, strategy)
+                else:
+                    self.strategy_stats[name]['skipped'] += 1
+                continue
+
+            for symbol in self.symbols:
+                tick = self.last_ticks.get(symbol)
+                if tick is None:
+                    continue
+                if self._should_evaluate(name, trigger, symbol, tick, symbol in new_ticks, closed):
+                    self._evaluate(name, strategy, trigger, symbol, tick)
+                else:
+                    self.strategy_stats[name]['skipped'] += 1
+
+    def _should_evaluate(self, name: str, trigger: StrategyTrigger, symbol: str, tick: Dict,
+                         new_tick: bool, closed: set) -> bool:
+        """Whether the inputs of a strategy changed for a symbol"""
+        if trigger.type == TriggerType.TICK:
+            return new_tick
+
+        if trigger.type == TriggerType.BAR_CLOSE:
+            return (symbol, trigger.timeframe) in closed
+
+        if not new_tick and (symbol, trigger.timeframe) not in closed:
+            return False
+
+        price = self._mid_price(tick)
+        reference = self.reference_prices.get((name, symbol))
+        if reference is None:
+            return True
+
+        atr = self._get_atr(symbol, trigger.timeframe, trigger.atr_period)
+        if not atr:
+            return (symbol, trigger.timeframe) in closed
+        return abs(price - reference) > trigger.atr_multiple * atr
+
+    @staticmethod
+    def _mid_price(tick: Dict) -> float:
+        return (tick.get('bid', 0) + tick.get('ask', 0)) / 2
+
+    def _get_atr(self, symbol: str, timeframe: str, period: int) -> Optional[float]:
+        """ATR of the closed bars, recomputed once per bar close"""
+        key = (symbol, timeframe, period)
+        atr = self.atr_cache.get(key)
+        if atr is not None:
+            return atr
+
+        rates = self.data_manager.get_rates(symbol, timeframe, period + 2)
+        if rates is None or len(rates) < period + 2:
+            return None
+
+        rates = rates.iloc[:-1]  # drop the forming bar
+        high = rates['high'].values
+        low = rates['low'].values
+        prev_close = rates['close'].values[:-1]
+        true_range = np.maximum(high[1:] - low[1:],
+                                np.maximum(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)))
+        atr = float(true_range[-period:].mean())
+        self.atr_cache[key] = atr
+        return atr
+
+    def _evaluate(self, name: str, strategy: Any, trigger: StrategyTrigger, symbol: str, tick: Dict):
+        """Run one strategy on one symbol and execute its signals"""
+        stats = self.strategy_stats[name]
+        timing = self.latency.enabled
+        if timing:
+            self._record_queue_latency(name, symbol)
+        started = time.perf_counter()
+        try:
+            rates = self.data_manager.get_rates(symbol, trigger.timeframe, self.history_bars)
+            if rates is None or len(rates) == 0:
+                return
+            result = strategy.analyze(symbol, rates, tick)
+        except Exception as e:
+            self.logger.error(f"Error evaluating {name} on {symbol}: {e}")
+            return
+        finally:
+            elapsed = time.perf_counter() - started
+            stats['evaluations'] += 1
+            stats['eval_time_ms'] += elapsed * 1000
+            stats['last_evaluation'] = datetime.now()
+            if timing:
+                self.latency.record('analyze', int(elapsed * 1e9), symbol, name)
+
+        self.reference_prices[(name, symbol)] = self._mid_price(tick)
+        for signal in self._normalize_signals(result):
+            signal.setdefault('symbol', symbol)
+            self._handle_signal(name, signal)
+
+    def _evaluate_market(self, name: str, strategy: Any):
+        """Run a market-wide strategy on the latest tick of every symbol"""
+        stats = self.strategy_stats[name]
+        timing = self.latency.enabled
+        if timing:
+            self._record_queue_latency(name, '*')
+        started = time.perf_counter()
+        try:
+            result = strategy.analyze_market(dict(self.last_ticks))
+        except Exception as e:
+            self.logger.error(f"Error evaluating {name}: {e}")
+            return
+        finally:
+            elapsed = time.perf_counter() - started
+            stats['evaluations'] += 1
+            stats['eval_time_ms'] += elapsed * 1000
+            stats['last_evaluation'] = datetime.now()
+            if timing:
+                self.latency.record('analyze', int(elapsed * 1e9), '*', name)
+
+        for signal in self._normalize_signals(result):
+            if signal.get('symbol'):
+                self._handle_signal(name, signal)
+
+    def _record_queue_latency(self, name: str, symbol: str):
+        """Time from tick receipt to the start of a strategy evaluation"""
+        now = time.perf_counter_ns()
+        if symbol == '*':
+            received = max(self.tick_received.values()) if self.tick_received else None
+        else:
+            received = self.tick_received.get(symbol)
+        if received is not None:
+            self.latency.record('queue', now - received, symbol, name)
+
+    @staticmethod
+    def _normalize_signals(result: Any) -> List[Dict]:
+        """Strategy output (signal, list of signals or {'signals': [...]}) as a list"""
+        if not result:
+            return []
+        if isinstance(result, list):
+            return [s for s in result if isinstance(s, dict)]
+        if isinstance(result, dict):
+            if 'signals' in result:
+                return [s for s in result['signals'] if isinstance(s, dict)]
+            return [result]
+        return []
+
+    def _handle_signal(self, name: str, signal: Dict):
+        """Filter a signal and send it to the order manager"""
+        action = str(signal.get('action', '')).lower()
+        if action not in ('buy', 'sell'):
+            return
+
+        symbol = signal['symbol']
+        self.strategy_stats[name]['signals'] += 1
+        signal.setdefault('strategy', name)
+        analysis = self.latest_analysis.get(symbol)
+        if analysis is not None:
+            analysis.setdefault('signals', []).append(signal)
+            del analysis['signals'][:-10]
+
+        if signal.get('confidence', 0) < self.min_confidence:
+            return
+
+        if self._execute_signal(name, signal):
+            self.strategy_stats[name]['trades'] += 1
+            self.trades_today += 1
+
+    def _pip_size(self, symbol: str) -> float:
+        info = self.mt5_connector.get_symbol_info(symbol)
+        if not info:
+            return 0.01 if 'JPY' in symbol else 0.0001
+        point = info.get('point', 0.00001)
+        return point * 10 if info.get('digits') in (3, 5) else point
+
+    def _execute_signal(self, name: str, signal: Dict) -> bool:
+        """Place the market order for a signal"""
+        try:
+            symbol = signal['symbol']
+            order_type = OrderType.BUY if signal['action'].lower() == 'buy' else OrderType.SELL
+            tick = self.last_ticks.get(symbol, {})
+            price = tick.get('ask', 0) if order_type == OrderType.BUY else tick.get('bid', 0)
+            direction = 1 if order_type == OrderType.BUY else -1
+
+            sl = signal.get('stop_loss')
+            tp = signal.get('take_profit')
+            sl_pips = signal.get('sl_pips', signal.get('stop_loss_pips'))
+            tp_pips = signal.get('tp_pips', signal.get('take_profit_pips'))
+            if (sl is None and sl_pips) or (tp is None and tp_pips):
+                pip = self._pip_size(symbol)
+                if sl is None and sl_pips:
+                    sl = price - direction * sl_pips * pip
+                if tp is None and tp_pips:
+                    tp = price + direction * tp_pips * pip
+
+            volume = signal.get('volume') or 0.01
+            if self.latency.enabled:
+                self.latency.start_trace(symbol, name, self.tick_received.get(symbol))
+            try:
+                result = self.order_manager.place_market_order(symbol, order_type, volume, sl=sl, tp=tp,
+                                                               comment=f"AuraTrade {name}")
+            finally:
+                self.latency.end_trace()
+            if result.success:
+                self.logger.info(f"{name} {order_type.name} {volume} {symbol} @ {result.executed_price}")
+            else:
+                self.logger.warning(f"{name} order rejected for {symbol}: {result.message}")
+            return result.success
+
+        except Exception as e:
+            self.logger.error(f"Error executing signal: {e}")
+            return False
+
+    def _update_analysis(self, symbol: str):
+        """Recompute the technical analysis of a symbol (once per bar)"""
+        if self.technical_analysis is None:
+            return
+        try:
+            rates = self.data_manager.get_rates(symbol, self.analysis_timeframe, self.history_bars)
+            if rates is None or len(rates) == 0:
+                return
+            analysis = self.technical_analysis.analyze_trends(rates)
+            indicators = {k: v for k, v in analysis.items() if isinstance(v, (int, float))}
+            tick = self.last_ticks.get(symbol, {})
+            previous = self.latest_analysis.get(symbol, {})
+            self.latest_analysis[symbol] = {
+                'timestamp': datetime.now(),
+                'indicators': indicators,
+                'trend': analysis.get('trend'),
+                'market_condition': analysis.get('market_condition'),
+                'signals': previous.get('signals', []),
+                'spread': (tick.get('ask', 0) - tick.get('bid', 0)) / self._pip_size(symbol) if tick else 0.0
+            }
+        except Exception as e:
+            self.logger.error(f"Error updating analysis for {symbol}: {e}")
+
+    def get_latest_analysis(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Latest analysis of a symbol (indicators, recent signals, spread)"""
+        return self.latest_analysis.get(symbol)
+
+    def _update_performance(self):
+        """Refresh daily trade statistics from the deal history"""
+        try:
+            today = date.today()
+            deals = [d for d in self.order_manager.get_order_history(days=1)
+                     if d['time'].date() == today and d['entry'] == 1]  # exits only
+            profits = [d['profit'] + d['swap'] + d['commission'] for d in deals]
+            self.daily_pnl = float(sum(profits))
+            self.win_rate = 100.0 * sum(1 for p in profits if p > 0) / len(profits) if profits else 0.0
+            if self.started_at and self.started_at.date() != today:
+                self.trades_today = 0
+                self.started_at = datetime.now()
+
+            if self.risk_manager is not None:
+                report = self.risk_manager.get_risk_report()
+                drawdown = report.get('metrics', {}).get('current_drawdown', 0.0)
+                self.max_drawdown = max(self.max_drawdown, drawdown)
+
+        except Exception as e:
+            self.logger.error(f"Error updating performance: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get engine status information"""
+        strategies = {}
+        for name, stats in self.strategy_stats.items():
+            evaluations = stats['evaluations']
+            strategies[name] = {
+                **stats,
+                'avg_eval_ms': stats['eval_time_ms'] / evaluations if evaluations else 0.0
+            }
+
+        return {
+            'running': self.running,
+            'active_strategy': self.active_strategy or 'all',
+            'trades_today': self.trades_today,
+            'win_rate': round(self.win_rate, 1),
+            'daily_pnl': round(self.daily_pnl, 2),
+            'max_drawdown': round(self.max_drawdown, 2),
+            'symbols': list(self.symbols),
+            'cycles': self.cycles,
+            'uptime': str(datetime.now() - self.started_at).split('.')[0] if self.started_at else None,
+            'strategies': strategies,
+            'latency': self.latency.summary() if self.latency.enabled else {}
+        }
@@ -1,9 +1,13 @@
-
 """
 Data management modules for AuraTrade Bot
 Real-time data feeds and historical data management
 """
 
-from .data_manager import DataManager
-
 __all__ = ['DataManager']
+
+def __getattr__(name):
+    # DataManager pulls in the MT5 connector; the bar modules do not need it
+    if name == 'DataManager':
+        from .data_manager import DataManager
+        return DataManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
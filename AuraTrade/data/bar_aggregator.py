@@ -0,0 +1,324 @@
+"""
+Multi-Timeframe Bar Aggregator for AuraTrade Bot
+Builds M5/M15/M30/H1/H4/D1 bars locally from the M1 stream
+"""
+
+import threading
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+# Bar length in minutes for every timeframe the aggregator can build
+TIMEFRAME_MINUTES = {
+    'M1': 1,
+    'M5': 5,
+    'M15': 15,
+    'M30': 30,
+    'H1': 60,
+    'H4': 240,
+    'D1': 1440
+}
+
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'tick_volume', 'spread', 'real_volume')
+
+def to_epoch_seconds(value) -> int:
+    """Bar/tick time (epoch seconds, datetime or Timestamp) as integer seconds"""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return int(value)
+    return int(pd.Timestamp(value).value // 1_000_000_000)
+
+class BarRing:
+    """Fixed-capacity ring of closed bars for one symbol/timeframe
+
+    Written twice (at ``i`` and ``i + capacity``) so the newest ``n`` bars
+    are always a contiguous slice.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.times = np.zeros(2 * capacity, dtype=np.int64)
+        self.values = np.zeros((2 * capacity, len(BAR_FIELDS)), dtype=np.float64)
+        self.head = 0
+        self.count = 0
+
+    def append(self, bar_time: int, values: np.ndarray):
+        i = self.head
+        j = i + self.capacity
+        self.times[i] = self.times[j] = bar_time
+        self.values[i] = self.values[j] = values
+        self.head = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def last_time(self) -> Optional[int]:
+        if self.count == 0:
+            return None
+        return int(self.times[self.head + self.capacity - 1])
+
+    def window(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        n = min(n, self.count)
+        end = self.head + self.capacity
+        return self.times[end - n:end], self.values[end - n:end]
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+class MultiTimeframeAggregator:
+    """Incremental higher-timeframe bars from closed and forming M1 bars
+
+    Every closed M1 bar is folded into the forming bar of each timeframe;
+    a forming bar is closed as soon as a bar from a later bucket arrives.
+    The still-forming M1 bar is kept aside and merged only when bars are
+    read, so repeated updates of the same minute are never double counted.
+
+    Buckets are aligned on the bar timestamps (broker server time) shifted
+    by ``session_offset_minutes``, so H4/D1 boundaries follow the trading
+    session and weekend gaps simply produce no bars. Buckets only partly
+    covered by the first M1 bars of a symbol are skipped; their history
+    comes from a one-off broker ``backfill`` instead.
+    """
+
+    def __init__(self, timeframes: Tuple[str, ...] = ('M1', 'M5', 'M15', 'M30', 'H1', 'H4', 'D1'),
+                 capacity: int = 2000, session_offset_minutes: int = 0):
+        self.timeframes = [tf for tf in timeframes if tf in TIMEFRAME_MINUTES]
+        if 'M1' not in self.timeframes:
+            self.timeframes.insert(0, 'M1')
+        self.capacity = capacity
+        self.session_offset = session_offset_minutes * 60
+
+        self.closed: Dict[Tuple[str, str], BarRing] = {}
+        self.forming: Dict[Tuple[str, str], Tuple[int, np.ndarray]] = {}
+        self.partial_m1: Dict[str, Tuple[int, np.ndarray]] = {}
+        self.last_m1_time: Dict[str, int] = {}
+        self.backfilled: Dict[Tuple[str, str], bool] = {}
+        self.incomplete: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.RLock()
+
+    def bucket_start(self, bar_time: int, timeframe: str) -> int:
+        """Start time (epoch seconds) of the bucket containing ``bar_time``"""
+        period = TIMEFRAME_MINUTES[timeframe] * 60
+        return (bar_time - self.session_offset) // period * period + self.session_offset
+
+    @staticmethod
+    def _merge(current: Optional[np.ndarray], bar: np.ndarray) -> np.ndarray:
+        """Fold one bar into an aggregate bar (open kept, volumes summed)"""
+        if current is None:
+            return bar.copy()
+        merged = current.copy()
+        merged[1] = max(current[1], bar[1])
+        merged[2] = min(current[2], bar[2])
+        merged[3] = bar[3]
+        merged[4] = current[4] + bar[4]
+        merged[5] = bar[5]
+        merged[6] = current[6] + bar[6]
+        return merged
+
+    def _ring(self, key: Tuple[str, str]) -> BarRing:
+        ring = self.closed.get(key)
+        if ring is None:
+            ring = self.closed[key] = BarRing(self.capacity)
+        return ring
+
+    def _roll(self, symbol: str, timeframe: str, bucket: int, events: List[Tuple[str, str, int, np.ndarray]]):
+        """Close the forming bar of a timeframe if ``bucket`` is later"""
+        key = (symbol, timeframe)
+        forming = self.forming.get(key)
+        if forming is not None and bucket > forming[0]:
+            ring = self._ring(key)
+            last = ring.last_time()
+            if last is None or forming[0] > last:
+                ring.append(forming[0], forming[1])
+                events.append((symbol, timeframe, forming[0], forming[1]))
+            del self.forming[key]
+
+    def update_bar(self, symbol: str, bar_time, open_: float, high: float, low: float, close: float,
+                   tick_volume: float = 0.0, spread: float = 0.0, real_volume: float = 0.0,
+                   closed: bool = True) -> List[Tuple[str, str, int, np.ndarray]]:
+        """Feed one M1 bar; returns (symbol, timeframe, bar_time, values) for bars that closed
+
+        Closed M1 bars at or before the last one fed are ignored. A forming
+        bar (``closed=False``) of a new minute replaces the previous forming
+        M1 bar; one of the same minute is merged into it (open kept, range
+        widened, volumes never reduced), so tick-built updates extend the
+        broker's forming bar instead of overwriting it.
+        """
+        bar_time = to_epoch_seconds(bar_time)
+        bar = np.array([open_, high, low, close, tick_volume, spread, real_volume], dtype=np.float64)
+        events: List[Tuple[str, str, int, np.ndarray]] = []
+
+        with self._lock:
+            last = self.last_m1_time.get(symbol)
+            if last is not None and bar_time <= last:
+                return events
+
+            for timeframe in self.timeframes:
+                self._roll(symbol, timeframe, self.bucket_start(bar_time, timeframe), events)
+
+            if not closed:
+                partial = self.partial_m1.get(symbol)
+                if partial is not None and partial[0] == bar_time:
+                    merged = partial[1].copy()
+                    merged[1] = max(merged[1], bar[1])
+                    merged[2] = min(merged[2], bar[2])
+                    merged[3] = bar[3]
+                    merged[4] = max(merged[4], bar[4])
+                    merged[5] = bar[5]
+                    merged[6] = max(merged[6], bar[6])
+                    bar = merged
+                self.partial_m1[symbol] = (bar_time, bar)
+                return events
+
+            self.last_m1_time[symbol] = bar_time
+            partial = self.partial_m1.get(symbol)
+            if partial is not None and partial[0] <= bar_time:
+                del self.partial_m1[symbol]
+
+            for timeframe in self.timeframes:
+                key = (symbol, timeframe)
+                bucket = self.bucket_start(bar_time, timeframe)
+                if last is None and bucket < bar_time:
+                    # First bar of the stream starts mid-bucket
+                    self.incomplete[key] = bucket
+                if self.incomplete.get(key) == bucket:
+                    continue
+                forming = self.forming.get(key)
+                self.forming[key] = (bucket, self._merge(forming[1] if forming else None, bar))
+
+            # An M1 bar is complete as soon as it is fed closed
+            self._roll(symbol, 'M1', bar_time + 60, events)
+
+        return events
+
+    def sync_m1(self, symbol: str, rates: pd.DataFrame,
+                closed_until: Optional[int] = None) -> List[Tuple[str, str, int, np.ndarray]]:
+        """Feed broker M1 rates; returns the bars that closed
+
+        The last row is treated as the forming bar unless its time is at or
+        before ``closed_until`` (a minute already known to be over).
+        """
+        events: List[Tuple[str, str, int, np.ndarray]] = []
+        if rates is None or len(rates) == 0:
+            return events
+
+        times = np.array([to_epoch_seconds(t) for t in rates.index])
+        columns = [rates[f].values if f in rates.columns else np.zeros(len(rates)) for f in BAR_FIELDS]
+        values = np.column_stack(columns).astype(np.float64)
+
+        last = self.last_m1_time.get(symbol)
+        start = 0 if last is None else int(np.searchsorted(times, last, side='right'))
+        for i in range(start, len(times)):
+            closed = i < len(times) - 1 or (closed_until is not None and times[i] <= closed_until)
+            events.extend(self.update_bar(symbol, times[i], *values[i], closed=closed))
+        return events
+
+    def backfill(self, symbol: str, timeframe: str, rates: pd.DataFrame):
+        """Seed closed bars of a timeframe from broker history
+
+        Only bars before the bucket currently being built from M1 data are
+        taken, so the forming bar is never counted twice.
+        """
+        if rates is None or len(rates) == 0 or timeframe not in self.timeframes:
+            return
+
+        with self._lock:
+            key = (symbol, timeframe)
+            forming = self.forming.get(key)
+            ring = self._ring(key)
+            limit = forming[0] if forming is not None else None
+            if limit is None and symbol in self.last_m1_time:
+                limit = self.bucket_start(self.last_m1_time[symbol], timeframe)
+
+            times = np.array([to_epoch_seconds(t) for t in rates.index])
+            columns = [rates[f].values if f in rates.columns else np.zeros(len(rates)) for f in BAR_FIELDS]
+            values = np.column_stack(columns).astype(np.float64)
+
+            # Broker history's last row is its own forming bar
+            mask = np.arange(len(times)) < len(times) - 1
+            if limit is not None:
+                mask &= times < limit
+
+            # Broker bars win over locally built ones for the same time
+            existing_times, existing_values = ring.window(ring.count)
+            merged = {int(t): v.copy() for t, v in zip(existing_times, existing_values)}
+            merged.update({int(t): v for t, v in zip(times[mask], values[mask])})
+
+            ring.clear()
+            for bar_time in sorted(merged)[-self.capacity:]:
+                ring.append(bar_time, merged[bar_time])
+            self.backfilled[key] = True
+
+    def bar_count(self, symbol: str, timeframe: str) -> int:
+        """Closed bars available plus the forming one"""
+        key = (symbol, timeframe)
+        ring = self.closed.get(key)
+        closed = ring.count if ring is not None else 0
+        return closed + (1 if key in self.forming or symbol in self.partial_m1 else 0)
+
+    def get_rates(self, symbol: str, timeframe: str, count: int = 100,
+                  include_forming: bool = True) -> Optional[pd.DataFrame]:
+        """Last ``count`` bars as an MT5-style rates DataFrame, or None if not enough history"""
+        if timeframe not in self.timeframes:
+            return None
+
+        with self._lock:
+            key = (symbol, timeframe)
+            ring = self.closed.get(key)
+            times = np.zeros(0, dtype=np.int64)
+            values = np.zeros((0, len(BAR_FIELDS)))
+            if ring is not None:
+                times, values = ring.window(count)
+
+            if include_forming:
+                forming = self.forming.get(key)
+                partial = self.partial_m1.get(symbol)
+                rows = []
+                if forming is not None:
+                    bar = forming[1]
+                    if partial is not None and self.bucket_start(partial[0], timeframe) == forming[0]:
+                        bar = self._merge(bar, partial[1])
+                    rows.append((forming[0], bar))
+                if partial is not None:
+                    bucket = self.bucket_start(partial[0], timeframe)
+                    if (forming is None or bucket > forming[0]) and self.incomplete.get(key) != bucket:
+                        rows.append((bucket, partial[1]))
+                if rows:
+                    times = np.concatenate([times, [t for t, _ in rows]])
+                    values = np.vstack([values] + [bar for _, bar in rows])
+
+            if len(times) < count:
+                return None
+
+            times, values = times[-count:], values[-count:]
+
+        df = pd.DataFrame(values, columns=BAR_FIELDS)
+        df['tick_volume'] = df['tick_volume'].astype(np.int64)
+        df['real_volume'] = df['real_volume'].astype(np.int64)
+        df.index = pd.to_datetime(times, unit='s')
+        df.index.name = 'time'
+        return df
+
+    def reset(self, symbol: Optional[str] = None):
+        """Drop bars for one symbol or for everything"""
+        with self._lock:
+            if symbol is None:
+                for store in (self.closed, self.forming, self.partial_m1, self.last_m1_time,
+                              self.backfilled, self.incomplete):
+                    store.clear()
+                return
+            for store in (self.closed, self.forming, self.backfilled, self.incomplete):
+                for key in [k for k in store if k[0] == symbol]:
+                    del store[key]
+            self.partial_m1.pop(symbol, None)
+            self.last_m1_time.pop(symbol, None)
+
+    def get_status(self) -> Dict[str, int]:
+        """Get aggregator status information"""
+        with self._lock:
+            return {
+                'symbols': len(self.last_m1_time),
+                'series': len(self.closed),
+                'closed_bars': sum(ring.count for ring in self.closed.values()),
+                'backfilled_series': sum(1 for v in self.backfilled.values() if v)
+            }
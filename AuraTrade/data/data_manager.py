@@ -12,6 +12,7 @@ import threading
 import time
 import queue
 from core.mt5_connector import MT5Connector
+from analysis.swing_points import swing_detector
 from utils.logger import Logger, log_info, log_error
 
 class DataManager:
@@ -277,7 +278,7 @@ class DataManager:
                     return cached_data['data']
             
             # Get fresh data from MT5
-            rates = self.mt5_connector.get_rates(symbol, timeframe, 0, count)
+            rates = self.mt5_connector.get_rates(symbol, timeframe, count)
             
             if rates is not None and len(rates) > 0:
                 # Cache the data
@@ -530,8 +531,10 @@ Real-time and historical data management
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 from utils.logger import Logger
+from data.bar_aggregator import MultiTimeframeAggregator, TIMEFRAME_MINUTES, BAR_FIELDS
+from data.tick_bars import TickBarBuilder, Bar
 
 class DataManager:
     """Data management for real-time and historical data"""
@@ -544,6 +547,9 @@ class DataManager:
         self.rates_cache = {}
         self.cache_duration = 60  # seconds
         
+        # Symbols the bot trades
+        self.active_symbols: List[str] = []
+        
         # Timeframes
         self.timeframes = {
             'M1': 1,
@@ -555,23 +561,105 @@ class DataManager:
             'D1': 16408
         }
         
+        # Local higher-timeframe bars built from M1; the broker is only
+        # asked for higher timeframes once, to backfill history
+        self.bar_aggregator = MultiTimeframeAggregator(tuple(TIMEFRAME_MINUTES))
+        self.m1_history_bars = 1500   # M1 bars fetched when a symbol is first synced
+        self.m1_sync_interval = 1.0   # seconds between incremental M1 syncs
+        self.m1_sync_times = {}
+        self.broker_rate_calls = 0
+        
+        # Live M1 candles built from ticks. They only move the forming bar;
+        # each closed minute is taken from the broker, and M1 is not polled
+        # while new ticks keep arriving
+        self.tick_bar_builder = TickBarBuilder('M1')
+        self.tick_bar_builder.register_callback(self._on_m1_bar_close)
+        self.tick_feed_timeout = 5.0  # seconds without a new tick before polling M1 again
+        self.last_tick_times = {}   # last new tick per symbol
+        self.last_poll_times = {}   # last terminal tick request per symbol
+        self.symbol_points = {}
+        self.bar_close_callbacks: Dict[str, List[Callable]] = {}
+        
+        # Tick listeners ('*' = every symbol) and the watched-symbol feed
+        self.tick_callbacks: Dict[str, List[Callable]] = {}
+        self.last_tick_keys: Dict[str, tuple] = {}
+        self.watched_symbols: List[str] = []
+        self.tick_feed_interval = 0.25  # seconds between polls of a watched symbol
+        self.tick_feed_running = False
+        self.tick_feed_thread = None
+        
         self.logger.info("Data Manager initialized")
     
     def get_rates(self, symbol: str, timeframe: str = 'M1', count: int = 100) -> Optional[pd.DataFrame]:
-        """Get historical rates with caching"""
+        """Get historical rates, built locally from M1 where possible"""
+        try:
+            if timeframe in self.bar_aggregator.timeframes:
+                self._sync_m1(symbol)
+                rates = self.bar_aggregator.get_rates(symbol, timeframe, count)
+                if rates is not None:
+                    return rates
+            
+            rates = self._fetch_rates(symbol, timeframe, count)
+            if rates is not None and timeframe in self.bar_aggregator.timeframes and timeframe != 'M1':
+                # One-off backfill; later bars come from the M1 stream
+                self.bar_aggregator.backfill(symbol, timeframe, rates)
+                local = self.bar_aggregator.get_rates(symbol, timeframe, count)
+                if local is not None:
+                    return local
+            
+            return rates
+            
+        except Exception as e:
+            self.logger.error(f"Error getting rates for {symbol}: {e}")
+            return None
+    
+    def get_active_symbols(self) -> List[str]:
+        """Get list of currently active symbols"""
+        return self.active_symbols.copy()
+    
+    def set_active_symbols(self, symbols: List[str]):
+        """Set active symbols for trading"""
+        self.active_symbols = list(dict.fromkeys(symbols))
+        self.logger.info(f"Active symbols: {', '.join(self.active_symbols)}")
+    
+    def _sync_m1(self, symbol: str):
+        """Feed new M1 bars from the broker into the bar aggregator"""
+        now = time.time()
+        last_sync = self.m1_sync_times.get(symbol)
+        if last_sync is not None and now - last_sync < self.m1_sync_interval:
+            return
+        if last_sync is not None and now - self.last_tick_times.get(symbol, 0) < self.tick_feed_timeout:
+            return  # the tick feed keeps M1 current
+        self.m1_sync_times[symbol] = now
+        
+        if last_sync is None or symbol not in self.bar_aggregator.last_m1_time:
+            count = self.m1_history_bars
+        else:
+            # Bars closed since the last sync (wall clock; bar times are
+            # broker server time), plus the forming bar
+            count = min(int((now - last_sync) // 60) + 3, self.m1_history_bars)
+        
+        rates = self._fetch_rates(symbol, 'M1', max(count, 2), use_cache=False)
+        if rates is not None:
+            events = self.bar_aggregator.sync_m1(symbol, rates)
+            if last_sync is not None:
+                # The first sync loads history; only later closes are live
+                self._dispatch_bar_events(events)
+    
+    def _fetch_rates(self, symbol: str, timeframe: str = 'M1', count: int = 100,
+                     use_cache: bool = True) -> Optional[pd.DataFrame]:
+        """Get historical rates from the broker with caching"""
         try:
             # Check cache
             cache_key = f"{symbol}_{timeframe}_{count}"
-            if cache_key in self.rates_cache:
+            if use_cache and cache_key in self.rates_cache:
                 cached_data, cached_time = self.rates_cache[cache_key]
                 if (datetime.now() - cached_time).seconds < self.cache_duration:
                     return cached_data
             
-            # Get timeframe value
-            tf_value = self.timeframes.get(timeframe, 1)
-            
-            # Get rates from MT5
-            rates = self.mt5_connector.get_rates(symbol, tf_value, 0, count)
+            # Get rates from MT5 (the connector maps the timeframe name)
+            rates = self.mt5_connector.get_rates(symbol, timeframe, count)
+            self.broker_rate_calls += 1
             
             if rates is not None and len(rates) > 0:
                 # Cache the data
@@ -587,11 +675,173 @@ class DataManager:
     def get_current_tick(self, symbol: str) -> Optional[Dict]:
         """Get current tick data"""
         try:
-            return self.mt5_connector.get_tick(symbol)
+            self.last_poll_times[symbol] = time.time()
+            tick = self.mt5_connector.get_tick(symbol)
+            if tick:
+                self.on_tick(symbol, tick)
+            return tick
         except Exception as e:
             self.logger.error(f"Error getting tick for {symbol}: {e}")
             return None
     
+    def on_tick(self, symbol: str, tick: Dict):
+        """Update the live candle of a symbol from one tick"""
+        try:
+            # Polling returns the same tick until the price moves; a frozen
+            # quote must not count as a live feed
+            key = (tick.get('time_msc') or tick.get('time'), tick.get('bid'), tick.get('ask'))
+            if self.last_tick_keys.get(symbol) == key:
+                return
+            self.last_tick_keys[symbol] = key
+            self.last_tick_times[symbol] = time.time()
+            self._dispatch_tick(symbol, tick)
+            
+            self.tick_bar_builder.on_tick(symbol, tick)
+            
+            bar = self.tick_bar_builder.get_forming_bar(symbol)
+            if bar is not None:
+                events = self.bar_aggregator.update_bar(
+                    symbol, bar.time, bar.open, bar.high, bar.low, bar.close,
+                    bar.tick_volume, self._spread_points(symbol, bar), closed=False
+                )
+                self._dispatch_bar_events(events)
+                
+        except Exception as e:
+            self.logger.error(f"Error processing tick for {symbol}: {e}")
+    
+    def _on_m1_bar_close(self, bar: Bar):
+        """Close an M1 bar with the broker's version of it
+        
+        Polled ticks miss extremes between polls and undercount tick volume,
+        so the closed minute (and any minutes skipped since the last close)
+        is fetched from the broker together with its new forming bar. The
+        tick-built bar is only used if the broker does not have that minute.
+        """
+        symbol = bar.symbol
+        last = self.bar_aggregator.last_m1_time.get(symbol)
+        count = 2 if last is None else int((bar.time - last) // 60) + 2
+        rates = self._fetch_rates(symbol, 'M1', min(max(count, 2), self.m1_history_bars), use_cache=False)
+        
+        events = []
+        if rates is not None:
+            events = self.bar_aggregator.sync_m1(symbol, rates, closed_until=bar.time)
+            self.m1_sync_times[symbol] = time.time()
+        
+        # No-op when the broker already supplied this minute
+        events += self.bar_aggregator.update_bar(
+            symbol, bar.time, bar.open, bar.high, bar.low, bar.close,
+            bar.tick_volume, self._spread_points(symbol, bar), closed=True
+        )
+        self._dispatch_bar_events(events)
+    
+    def _spread_points(self, symbol: str, bar: Bar) -> float:
+        """Average bar spread in points, as in broker rates"""
+        if symbol not in self.symbol_points:
+            info = self.mt5_connector.get_symbol_info(symbol) or {}
+            self.symbol_points[symbol] = info.get('point', 0.0)
+        point = self.symbol_points[symbol]
+        return round(bar.spread_avg / point) if point else 0.0
+    
+    def _dispatch_bar_events(self, events: List):
+        """Call bar-close callbacks for bars closed by the aggregator"""
+        for symbol, timeframe, bar_time, values in events:
+            callbacks = self.bar_close_callbacks.get(timeframe)
+            if not callbacks:
+                continue
+            bar = dict(zip(BAR_FIELDS, values.tolist()))
+            bar['time'] = pd.to_datetime(bar_time, unit='s')
+            for callback in list(callbacks):
+                try:
+                    callback(symbol, timeframe, bar)
+                except Exception as e:
+                    self.logger.error(f"Error in bar close callback for {symbol} {timeframe}: {e}")
+    
+    def register_bar_close_callback(self, callback: Callable, timeframe: str = 'M1'):
+        """Call ``callback(symbol, timeframe, bar)`` once each time a bar closes"""
+        callbacks = self.bar_close_callbacks.setdefault(timeframe, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+    
+    def unregister_bar_close_callback(self, callback: Callable, timeframe: str = 'M1'):
+        """Remove a bar-close callback"""
+        callbacks = self.bar_close_callbacks.get(timeframe, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+    
+    def _dispatch_tick(self, symbol: str, tick: Dict):
+        """Call tick callbacks for one new tick"""
+        callbacks = self.tick_callbacks.get(symbol, []) + self.tick_callbacks.get('*', [])
+        for callback in callbacks:
+            try:
+                callback(symbol, tick)
+            except Exception as e:
+                self.logger.error(f"Error in tick callback for {symbol}: {e}")
+    
+    def register_tick_callback(self, callback: Callable, symbol: str = '*'):
+        """Call ``callback(symbol, tick)`` for every new tick of a symbol ('*' for all)"""
+        callbacks = self.tick_callbacks.setdefault(symbol, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+    
+    def unregister_tick_callback(self, callback: Callable, symbol: str = '*'):
+        """Remove a tick callback"""
+        callbacks = self.tick_callbacks.get(symbol, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+    
+    def watch_symbols(self, symbols: List[str]):
+        """Keep ticks flowing for symbols nobody else polls (e.g. a market watch)
+        
+        The feed thread only asks the terminal for a watched symbol when no
+        other caller fetched its tick within ``tick_feed_interval``, so
+        symbols the trading engine already polls cost no extra calls.
+        """
+        self.watched_symbols = list(dict.fromkeys(self.watched_symbols + list(symbols)))
+        if not self.tick_feed_running:
+            self.tick_feed_running = True
+            self.tick_feed_thread = threading.Thread(target=self._tick_feed_loop, daemon=True)
+            self.tick_feed_thread.start()
+    
+    def unwatch_symbols(self, symbols: List[str]):
+        """Stop polling symbols for the tick feed"""
+        self.watched_symbols = [s for s in self.watched_symbols if s not in symbols]
+    
+    def stop_tick_feed(self):
+        """Stop the watched-symbol feed thread"""
+        self.tick_feed_running = False
+        if self.tick_feed_thread and self.tick_feed_thread.is_alive():
+            self.tick_feed_thread.join(timeout=5)
+    
+    def _tick_feed_loop(self):
+        while self.tick_feed_running:
+            try:
+                now = time.time()
+                for symbol in list(self.watched_symbols):
+                    if now - self.last_poll_times.get(symbol, 0.0) >= self.tick_feed_interval:
+                        self.get_current_tick(symbol)
+            except Exception as e:
+                self.logger.error(f"Error in tick feed: {e}")
+            time.sleep(self.tick_feed_interval / 2)
+    
+    def get_forming_bar(self, symbol: str, timeframe: Optional[str] = None) -> Optional[Dict]:
+        """The live candle of a symbol
+        
+        Without ``timeframe``: the tick-built M1 candle (OHLC, tick volume,
+        spread stats). With one: the latest locally built bar of that
+        timeframe in rates fields, with ``time`` as a Timestamp. Never calls
+        the terminal.
+        """
+        if timeframe is None:
+            bar = self.tick_bar_builder.get_forming_bar(symbol)
+            return bar.to_dict() if bar is not None else None
+        
+        rates = self.bar_aggregator.get_rates(symbol, timeframe, 1)
+        if rates is None:
+            return None
+        bar = rates.iloc[-1].to_dict()
+        bar['time'] = rates.index[-1]
+        return bar
+    
     def get_market_data(self, symbol: str) -> Dict[str, Any]:
         """Get comprehensive market data"""
         try:
@@ -660,28 +910,12 @@ class DataManager:
             if rates is None or len(rates) < period:
                 return {'support': [], 'resistance': []}
             
-            highs = rates['high'].values
-            lows = rates['low'].values
-            
-            # Simple support/resistance calculation
-            resistance_levels = []
-            support_levels = []
-            
-            # Find local maxima for resistance
-            for i in range(2, len(highs) - 2):
-                if highs[i] > highs[i-1] and highs[i] > highs[i-2] and \
-                   highs[i] > highs[i+1] and highs[i] > highs[i+2]:
-                    resistance_levels.append(highs[i])
-            
-            # Find local minima for support
-            for i in range(2, len(lows) - 2):
-                if lows[i] < lows[i-1] and lows[i] < lows[i-2] and \
-                   lows[i] < lows[i+1] and lows[i] < lows[i+2]:
-                    support_levels.append(lows[i])
+            # Local maxima for resistance, minima for support
+            points = swing_detector.swings(rates, order=2)
             
             # Sort and take most significant levels
-            resistance_levels = sorted(set(resistance_levels), reverse=True)[:3]
-            support_levels = sorted(set(support_levels))[:3]
+            resistance_levels = sorted(set(points.high_values.tolist()), reverse=True)[:3]
+            support_levels = sorted(set(points.low_values.tolist()))[:3]
             
             return {
                 'resistance': resistance_levels,
@@ -692,6 +926,20 @@ class DataManager:
             self.logger.error(f"Error calculating support/resistance: {e}")
             return {'support': [], 'resistance': []}
     
+    def get_support_resistance_zones(self, symbol: str, timeframe: str = 'M5', period: int = 200,
+                                     tolerance: float = 0.0005) -> Dict[str, List[Dict[str, float]]]:
+        """Support and resistance zones clustered from swing points"""
+        try:
+            rates = self.get_rates(symbol, timeframe, period)
+            if rates is None or len(rates) < 5:
+                return {'support': [], 'resistance': []}
+            
+            return swing_detector.zones(rates, order=2, tolerance=tolerance)
+            
+        except Exception as e:
+            self.logger.error(f"Error calculating support/resistance zones: {e}")
+            return {'support': [], 'resistance': []}
+    
     def is_market_open(self, symbol: str = 'EURUSD') -> bool:
         """Check if market is open"""
         try:
@@ -703,6 +951,9 @@ class DataManager:
     def clear_cache(self):
         """Clear data cache"""
         self.rates_cache.clear()
+        self.bar_aggregator.reset()
+        self.tick_bar_builder.reset()
+        self.m1_sync_times.clear()
         self.logger.info("Data cache cleared")
     
     def get_cache_info(self) -> Dict[str, Any]:
@@ -710,5 +961,7 @@ class DataManager:
         return {
             'cached_items': len(self.rates_cache),
             'cache_duration': self.cache_duration,
-            'cache_keys': list(self.rates_cache.keys())
+            'cache_keys': list(self.rates_cache.keys()),
+            'broker_rate_calls': self.broker_rate_calls,
+            'local_bars': self.bar_aggregator.get_status()
         }
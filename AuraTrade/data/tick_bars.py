@@ -0,0 +1,137 @@
+"""
+Tick-to-Bar Builder for AuraTrade Bot
+Streaming OHLCV bars with a live forming candle and bar-close events
+"""
+
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+
+from data.bar_aggregator import TIMEFRAME_MINUTES
+
+@dataclass
+class Bar:
+    """OHLC bar built from bid ticks, with tick volume and spread statistics"""
+    symbol: str
+    time: int            # bar open time, epoch seconds (broker server time)
+    open: float
+    high: float
+    low: float
+    close: float
+    tick_volume: int = 0
+    spread_min: float = 0.0
+    spread_max: float = 0.0
+    spread_sum: float = 0.0
+    closed: bool = False
+
+    @property
+    def spread_avg(self) -> float:
+        return self.spread_sum / self.tick_volume if self.tick_volume else 0.0
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data['spread_avg'] = self.spread_avg
+        return data
+
+class TickBarBuilder:
+    """Per-symbol tick-to-bar builder for one timeframe
+
+    Every tick updates the forming bar in O(1). The first tick of a later
+    bucket closes the forming bar (as the terminal does) and fires the
+    bar-close callbacks with the finished ``Bar``.
+    """
+
+    def __init__(self, timeframe: str = 'M1'):
+        self.timeframe = timeframe
+        self.period = TIMEFRAME_MINUTES[timeframe] * 60
+
+        self.forming: Dict[str, Bar] = {}
+        self.last_closed: Dict[str, Bar] = {}
+        self.last_tick_key: Dict[str, tuple] = {}
+        self.callbacks: List[Callable[[Bar], None]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def tick_time(tick: Dict) -> float:
+        """Tick timestamp in seconds (``time_msc`` preferred, then ``time``)"""
+        if tick.get('time_msc'):
+            return tick['time_msc'] / 1000.0
+        if tick.get('time'):
+            value = tick['time']
+            return value.timestamp() if hasattr(value, 'timestamp') else float(value)
+        return time.time()
+
+    def register_callback(self, callback: Callable[[Bar], None]):
+        """Call ``callback(bar)`` whenever a bar closes"""
+        if callback not in self.callbacks:
+            self.callbacks.append(callback)
+
+    def unregister_callback(self, callback: Callable[[Bar], None]):
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def on_tick(self, symbol: str, tick: Dict) -> Optional[Bar]:
+        """Update the forming bar; returns the bar that closed, if any"""
+        bid = tick.get('bid', 0)
+        ask = tick.get('ask', 0)
+        if not bid or bid <= 0:
+            return None
+
+        timestamp = self.tick_time(tick)
+        key = (timestamp, bid, ask)
+        spread = ask - bid if ask and ask > bid else 0.0
+        bucket = int(timestamp) // self.period * self.period
+        closed_bar = None
+
+        with self._lock:
+            # Polling can return the same tick more than once
+            if self.last_tick_key.get(symbol) == key:
+                return None
+            self.last_tick_key[symbol] = key
+
+            bar = self.forming.get(symbol)
+            if bar is not None and bucket < bar.time:
+                return None  # late tick from an already closed bar
+
+            if bar is not None and bucket > bar.time:
+                bar.closed = True
+                closed_bar = bar
+                self.last_closed[symbol] = bar
+                bar = None
+
+            if bar is None:
+                self.forming[symbol] = Bar(symbol, bucket, bid, bid, bid, bid, 1, spread, spread, spread)
+            else:
+                bar.high = max(bar.high, bid)
+                bar.low = min(bar.low, bid)
+                bar.close = bid
+                bar.tick_volume += 1
+                bar.spread_min = min(bar.spread_min, spread)
+                bar.spread_max = max(bar.spread_max, spread)
+                bar.spread_sum += spread
+
+        if closed_bar is not None:
+            for callback in list(self.callbacks):
+                callback(closed_bar)
+
+        return closed_bar
+
+    def get_forming_bar(self, symbol: str) -> Optional[Bar]:
+        """Copy of the bar currently forming for a symbol"""
+        with self._lock:
+            bar = self.forming.get(symbol)
+            return Bar(**asdict(bar)) if bar is not None else None
+
+    def get_last_closed_bar(self, symbol: str) -> Optional[Bar]:
+        """The most recently closed bar for a symbol"""
+        return self.last_closed.get(symbol)
+
+    def reset(self, symbol: Optional[str] = None):
+        """Drop forming bars for one symbol or for everything"""
+        with self._lock:
+            for store in (self.forming, self.last_closed, self.last_tick_key):
+                if symbol is None:
+                    store.clear()
+                else:
+                    store.pop(symbol, None)
@@ -9,7 +9,8 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from matplotlib.collections import PolyCollection, LineCollection
 
 # Handle PyQt5 import gracefully
 try:
@@ -29,24 +30,78 @@ except ImportError:
 
 from utils.logger import Logger
 
+UP_COLOR = 'lime'
+DOWN_COLOR = 'red'
+WICK_COLOR = 'white'
+
+def bar_polygons(x: np.ndarray, bottoms: np.ndarray, tops: np.ndarray, width: float = 0.6) -> np.ndarray:
+    """Rectangles centred on ``x`` as an (n, 4, 2) vertex array"""
+    left = x - width / 2
+    right = x + width / 2
+    return np.stack([
+        np.column_stack([left, bottoms]),
+        np.column_stack([left, tops]),
+        np.column_stack([right, tops]),
+        np.column_stack([right, bottoms])
+    ], axis=1)
+
+def candle_geometry(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                    start: int = 0, width: float = 0.6) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Body polygons, wick segments and up/down mask for a run of candles"""
+    opens, highs, lows, closes = (np.asarray(a, dtype=np.float64) for a in (opens, highs, lows, closes))
+    x = np.arange(start, start + len(opens), dtype=np.float64)
+    bodies = bar_polygons(x, np.minimum(opens, closes), np.maximum(opens, closes), width)
+    wicks = np.stack([np.column_stack([x, lows]), np.column_stack([x, highs])], axis=1)
+    return bodies, wicks, closes >= opens
+
+def candle_colors(up: np.ndarray) -> np.ndarray:
+    return np.where(up, UP_COLOR, DOWN_COLOR)
+
 class ChartWidget(QWidget if PYQT_AVAILABLE else object):
-    """Advanced chart widget for price data and indicators"""
-    
+    """Advanced chart widget for price data and indicators
+
+    Closed candles are drawn as one body ``PolyCollection`` and one wick
+    ``LineCollection``. The forming candle (and its volume bar) are separate
+    animated artists: while only the last bar changes, ``update_data`` and
+    ``update_forming_bar`` move just that geometry and blit it over the
+    cached background instead of redrawing the figure.
+
+    With a ``data_manager`` the chart loads its bars from it and listens to
+    its tick callbacks. Ticks only set a flag; a GUI timer then moves the
+    forming candle from the locally built bar (no terminal calls), and
+    reloads the bars once a new one has opened.
+    """
+
     # Signals for PyQt5
     if PYQT_AVAILABLE:
         symbol_changed = pyqtSignal(str)
         timeframe_changed = pyqtSignal(str)
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, data_manager=None, bars: int = 100, tick_ms: int = 250):
         if PYQT_AVAILABLE:
             super().__init__(parent)
         
         self.logger = Logger().get_logger()
+        self.data_manager = data_manager
         self.current_symbol = 'EURUSD'
         self.current_timeframe = 'M5'
+        self.chart_bars = bars
+        self.tick_ms = tick_ms
+        self.tick_pending = False
         self.data = None
         self.indicators = {}
-        
+
+        # Candle artists and blitting state
+        self.candle_bodies = None
+        self.candle_wicks = None
+        self.volume_bars = None
+        self.forming_body = None
+        self.forming_wick = None
+        self.forming_volume = None
+        self.background = None
+        self.full_redraws = 0
+        self.blit_updates = 0
+
         if PYQT_AVAILABLE:
             self.setup_ui()
             self.setup_chart()
@@ -54,6 +109,10 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
         else:
             self.setup_matplotlib_only()
         
+        if self.data_manager is not None and hasattr(self.data_manager, 'register_tick_callback'):
+            self.data_manager.register_tick_callback(self.on_tick)
+            self.load_data()
+        
         self.logger.info("Chart widget initialized")
     
     def setup_ui(self):
@@ -70,7 +129,12 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
             # Symbol selector
             self.symbol_label = QLabel("Symbol:")
             self.symbol_combo = QComboBox()
-            self.symbol_combo.addItems(['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD', 'BTCUSD'])
+            symbols = []
+            if self.data_manager is not None and hasattr(self.data_manager, 'get_active_symbols'):
+                symbols = self.data_manager.get_active_symbols()
+                if symbols and self.current_symbol not in symbols:
+                    self.current_symbol = symbols[0]
+            self.symbol_combo.addItems(symbols or ['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD', 'BTCUSD'])
             self.symbol_combo.setCurrentText(self.current_symbol)
             self.symbol_combo.currentTextChanged.connect(self.on_symbol_changed)
             
@@ -123,6 +187,7 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
                 ax.spines['left'].set_color('white')
             
             self.figure.tight_layout()
+            self.figure.canvas.mpl_connect('draw_event', self._on_draw)
             
         except Exception as e:
             self.logger.error(f"Error setting up chart: {e}")
@@ -133,6 +198,7 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
             plt.style.use('dark_background')
             self.figure, (self.ax_price, self.ax_volume, self.ax_indicators) = plt.subplots(3, 1, figsize=(12, 8))
             self.figure.patch.set_facecolor('#1e1e1e')
+            self.figure.canvas.mpl_connect('draw_event', self._on_draw)
             
         except Exception as e:
             self.logger.error(f"Error setting up matplotlib-only mode: {e}")
@@ -147,6 +213,11 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
             self.timer.timeout.connect(self.auto_refresh)
             self.timer.start(5000)  # Refresh every 5 seconds
             
+            # Forming candle follows ticks, coalesced to one update per interval
+            self.tick_timer = QTimer(self)
+            self.tick_timer.timeout.connect(self.update_from_ticks)
+            self.tick_timer.start(self.tick_ms)
+            
         except Exception as e:
             self.logger.error(f"Error setting up timer: {e}")
     
@@ -173,14 +244,137 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
             self.logger.error(f"Error changing timeframe: {e}")
     
     def update_data(self, data: pd.DataFrame, indicators: Dict = None):
-        """Update chart with new data"""
+        """Update chart with new data (only the forming candle if nothing else changed)"""
         try:
+            if self._only_forming_bar_changed(data):
+                # Indicators follow on the next full redraw, at the bar close
+                self.data = data
+                last = data.iloc[-1]
+                volume = last['tick_volume'] if 'tick_volume' in data.columns else None
+                self.update_forming_bar(last['open'], last['high'], last['low'], last['close'], volume)
+                return
+
             self.data = data
             self.indicators = indicators or {}
             self.plot_chart()
-            
+
         except Exception as e:
             self.logger.error(f"Error updating data: {e}")
+
+    def _only_forming_bar_changed(self, data: pd.DataFrame) -> bool:
+        """True if ``data`` covers the same bars as the chart, so only the last one can differ"""
+        if self.data is None or data is None or self.forming_body is None:
+            return False
+        if len(data) != len(self.data) or len(data) < 2:
+            return False
+        return data.index[0] == self.data.index[0] and data.index[-1] == self.data.index[-1]
+
+    def _can_blit(self) -> bool:
+        return hasattr(self, 'figure') and getattr(self.figure.canvas, 'supports_blit', False)
+
+    def _forming_artists(self) -> List:
+        return [a for a in (self.forming_body, self.forming_wick, self.forming_volume) if a is not None]
+
+    def _on_draw(self, event):
+        """Cache the static background after a full draw, then overlay the forming candle"""
+        if not self._can_blit():
+            return
+        self.background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self._forming_artists():
+            artist.axes.draw_artist(artist)
+
+    def update_forming_bar(self, open_: float, high: float, low: float, close: float, volume: float = None):
+        """Move the forming candle to new OHLC values without redrawing the figure"""
+        try:
+            if self.forming_body is None:
+                return
+
+            x = len(self.data) - 1 if self.data is not None else 0
+            bodies, wicks, up = candle_geometry([open_], [high], [low], [close], start=x)
+            self.forming_body.set_verts(bodies)
+            self.forming_body.set_facecolor(candle_colors(up))
+            self.forming_wick.set_segments(wicks)
+            if self.forming_volume is not None and volume is not None:
+                self.forming_volume.set_verts(bar_polygons(np.array([x], dtype=np.float64),
+                                                           np.zeros(1), np.array([volume], dtype=np.float64)))
+                self.forming_volume.set_facecolor(candle_colors(up))
+
+            # A candle leaving the visible range needs rescaled axes
+            bottom, top = self.ax_price.get_ylim()
+            volume_top = self.ax_volume.get_ylim()[1]
+            if low < bottom or high > top or (volume is not None and volume > volume_top):
+                self.plot_chart()
+                return
+
+            self._blit()
+
+        except Exception as e:
+            self.logger.error(f"Error updating forming bar: {e}")
+
+    def on_tick(self, symbol: str, tick: Dict):
+        """Tick callback (any thread): mark the forming candle stale"""
+        if symbol == self.current_symbol:
+            self.tick_pending = True
+
+    def update_from_ticks(self):
+        """Move the forming candle to the latest local bar (called by the tick timer)"""
+        try:
+            if not self.tick_pending or self.data_manager is None or self.data is None or len(self.data) == 0:
+                return
+            self.tick_pending = False
+
+            bar = self.data_manager.get_forming_bar(self.current_symbol, self.current_timeframe)
+            if bar is None:
+                return
+
+            last_time = self.data.index[-1]
+            if bar['time'] > last_time:
+                # A new bar opened: reload so the closed one is drawn in full
+                self.load_data()
+            elif bar['time'] == last_time:
+                columns = [c for c in ('open', 'high', 'low', 'close', 'tick_volume') if c in self.data.columns]
+                self.data.loc[last_time, columns] = [bar[c] for c in columns]
+                volume = bar.get('tick_volume') if 'tick_volume' in self.data.columns else None
+                self.update_forming_bar(bar['open'], bar['high'], bar['low'], bar['close'], volume)
+
+        except Exception as e:
+            self.logger.error(f"Error updating chart from ticks: {e}")
+
+    def load_data(self):
+        """Load the current symbol/timeframe bars from the data manager"""
+        if self.data_manager is None or not hasattr(self, 'ax_price'):
+            return
+        rates = self.data_manager.get_rates(self.current_symbol, self.current_timeframe, self.chart_bars)
+        if rates is not None:
+            self.tick_pending = False
+            self.update_data(rates.copy(), self.indicators)
+
+    def stop(self):
+        """Stop timers and tick callbacks"""
+        if PYQT_AVAILABLE:
+            for timer in (getattr(self, 'timer', None), getattr(self, 'tick_timer', None)):
+                if timer is not None:
+                    timer.stop()
+        if self.data_manager is not None and hasattr(self.data_manager, 'unregister_tick_callback'):
+            self.data_manager.unregister_tick_callback(self.on_tick)
+
+    def closeEvent(self, event):
+        """Stop receiving ticks"""
+        self.stop()
+        super().closeEvent(event)
+
+    def _blit(self):
+        """Redraw only the forming candle over the cached background"""
+        canvas = self.figure.canvas
+        if not self._can_blit() or self.background is None:
+            canvas.draw_idle()
+            return
+
+        canvas.restore_region(self.background)
+        for artist in self._forming_artists():
+            artist.axes.draw_artist(artist)
+        canvas.blit(self.figure.bbox)
+        self.blit_updates += 1
     
     def plot_chart(self):
         """Plot the main chart"""
@@ -189,6 +383,8 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
         
         try:
             # Clear previous plots
+            self.background = None
+            self.forming_body = self.forming_wick = self.forming_volume = None
             self.ax_price.clear()
             self.ax_volume.clear()
             self.ax_indicators.clear()
@@ -221,7 +417,8 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
             # Adjust layout
             self.figure.tight_layout()
             
-            # Refresh canvas
+            # Refresh canvas (the draw event re-captures the blit background)
+            self.full_redraws += 1
             if PYQT_AVAILABLE and hasattr(self, 'canvas'):
                 self.canvas.draw()
             else:
@@ -236,30 +433,29 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
             if 'open' not in self.data.columns:
                 return
             
-            # Prepare data
-            dates = range(len(self.data))
-            opens = self.data['open'].values
-            highs = self.data['high'].values
-            lows = self.data['low'].values
-            closes = self.data['close'].values
-            
-            # Plot candlesticks
-            for i in range(len(self.data)):
-                color = 'lime' if closes[i] >= opens[i] else 'red'
-                
-                # Candle body
-                body_height = abs(closes[i] - opens[i])
-                body_bottom = min(opens[i], closes[i])
-                
-                self.ax_price.bar(dates[i], body_height, bottom=body_bottom, 
-                                width=0.6, color=color, alpha=0.8)
-                
-                # Wicks
-                self.ax_price.plot([dates[i], dates[i]], [lows[i], highs[i]], 
-                                color='white', linewidth=1)
-            
-            # Set x-axis limits
+            bodies, wicks, up = candle_geometry(self.data['open'].values, self.data['high'].values,
+                                                self.data['low'].values, self.data['close'].values)
+            animated = self._can_blit()
+            
+            # Closed candles: one collection for bodies, one for wicks
+            self.candle_bodies = PolyCollection(bodies[:-1], facecolors=candle_colors(up[:-1]),
+                                                edgecolors='none', alpha=0.8)
+            self.candle_wicks = LineCollection(wicks[:-1], colors=WICK_COLOR, linewidths=1)
+            self.ax_price.add_collection(self.candle_wicks)
+            self.ax_price.add_collection(self.candle_bodies)
+            
+            # Forming candle, redrawn on its own by blitting
+            self.forming_wick = LineCollection(wicks[-1:], colors=WICK_COLOR, linewidths=1, animated=animated)
+            self.forming_body = PolyCollection(bodies[-1:], facecolors=candle_colors(up[-1:]),
+                                               edgecolors='none', alpha=0.8, animated=animated)
+            self.ax_price.add_collection(self.forming_wick)
+            self.ax_price.add_collection(self.forming_body)
+            
+            # Set axis limits
             self.ax_price.set_xlim(-1, len(self.data))
+            low, high = self.data['low'].min(), self.data['high'].max()
+            margin = (high - low) * 0.05 or abs(high) * 0.001 or 1.0
+            self.ax_price.set_ylim(low - margin, high + margin)
             
         except Exception as e:
             self.logger.error(f"Error plotting candlesticks: {e}")
@@ -301,11 +497,17 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
             if len(volumes) == 0:
                 return
             
-            dates = range(len(self.data))
-            colors = ['lime' if self.data['close'].iloc[i] >= self.data['open'].iloc[i] else 'red' 
-                     for i in range(len(self.data))]
+            volumes = np.asarray(volumes, dtype=np.float64)
+            x = np.arange(len(volumes), dtype=np.float64)
+            bars = bar_polygons(x, np.zeros(len(volumes)), volumes)
+            colors = candle_colors(self.data['close'].values >= self.data['open'].values)
             
-            self.ax_volume.bar(dates, volumes, color=colors, alpha=0.6)
+            self.volume_bars = PolyCollection(bars[:-1], facecolors=colors[:-1], edgecolors='none', alpha=0.6)
+            self.forming_volume = PolyCollection(bars[-1:], facecolors=colors[-1:], edgecolors='none',
+                                                 alpha=0.6, animated=self._can_blit())
+            self.ax_volume.add_collection(self.volume_bars)
+            self.ax_volume.add_collection(self.forming_volume)
+            self.ax_volume.set_ylim(0, volumes.max() * 1.2 or 1.0)
             
         except Exception as e:
             self.logger.error(f"Error plotting volume: {e}")
@@ -356,9 +558,11 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
     def refresh_chart(self):
         """Refresh chart data"""
         try:
-            # This method should be called by the main application
-            # to update chart with new data
-            if hasattr(self, 'data') and self.data is not None:
+            if self.data_manager is not None:
+                self.data = None  # symbol/timeframe may have changed
+                self.load_data()
+            # Otherwise the main application feeds update_data
+            elif hasattr(self, 'data') and self.data is not None:
                 self.plot_chart()
                 
         except Exception as e:
@@ -367,8 +571,10 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
     def auto_refresh(self):
         """Auto refresh chart (called by timer)"""
         try:
+            if self.data_manager is not None:
+                self.load_data()
             # Request new data from parent
-            if hasattr(self.parent(), 'request_chart_data'):
+            elif hasattr(self.parent(), 'request_chart_data'):
                 self.parent().request_chart_data(self.current_symbol, self.current_timeframe)
                 
         except Exception as e:
@@ -390,7 +596,15 @@ class ChartWidget(QWidget if PYQT_AVAILABLE else object):
         """Export chart to file"""
         try:
             if hasattr(self, 'figure'):
-                self.figure.savefig(filename, facecolor='#1e1e1e', dpi=300, bbox_inches='tight')
+                # Animated artists are skipped by a normal draw
+                forming = self._forming_artists()
+                for artist in forming:
+                    artist.set_animated(False)
+                try:
+                    self.figure.savefig(filename, facecolor='#1e1e1e', dpi=300, bbox_inches='tight')
+                finally:
+                    for artist in forming:
+                        artist.set_animated(self._can_blit())
                 self.logger.info(f"Chart exported to {filename}")
                 
         except Exception as e:
@@ -412,19 +626,11 @@ def create_standalone_chart(data: pd.DataFrame, symbol: str = "EURUSD", indicato
         
         # Plot candlesticks
         dates = range(len(data))
-        for i in range(len(data)):
-            color = 'lime' if data['close'].iloc[i] >= data['open'].iloc[i] else 'red'
-            
-            # Candle body
-            body_height = abs(data['close'].iloc[i] - data['open'].iloc[i])
-            body_bottom = min(data['open'].iloc[i], data['close'].iloc[i])
-            
-            ax1.bar(dates[i], body_height, bottom=body_bottom, 
-                   width=0.6, color=color, alpha=0.8)
-            
-            # Wicks
-            ax1.plot([dates[i], dates[i]], [data['low'].iloc[i], data['high'].iloc[i]], 
-                    color='white', linewidth=1)
+        bodies, wicks, up = candle_geometry(data['open'].values, data['high'].values,
+                                            data['low'].values, data['close'].values)
+        ax1.add_collection(LineCollection(wicks, colors=WICK_COLOR, linewidths=1))
+        ax1.add_collection(PolyCollection(bodies, facecolors=candle_colors(up), edgecolors='none', alpha=0.8))
+        ax1.autoscale_view()
         
         # Moving averages
         if len(data) >= 20:
@@ -446,9 +652,7 @@ def create_standalone_chart(data: pd.DataFrame, symbol: str = "EURUSD", indicato
         else:
             volumes = np.random.randint(100, 1000, len(data))
         
-        colors = ['lime' if data['close'].iloc[i] >= data['open'].iloc[i] else 'red' 
-                 for i in range(len(data))]
-        ax2.bar(dates, volumes, color=colors, alpha=0.6)
+        ax2.bar(dates, volumes, color=candle_colors(up), alpha=0.6)
         ax2.set_ylabel('Volume', color='white')
         ax2.grid(True, alpha=0.3)
         
@@ -5,31 +5,45 @@ Real-time trading dashboard with comprehensive controls
 """
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-                            QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+                            QLabel, QPushButton, QTableWidget, QTableWidgetItem, QTableView,
                             QProgressBar, QGroupBox, QFrame, QTextEdit, QLCDNumber)
 from PyQt5.QtCore import QTimer, pyqtSignal, Qt
 from PyQt5.QtGui import QFont, QColor, QPalette
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+from gui.state_publisher import StatePublisher, StateSnapshot
+from gui.positions_model import PositionsTableModel
+from gui.market_watch import MarketWatchWidget
 from utils.logger import Logger
 
 class TradingDashboard(QWidget):
     """Real-time trading dashboard"""
     
-    def __init__(self, trading_engine=None, order_manager=None, risk_manager=None):
+    def __init__(self, trading_engine=None, order_manager=None, risk_manager=None,
+                 state_publisher: Optional[StatePublisher] = None, data_manager=None):
         super().__init__()
         self.logger = Logger().get_logger()
         self.trading_engine = trading_engine
         self.order_manager = order_manager
         self.risk_manager = risk_manager
+        self.data_manager = data_manager
         
         # Dashboard data
         self.account_data = {}
         self.positions_data = []
         self.performance_data = {}
+        self.snapshot = StateSnapshot(timestamp=datetime.now())
+        
+        # Share the main window's publisher when given one
+        self.state_publisher = state_publisher
+        self.owns_publisher = False
+        if self.state_publisher is None and hasattr(trading_engine, 'mt5_connector'):
+            self.state_publisher = StatePublisher(trading_engine.mt5_connector, trading_engine,
+                                                  data_manager=data_manager)
+            self.owns_publisher = True
         
         self._setup_ui()
-        self._setup_timers()
+        self._setup_publisher()
         
         self.logger.info("Trading Dashboard initialized")
     
@@ -129,17 +143,21 @@ class TradingDashboard(QWidget):
         group = QGroupBox("Active Positions")
         layout = QVBoxLayout()
         
-        # Positions table
-        self.positions_table = QTableWidget()
-        self.positions_table.setColumnCount(8)
-        self.positions_table.setHorizontalHeaderLabels([
-            "Ticket", "Symbol", "Type", "Volume", "Price", "Current", "P&L", "Action"
+        # Positions table (ticket-keyed model, updated by diff)
+        self.positions_model = PositionsTableModel([
+            ("Ticket", 'ticket'), ("Symbol", 'symbol'), ("Type", 'type'), ("Volume", 'volume'),
+            ("Price", 'price_open'), ("Current", 'price_current'), ("P&L", 'profit'), ("Action", 'action')
         ])
+        self.positions_table = QTableView()
+        self.positions_table.setModel(self.positions_model)
+        
+        # Clicking the Action cell closes that position
+        self.positions_table.clicked.connect(self._on_position_clicked)
         
         # Style table
         self.positions_table.setAlternatingRowColors(True)
         self.positions_table.verticalHeader().setVisible(False)
-        self.positions_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.positions_table.setSelectionBehavior(QTableView.SelectRows)
         
         layout.addWidget(self.positions_table)
         group.setLayout(layout)
@@ -150,80 +168,66 @@ class TradingDashboard(QWidget):
         group = QGroupBox("Market Overview")
         layout = QGridLayout()
         
-        # Symbol prices
-        self.symbol_labels = {}
-        self.price_labels = {}
-        
-        symbols = ['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD']
-        for i, symbol in enumerate(symbols):
-            row = i // 2
-            col = (i % 2) * 2
-            
-            self.symbol_labels[symbol] = QLabel(symbol)
-            self.price_labels[symbol] = QLabel("-.----")
-            
-            self.symbol_labels[symbol].setFont(QFont("Arial", 10, QFont.Bold))
-            self.price_labels[symbol].setFont(QFont("Arial", 10))
-            
-            layout.addWidget(self.symbol_labels[symbol], row, col)
-            layout.addWidget(self.price_labels[symbol], row, col + 1)
+        # Quotes pushed by DataManager tick callbacks, else by state snapshots
+        symbols = self.data_manager.get_active_symbols() if self.data_manager else ['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD']
+        self.market_watch = MarketWatchWidget(self.data_manager, symbols)
+        layout.addWidget(self.market_watch, 0, 0)
         
         group.setLayout(layout)
         return group
     
-    def _setup_timers(self):
-        """Setup update timers"""
-        # Account update timer
-        self.account_timer = QTimer()
-        self.account_timer.timeout.connect(self.update_account_info)
-        self.account_timer.start(1000)  # 1 second
-        
-        # Positions update timer
-        self.positions_timer = QTimer()
-        self.positions_timer.timeout.connect(self.update_positions)
-        self.positions_timer.start(2000)  # 2 seconds
-        
-        # Performance update timer
-        self.performance_timer = QTimer()
-        self.performance_timer.timeout.connect(self.update_performance)
-        self.performance_timer.start(5000)  # 5 seconds
-        
-        # Market data timer
-        self.market_timer = QTimer()
-        self.market_timer.timeout.connect(self.update_market_data)
-        self.market_timer.start(500)  # 0.5 seconds
+    def _setup_publisher(self):
+        """Render state snapshots collected off the GUI thread"""
+        if self.state_publisher is None:
+            return
+        
+        if self.data_manager is None:
+            self.state_publisher.add_symbols(self.market_watch.model.symbols)
+        self.state_publisher.snapshot_ready.connect(self.on_snapshot)
+        if self.owns_publisher:
+            self.state_publisher.start()
+    
+    def on_snapshot(self, snapshot: StateSnapshot):
+        """Update every section from one snapshot"""
+        self.snapshot = snapshot
+        self.update_account_info()
+        self.update_positions()
+        self.update_performance()
+        self.update_market_data()
+    
+    def closeEvent(self, event):
+        """Stop the publisher this dashboard started"""
+        self.market_watch.stop()
+        if self.owns_publisher:
+            self.state_publisher.stop()
+        super().closeEvent(event)
     
     def update_account_info(self):
         """Update account information"""
         try:
-            if not self.trading_engine:
-                return
+            account_info = self.snapshot.account
             
-            # Get account info from trading engine
-            if hasattr(self.trading_engine, 'mt5_connector'):
-                account_info = self.trading_engine.mt5_connector.get_account_info()
+            if account_info:
+                balance = account_info.get('balance', 0)
+                equity = account_info.get('equity', 0)
+                margin = account_info.get('margin', 0)
+                free_margin = account_info.get('margin_free', 0)
+                margin_level = account_info.get('margin_level', 0)
                 
-                if account_info:
-                    balance = account_info.get('balance', 0)
-                    equity = account_info.get('equity', 0)
-                    margin = account_info.get('margin', 0)
-                    free_margin = account_info.get('margin_free', 0)
-                    margin_level = account_info.get('margin_level', 0)
-                    
-                    # Update labels
-                    self.balance_label.setText(f"${balance:.2f}")
-                    self.equity_label.setText(f"${equity:.2f}")
-                    self.margin_label.setText(f"${margin:.2f}")
-                    self.free_margin_label.setText(f"${free_margin:.2f}")
-                    self.margin_level_label.setText(f"{margin_level:.1f}%")
-                    
-                    # Color coding for margin level
-                    if margin_level < 200:
-                        self.margin_level_label.setStyleSheet("color: red; font-weight: bold;")
-                    elif margin_level < 500:
-                        self.margin_level_label.setStyleSheet("color: orange; font-weight: bold;")
-                    else:
-                        self.margin_level_label.setStyleSheet("color: green; font-weight: bold;")
+                # Update labels
+                self.balance_label.setText(f"${balance:.2f}")
+                self.equity_label.setText(f"${equity:.2f}")
+                self.margin_label.setText(f"${margin:.2f}")
+                self.free_margin_label.setText(f"${free_margin:.2f}")
+                self.margin_level_label.setText(f"{margin_level:.1f}%")
+                
+                # Color coding for margin level
+                if margin_level < 200:
+                    self.margin_level_label.setStyleSheet("color: red; font-weight: bold;")
+                elif margin_level < 500:
+                    self.margin_level_label.setStyleSheet("color: orange; font-weight: bold;")
+                else:
+                    self.margin_level_label.setStyleSheet("color: green; font-weight: bold;")
         
         except Exception as e:
             self.logger.error(f"Error updating account info: {e}")
@@ -231,55 +235,17 @@ class TradingDashboard(QWidget):
     def update_positions(self):
         """Update positions table"""
         try:
-            if not self.trading_engine or not hasattr(self.trading_engine, 'mt5_connector'):
-                return
-            
-            positions = self.trading_engine.mt5_connector.get_positions()
-            
-            # Update table
-            self.positions_table.setRowCount(len(positions))
-            
-            for row, position in enumerate(positions):
-                # Create table items
-                items = [
-                    QTableWidgetItem(str(position.get('ticket', ''))),
-                    QTableWidgetItem(position.get('symbol', '')),
-                    QTableWidgetItem('Buy' if position.get('type', 0) == 0 else 'Sell'),
-                    QTableWidgetItem(f"{position.get('volume', 0):.2f}"),
-                    QTableWidgetItem(f"{position.get('price_open', 0):.5f}"),
-                    QTableWidgetItem(f"{position.get('price_current', 0):.5f}"),
-                    QTableWidgetItem(f"{position.get('profit', 0):.2f}"),
-                ]
-                
-                # Add items to table
-                for col, item in enumerate(items):
-                    if col == 6:  # P&L column
-                        profit = position.get('profit', 0)
-                        if profit > 0:
-                            item.setForeground(QColor('green'))
-                        elif profit < 0:
-                            item.setForeground(QColor('red'))
-                    
-                    self.positions_table.setItem(row, col, item)
-                
-                # Add close button
-                close_btn = QPushButton("Close")
-                close_btn.clicked.connect(
-                    lambda checked, ticket=position.get('ticket'): self.close_position(ticket)
-                )
-                self.positions_table.setCellWidget(row, 7, close_btn)
-        
+            self.positions_model.update_positions(self.snapshot.positions)
         except Exception as e:
             self.logger.error(f"Error updating positions: {e}")
     
     def update_performance(self):
         """Update performance metrics"""
         try:
-            if not self.trading_engine:
+            status = self.snapshot.engine_status
+            if not status:
                 return
             
-            status = self.trading_engine.get_status()
-            
             # Update LCDs
             self.trades_today_lcd.display(status.get('trades_today', 0))
             self.win_rate_lcd.display(status.get('win_rate', 0))
@@ -307,19 +273,23 @@ class TradingDashboard(QWidget):
     def update_market_data(self):
         """Update market data prices"""
         try:
-            if not self.trading_engine or not hasattr(self.trading_engine, 'mt5_connector'):
+            # With a DataManager the market watch receives ticks directly
+            if self.data_manager is not None:
                 return
             
-            for symbol in self.price_labels.keys():
-                tick = self.trading_engine.mt5_connector.get_tick(symbol)
-                if tick:
-                    bid = tick.get('bid', 0)
-                    ask = tick.get('ask', 0)
-                    self.price_labels[symbol].setText(f"{bid:.5f}/{ask:.5f}")
+            for symbol, tick in self.snapshot.ticks.items():
+                self.market_watch.on_tick(symbol, tick)
         
         except Exception as e:
             self.logger.error(f"Error updating market data: {e}")
     
+    def _on_position_clicked(self, index):
+        """Close the position whose Action cell was clicked"""
+        if index.column() == self.positions_model.column_of('action'):
+            ticket = self.positions_model.ticket_at(index.row())
+            if ticket is not None:
+                self.close_position(ticket)
+    
     def close_position(self, ticket: int):
         """Close specific position"""
         try:
@@ -327,61 +297,10 @@ class TradingDashboard(QWidget):
                 result = self.trading_engine.mt5_connector.close_position(ticket)
                 if result.get('retcode') == 10009:
                     self.logger.info(f"Position #{ticket} closed successfully")
+                    if self.state_publisher is not None:
+                        self.state_publisher.request_refresh()
                 else:
                     self.logger.error(f"Failed to close position #{ticket}: {result.get('comment')}")
         
         except Exception as e:
             self.logger.error(f"Error closing position {ticket}: {e}")
-"""
-Trading Dashboard for AuraTrade Bot
-Real-time trading dashboard with charts and metrics
-"""
-
-from PyQt5.QtWidgets import *
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
-import pandas as pd
-from typing import Dict, Any
-
-class TradingDashboard(QWidget):
-    """Real-time trading dashboard"""
-    
-    def __init__(self):
-        super().__init__()
-        self.init_ui()
-    
-    def init_ui(self):
-        """Initialize dashboard UI"""
-        layout = QVBoxLayout(self)
-        
-        # Dashboard content
-        self.metrics_widget = self.create_metrics_widget()
-        layout.addWidget(self.metrics_widget)
-    
-    def create_metrics_widget(self) -> QWidget:
-        """Create metrics display widget"""
-        widget = QGroupBox("Trading Metrics")
-        layout = QGridLayout(widget)
-        
-        # Placeholder metrics
-        self.balance_label = QLabel("Balance: $0.00")
-        self.profit_label = QLabel("P&L: $0.00")
-        self.trades_label = QLabel("Trades: 0")
-        self.win_rate_label = QLabel("Win Rate: 0%")
-        
-        layout.addWidget(self.balance_label, 0, 0)
-        layout.addWidget(self.profit_label, 0, 1)
-        layout.addWidget(self.trades_label, 1, 0)
-        layout.addWidget(self.win_rate_label, 1, 1)
-        
-        return widget
-    
-    def update_metrics(self, metrics: Dict[str, Any]):
-        """Update dashboard metrics"""
-        try:
-            self.balance_label.setText(f"Balance: ${metrics.get('balance', 0):.2f}")
-            self.profit_label.setText(f"P&L: ${metrics.get('profit', 0):.2f}")
-            self.trades_label.setText(f"Trades: {metrics.get('trades', 0)}")
-            self.win_rate_label.setText(f"Win Rate: {metrics.get('win_rate', 0):.1f}%")
-        except Exception as e:
-            pass
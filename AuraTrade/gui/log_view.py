@@ -0,0 +1,134 @@
+"""
+Log View for AuraTrade Bot
+Queue-fed log display with batched appends, a bounded document and level filtering
+"""
+
+import html
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Deque, Tuple
+from PyQt5.QtWidgets import QPlainTextEdit
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QTextCursor
+
+LEVELS = {
+    'DEBUG': 10,
+    'INFO': 20,
+    'SUCCESS': 25,
+    'WARNING': 30,
+    'ERROR': 40,
+    'CRITICAL': 50
+}
+
+LEVEL_COLORS = {
+    'SUCCESS': '#4CAF50',
+    'WARNING': '#FF9800',
+    'ERROR': '#F44336',
+    'CRITICAL': '#F44336'
+}
+
+class LogView(QPlainTextEdit):
+    """Read-only log display fed from any thread
+
+    ``log`` only appends to a bounded pending queue; a GUI timer drains it
+    at a fixed cadence and inserts the whole batch in one edit block, so a
+    burst of messages costs one layout pass instead of one per line. The
+    document is capped with ``setMaximumBlockCount`` and every block keeps
+    its level in its user state, so changing the level filter only toggles
+    block visibility instead of rebuilding the text.
+    """
+
+    def __init__(self, max_lines: int = 1000, flush_ms: int = 200, parent=None):
+        super().__init__(parent)
+        self.max_lines = max_lines
+        self.min_level = 0
+
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(max_lines)
+
+        # Lines older than the cap would be evicted on insert anyway
+        self.pending: Deque[Tuple[datetime, str, str]] = deque(maxlen=max_lines)
+        self._lock = threading.Lock()
+
+        # Counters
+        self.appended = 0
+        self.dropped = 0
+        self.batches = 0
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start(flush_ms)
+
+    def log(self, message: str, level: str = "INFO"):
+        """Queue a message for display (any thread)"""
+        with self._lock:
+            if len(self.pending) == self.max_lines:
+                self.dropped += 1
+            self.pending.append((datetime.now(), level.upper(), message))
+
+    def format_line(self, timestamp: datetime, level: str, message: str) -> str:
+        """HTML for one log line"""
+        color = LEVEL_COLORS.get(level, '#ffffff')
+        return (f'<span style="color: #888888">[{timestamp.strftime("%H:%M:%S")}]</span> '
+                f'<span style="color: {color}"><b>{level}:</b> {html.escape(str(message))}</span>')
+
+    def flush(self):
+        """Append all pending lines in a single edit block"""
+        with self._lock:
+            if not self.pending:
+                return
+            lines = list(self.pending)
+            self.pending.clear()
+
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+
+        document = self.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for timestamp, level, message in lines:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(self.format_line(timestamp, level, message))
+            block = cursor.block()
+            level_no = LEVELS.get(level, LEVELS['INFO'])
+            block.setUserState(level_no)
+            if level_no < self.min_level:
+                block.setVisible(False)
+        cursor.endEditBlock()
+
+        self.appended += len(lines)
+        self.batches += 1
+
+        # Follow the tail unless the user scrolled up
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def set_min_level(self, level: str):
+        """Show only lines at or above ``level``"""
+        self.min_level = LEVELS.get(level.upper(), 0)
+
+        document = self.document()
+        block = document.firstBlock()
+        first_changed = last_changed = None
+        while block.isValid():
+            visible = block.userState() < 0 or block.userState() >= self.min_level
+            if block.isVisible() != visible:
+                block.setVisible(visible)
+                if first_changed is None:
+                    first_changed = block.position()
+                last_changed = block.position() + block.length()
+            block = block.next()
+
+        if first_changed is not None:
+            document.markContentsDirty(first_changed, last_changed - first_changed)
+            self.viewport().update()
+
+    def clear(self):
+        """Remove displayed and pending lines"""
+        with self._lock:
+            self.pending.clear()
+        super().clear()
@@ -11,11 +11,17 @@ from PyQt5.QtGui import *
 from datetime import datetime
 import pandas as pd
 from typing import Dict, Any
+from gui.state_publisher import StatePublisher, StateSnapshot
+from gui.positions_model import PositionsTableModel
+from gui.log_view import LogView
+from gui.market_watch import MarketWatchWidget
+from gui.charts import ChartWidget
 
 class MainWindow(QMainWindow):
     """Main application window"""
 
-    def __init__(self, mt5_connector, trading_engine, order_manager, portfolio, strategies, technical_analysis, data_manager):
+    def __init__(self, mt5_connector, trading_engine, order_manager, portfolio, strategies, technical_analysis, data_manager,
+                 log_max_lines: int = 1000):
         super().__init__()
         self.mt5_connector = mt5_connector
         self.trading_engine = trading_engine
@@ -24,10 +30,15 @@ class MainWindow(QMainWindow):
         self.strategies = strategies
         self.technical_analysis = technical_analysis
         self.data_manager = data_manager
+        self.log_max_lines = log_max_lines
 
-        # GUI update timer
+        # Broker/engine state is collected off the GUI thread
+        self.snapshot = StateSnapshot(timestamp=datetime.now())
+        self.state_publisher = StatePublisher(mt5_connector, trading_engine, data_manager=data_manager)
+
+        # Clock timer (no broker calls)
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_gui)
+        self.update_timer.timeout.connect(self.update_time)
 
         # Initialize UI
         self.init_ui()
@@ -35,6 +46,7 @@ class MainWindow(QMainWindow):
 
         # Start GUI updates
         self.update_timer.start(1000)  # Update every second
+        self.state_publisher.start()
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -302,6 +314,14 @@ class MainWindow(QMainWindow):
         analysis_tab = self.create_analysis_tab()
         tabs.addTab(analysis_tab, "Market Analysis")
 
+        # Market Watch Tab
+        market_watch_tab = self.create_market_watch_tab()
+        tabs.addTab(market_watch_tab, "Market Watch")
+
+        # Chart Tab (forming candle follows ticks)
+        self.chart_widget = ChartWidget(data_manager=self.data_manager)
+        tabs.addTab(self.chart_widget, "Chart")
+
         layout.addWidget(tabs)
 
         return panel
@@ -372,12 +392,14 @@ class MainWindow(QMainWindow):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        # Positions table
-        self.positions_table = QTableWidget()
-        self.positions_table.setColumnCount(8)
-        self.positions_table.setHorizontalHeaderLabels([
-            'Ticket', 'Symbol', 'Type', 'Volume', 'Open Price', 'Current Price', 'Profit', 'Time'
-        ])
+        # Positions table (ticket-keyed model, updated by diff)
+        self.positions_model = PositionsTableModel([
+            ('Ticket', 'ticket'), ('Symbol', 'symbol'), ('Type', 'type'), ('Volume', 'volume'),
+            ('Open Price', 'price_open'), ('Current Price', 'price_current'), ('Profit', 'profit'),
+            ('Time', 'time')
+        ], profit_format="${:.2f}", profit_colors=('#4CAF50', '#F44336'))
+        self.positions_table = QTableView()
+        self.positions_table.setModel(self.positions_model)
 
         # Style the table
         self.positions_table.setAlternatingRowColors(True)
@@ -394,14 +416,12 @@ class MainWindow(QMainWindow):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        # Log text area
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setMaximumBlockCount(1000)  # Limit to 1000 lines
+        # Log text area (queue-fed, batched, capped at log_max_lines blocks)
+        self.log_text = LogView(max_lines=self.log_max_lines)
 
         # Style the log area
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #ffffff;
                 font-family: 'Consolas', monospace;
@@ -413,12 +433,18 @@ class MainWindow(QMainWindow):
         # Log controls
         controls_layout = QHBoxLayout()
 
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItems(["ALL", "INFO", "WARNING", "ERROR"])
+        self.log_level_combo.currentTextChanged.connect(self.log_text.set_min_level)
+
         clear_logs_button = QPushButton("Clear Logs")
         clear_logs_button.clicked.connect(self.clear_logs)
 
         export_logs_button = QPushButton("Export Logs")
         export_logs_button.clicked.connect(self.export_logs)
 
+        controls_layout.addWidget(QLabel("Level:"))
+        controls_layout.addWidget(self.log_level_combo)
         controls_layout.addWidget(clear_logs_button)
         controls_layout.addWidget(export_logs_button)
         controls_layout.addStretch()
@@ -429,6 +455,18 @@ class MainWindow(QMainWindow):
 
         return widget
 
+    def create_market_watch_tab(self) -> QWidget:
+        """Create market watch tab"""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+
+        # Quotes pushed by DataManager tick callbacks
+        symbols = self.data_manager.get_active_symbols() if self.data_manager else []
+        self.market_watch = MarketWatchWidget(self.data_manager, symbols)
+        layout.addWidget(self.market_watch)
+
+        return widget
+
     def create_analysis_tab(self) -> QWidget:
         """Create market analysis tab"""
         widget = QWidget()
@@ -465,12 +503,20 @@ class MainWindow(QMainWindow):
 
     def setup_connections(self):
         """Setup signal connections"""
-        pass
+        self.state_publisher.snapshot_ready.connect(self.on_snapshot)
+        self.state_publisher.set_symbols([self.symbol_combo.currentText()])
+        self.symbol_combo.currentTextChanged.connect(
+            lambda symbol: self.state_publisher.set_symbols([symbol])
+        )
+
+    def on_snapshot(self, snapshot: StateSnapshot):
+        """Render a state snapshot published by the background collector"""
+        self.snapshot = snapshot
+        self.update_gui()
 
     def update_gui(self):
         """Update GUI with current information"""
         try:
-            self.update_time()
             self.update_account_info()
             self.update_positions_table()
             self.update_connection_status()
@@ -487,65 +533,40 @@ class MainWindow(QMainWindow):
     def update_account_info(self):
         """Update account information"""
         try:
-            if hasattr(self.mt5_connector, 'get_account_info'):
-                account = self.mt5_connector.get_account_info()
-                if account:
-                    self.balance_label.setText(f"${account.get('balance', 0):.2f}")
-                    self.equity_label.setText(f"${account.get('equity', 0):.2f}")
-                    self.free_margin_label.setText(f"${account.get('free_margin', 0):.2f}")
-                    self.margin_level_label.setText(f"{account.get('margin_level', 0):.2f}%")
-
-                    profit = account.get('profit', 0)
-                    self.profit_label.setText(f"${profit:.2f}")
-                    if profit > 0:
-                        self.profit_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #4CAF50;")
-                    elif profit < 0:
-                        self.profit_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #F44336;")
-                    else:
-                        self.profit_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #757575;")
+            account = self.snapshot.account
+            if account:
+                self.balance_label.setText(f"${account.get('balance', 0):.2f}")
+                self.equity_label.setText(f"${account.get('equity', 0):.2f}")
+                self.free_margin_label.setText(f"${account.get('free_margin', 0):.2f}")
+                self.margin_level_label.setText(f"{account.get('margin_level', 0):.2f}%")
+
+                profit = account.get('profit', 0)
+                self.profit_label.setText(f"${profit:.2f}")
+                if profit > 0:
+                    self.profit_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #4CAF50;")
+                elif profit < 0:
+                    self.profit_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #F44336;")
+                else:
+                    self.profit_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #757575;")
         except Exception as e:
             pass
 
     def update_positions_table(self):
         """Update positions table"""
         try:
-            if hasattr(self.mt5_connector, 'get_positions'):
-                positions = self.mt5_connector.get_positions()
-                self.positions_table.setRowCount(len(positions))
-
-                for i, pos in enumerate(positions):
-                    self.positions_table.setItem(i, 0, QTableWidgetItem(str(pos.get('ticket', ''))))
-                    self.positions_table.setItem(i, 1, QTableWidgetItem(pos.get('symbol', '')))
-                    self.positions_table.setItem(i, 2, QTableWidgetItem('Buy' if pos.get('type') == 0 else 'Sell'))
-                    self.positions_table.setItem(i, 3, QTableWidgetItem(f"{pos.get('volume', 0):.2f}"))
-                    self.positions_table.setItem(i, 4, QTableWidgetItem(f"{pos.get('price_open', 0):.5f}"))
-                    self.positions_table.setItem(i, 5, QTableWidgetItem(f"{pos.get('price_current', 0):.5f}"))
-
-                    profit = pos.get('profit', 0)
-                    profit_item = QTableWidgetItem(f"${profit:.2f}")
-                    if profit > 0:
-                        profit_item.setForeground(QColor('#4CAF50'))
-                    elif profit < 0:
-                        profit_item.setForeground(QColor('#F44336'))
-                    self.positions_table.setItem(i, 6, profit_item)
-
-                    self.positions_table.setItem(i, 7, QTableWidgetItem(
-                        datetime.fromtimestamp(pos.get('time', 0)).strftime('%H:%M:%S')
-                    ))
+            self.positions_model.update_positions(self.snapshot.positions)
         except Exception as e:
             pass
 
     def update_connection_status(self):
         """Update connection status"""
         try:
-            if hasattr(self.mt5_connector, 'check_connection'):
-                connected = self.mt5_connector.check_connection()
-                if connected:
-                    self.connection_label.setText("✅ Connected")
-                    self.connection_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
-                else:
-                    self.connection_label.setText("❌ Disconnected")
-                    self.connection_label.setStyleSheet("color: #F44336; font-weight: bold;")
+            if self.snapshot.connected:
+                self.connection_label.setText("✅ Connected")
+                self.connection_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
+            else:
+                self.connection_label.setText("❌ Disconnected")
+                self.connection_label.setStyleSheet("color: #F44336; font-weight: bold;")
         except Exception:
             self.connection_label.setText("❌ Error")
             self.connection_label.setStyleSheet("color: #F44336; font-weight: bold;")
@@ -553,7 +574,7 @@ class MainWindow(QMainWindow):
     def update_bot_status(self):
         """Update bot status"""
         try:
-            if hasattr(self.trading_engine, 'running') and self.trading_engine.running:
+            if self.snapshot.engine_running:
                 self.bot_status_label.setText("🟢 Running")
                 self.bot_status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
             else:
@@ -561,8 +582,8 @@ class MainWindow(QMainWindow):
                 self.bot_status_label.setStyleSheet("color: #757575; font-weight: bold;")
 
             # Update performance metrics
-            if hasattr(self.trading_engine, 'get_status'):
-                status = self.trading_engine.get_status()
+            status = self.snapshot.engine_status
+            if status:
                 self.trades_today_label.setText(str(status.get('trades_today', 0)))
                 self.win_rate_label.setText(f"{status.get('win_rate', 0):.1f}%")
 
@@ -583,34 +604,33 @@ class MainWindow(QMainWindow):
     def update_analysis(self):
         """Update market analysis display"""
         try:
-            if hasattr(self.trading_engine, 'get_latest_analysis'):
-                symbol = self.symbol_combo.currentText()
-                analysis = self.trading_engine.get_latest_analysis(symbol)
-
-                if analysis:
-                    analysis_text = f"Analysis for {symbol} - {analysis['timestamp'].strftime('%H:%M:%S')}\n\n"
-
-                    # Display indicators
-                    indicators = analysis.get('indicators', {})
-                    analysis_text += "Technical Indicators:\n"
-                    for name, value in indicators.items():
-                        if isinstance(value, (int, float)):
-                            analysis_text += f"  {name}: {value:.4f}\n"
-
-                    # Display signals
-                    signals = analysis.get('signals', [])
-                    if signals:
-                        analysis_text += f"\nSignals ({len(signals)}):\n"
-                        for signal in signals:
-                            analysis_text += f"  {signal.get('action', '').upper()} - "
-                            analysis_text += f"Confidence: {signal.get('confidence', 0):.2f} - "
-                            analysis_text += f"Reason: {signal.get('reason', 'N/A')}\n"
-
-                    # Display spread
-                    spread = analysis.get('spread', 0)
-                    analysis_text += f"\nSpread: {spread:.1f} pips\n"
-
-                    self.analysis_text.setText(analysis_text)
+            symbol = self.symbol_combo.currentText()
+            analysis = self.snapshot.analysis.get(symbol)
+
+            if analysis:
+                analysis_text = f"Analysis for {symbol} - {analysis['timestamp'].strftime('%H:%M:%S')}\n\n"
+
+                # Display indicators
+                indicators = analysis.get('indicators', {})
+                analysis_text += "Technical Indicators:\n"
+                for name, value in indicators.items():
+                    if isinstance(value, (int, float)):
+                        analysis_text += f"  {name}: {value:.4f}\n"
+
+                # Display signals
+                signals = analysis.get('signals', [])
+                if signals:
+                    analysis_text += f"\nSignals ({len(signals)}):\n"
+                    for signal in signals:
+                        analysis_text += f"  {signal.get('action', '').upper()} - "
+                        analysis_text += f"Confidence: {signal.get('confidence', 0):.2f} - "
+                        analysis_text += f"Reason: {signal.get('reason', 'N/A')}\n"
+
+                # Display spread
+                spread = analysis.get('spread', 0)
+                analysis_text += f"\nSpread: {spread:.1f} pips\n"
+
+                self.analysis_text.setText(analysis_text)
         except Exception as e:
             pass
 
@@ -719,6 +739,7 @@ class MainWindow(QMainWindow):
                     for pos in positions:
                         self.mt5_connector.close_position(pos['ticket'])
                     self.log_message(f"Closed {len(positions)} positions", "INFO")
+                    self.state_publisher.request_refresh()
         except Exception as e:
             self.log_message(f"Error closing positions: {e}", "ERROR")
 
@@ -739,25 +760,8 @@ class MainWindow(QMainWindow):
             self.log_message(f"Error changing strategy: {e}", "ERROR")
 
     def log_message(self, message: str, level: str = "INFO"):
-        """Add message to log display"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        # Color coding for different log levels
-        if level == "ERROR":
-            color = "#F44336"
-        elif level == "WARNING":
-            color = "#FF9800"
-        elif level == "SUCCESS":
-            color = "#4CAF50"
-        else:
-            color = "#ffffff"
-
-        formatted_message = f'<span style="color: #888888">[{timestamp}]</span> <span style="color: {color}"><b>{level}:</b> {message}</span>'
-        self.log_text.append(formatted_message)
-
-        # Auto-scroll to bottom
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        """Add message to log display (safe to call from any thread)"""
+        self.log_text.log(message, level)
 
     def clear_logs(self):
         """Clear the log display"""
@@ -774,6 +778,7 @@ class MainWindow(QMainWindow):
             )
 
             if filename:
+                self.log_text.flush()
                 with open(filename, 'w', encoding='utf-8') as f:
                     f.write(self.log_text.toPlainText())
                 self.log_message(f"Logs exported to: {filename}", "SUCCESS")
@@ -818,7 +823,7 @@ class MainWindow(QMainWindow):
             border-color: #2196F3;
         }
 
-        QTableWidget {
+        QTableWidget, QTableView {
             gridline-color: #555555;
             background-color: #3c3c3c;
             alternate-background-color: #484848;
@@ -850,7 +855,7 @@ class MainWindow(QMainWindow):
             color: #ffffff;
         }
 
-        QTextEdit {
+        QTextEdit, QPlainTextEdit {
             background-color: #1e1e1e;
             color: #ffffff;
             border: 1px solid #555555;
@@ -889,5 +894,10 @@ class MainWindow(QMainWindow):
                     event.ignore()
             else:
                 event.accept()
+
+            if event.isAccepted():
+                self.state_publisher.stop()
+                self.market_watch.stop()
+                self.chart_widget.stop()
         except Exception as e:
             event.accept()
\ No newline at end of file
@@ -0,0 +1,213 @@
+"""
+Market Watch for AuraTrade Bot
+Tick-driven quote table with per-frame coalescing and change-only repaints
+"""
+
+import threading
+import time
+from typing import Dict, List, Any, Optional
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableView, QHeaderView
+from PyQt5.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, QVariant
+from PyQt5.QtGui import QColor
+from utils.logger import Logger
+
+def price_digits(symbol: str) -> int:
+    """Display precision for a symbol's quotes"""
+    if 'JPY' in symbol:
+        return 3
+    if symbol.startswith(('XAU', 'XAG', 'BTC', 'ETH')):
+        return 2
+    return 5
+
+class TickCoalescer:
+    """Latest tick per symbol, written from any thread and drained by the GUI
+
+    Only the newest tick of a symbol is kept between frames, so a burst of
+    ticks costs one repaint per symbol per frame.
+    """
+
+    def __init__(self):
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.received = 0
+        self.merged = 0
+
+    def push(self, symbol: str, tick: Dict[str, Any]):
+        with self._lock:
+            if symbol in self.pending:
+                self.merged += 1
+            self.pending[symbol] = tick
+            self.received += 1
+
+    def drain(self, limit: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Take up to ``limit`` pending ticks (all if None)"""
+        with self._lock:
+            if limit is None or limit >= len(self.pending):
+                ticks, self.pending = self.pending, {}
+                return ticks
+            symbols = list(self.pending)[:limit]
+            return {symbol: self.pending.pop(symbol) for symbol in symbols}
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+class MarketWatchModel(QAbstractTableModel):
+    """Symbol quotes; ``dataChanged`` only for cells whose text changed"""
+
+    HEADERS = ['Symbol', 'Bid', 'Ask', 'Spread']
+
+    def __init__(self, symbols: List[str] = None, parent=None):
+        super().__init__(parent)
+        self.symbols: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.cells: Dict[str, List[str]] = {}
+        self.direction: Dict[str, int] = {}
+        self.last_bid: Dict[str, float] = {}
+        self.cells_changed = 0
+        self.set_symbols(symbols or [])
+
+    def set_symbols(self, symbols: List[str]):
+        self.beginResetModel()
+        self.symbols = list(dict.fromkeys(symbols))
+        self.rows = {symbol: row for row, symbol in enumerate(self.symbols)}
+        self.cells = {symbol: [symbol, '-', '-', '-'] for symbol in self.symbols}
+        self.direction.clear()
+        self.last_bid.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.symbols)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return QVariant()
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        symbol = self.symbols[index.row()]
+        if role == Qt.DisplayRole:
+            return self.cells[symbol][index.column()]
+        if role == Qt.ForegroundRole and index.column() in (1, 2):
+            direction = self.direction.get(symbol, 0)
+            if direction > 0:
+                return QColor('green')
+            if direction < 0:
+                return QColor('red')
+        if role == Qt.TextAlignmentRole and index.column() > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return QVariant()
+
+    def apply_tick(self, symbol: str, tick: Dict[str, Any]) -> int:
+        """Update one symbol's row; returns the number of cells that changed"""
+        row = self.rows.get(symbol)
+        if row is None:
+            return 0
+
+        bid = tick.get('bid', 0)
+        ask = tick.get('ask', 0)
+        digits = price_digits(symbol)
+        point = 10 ** -digits
+        cells = [symbol, f"{bid:.{digits}f}", f"{ask:.{digits}f}", f"{(ask - bid) / point:.0f}"]
+
+        previous_bid = self.last_bid.get(symbol)
+        direction = self.direction.get(symbol, 0)
+        if previous_bid is not None and bid != previous_bid:
+            direction = 1 if bid > previous_bid else -1
+        self.last_bid[symbol] = bid
+
+        old = self.cells[symbol]
+        changed = [col for col in range(1, 4) if cells[col] != old[col]]
+        if direction != self.direction.get(symbol, 0):
+            changed = sorted(set(changed) | {1, 2})
+        self.direction[symbol] = direction
+        if not changed:
+            return 0
+
+        self.cells[symbol] = cells
+        self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+        self.cells_changed += len(changed)
+        return len(changed)
+
+class MarketWatchWidget(QWidget):
+    """Quote table fed by DataManager tick callbacks
+
+    Ticks arrive on the data thread and only land in a ``TickCoalescer``;
+    a GUI timer drains it once per frame and applies updates until the
+    frame budget is spent, leaving the rest (still the newest ticks) for
+    the next frame. No terminal calls are made from the GUI thread.
+    """
+
+    def __init__(self, data_manager=None, symbols: List[str] = None, frame_ms: int = 100,
+                 frame_budget_ms: float = 8.0, parent=None):
+        super().__init__(parent)
+        self.logger = Logger().get_logger()
+        self.data_manager = data_manager
+        self.frame_budget = frame_budget_ms / 1000.0
+        self.coalescer = TickCoalescer()
+        self.model = MarketWatchModel(symbols or [])
+        self.frames = 0
+        self.deferred = 0
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start(frame_ms)
+
+        if self.data_manager is not None and hasattr(self.data_manager, 'register_tick_callback'):
+            self.data_manager.register_tick_callback(self.on_tick)
+            self.data_manager.watch_symbols(self.model.symbols)
+
+    def on_tick(self, symbol: str, tick: Dict[str, Any]):
+        """Tick callback (any thread): keep only the newest tick per symbol"""
+        if symbol in self.model.rows:
+            self.coalescer.push(symbol, tick)
+
+    def set_symbols(self, symbols: List[str]):
+        """Replace the watchlist"""
+        if self.data_manager is not None and hasattr(self.data_manager, 'unwatch_symbols'):
+            self.data_manager.unwatch_symbols([s for s in self.model.symbols if s not in symbols])
+            self.data_manager.watch_symbols(symbols)
+        self.model.set_symbols(symbols)
+
+    def flush(self):
+        """Apply pending ticks within the frame budget"""
+        try:
+            if not len(self.coalescer):
+                return
+
+            started = time.perf_counter()
+            self.frames += 1
+            while len(self.coalescer):
+                for symbol, tick in self.coalescer.drain(limit=16).items():
+                    self.model.apply_tick(symbol, tick)
+                if time.perf_counter() - started >= self.frame_budget:
+                    self.deferred += len(self.coalescer)
+                    break
+
+        except Exception as e:
+            self.logger.error(f"Error updating market watch: {e}")
+
+    def stop(self):
+        """Stop receiving ticks and release the watched symbols"""
+        self.timer.stop()
+        if self.data_manager is not None and hasattr(self.data_manager, 'unregister_tick_callback'):
+            self.data_manager.unregister_tick_callback(self.on_tick)
+            self.data_manager.unwatch_symbols(self.model.symbols)
+    
+    def closeEvent(self, event):
+        """Stop receiving ticks"""
+        self.stop()
+        super().closeEvent(event)
@@ -0,0 +1,150 @@
+"""
+Positions Table Model for AuraTrade Bot
+Ticket-keyed Qt model that applies position snapshots as minimal row/cell changes
+"""
+
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+from PyQt5.QtGui import QColor
+
+# Column key -> cell text for one position
+COLUMN_FORMATTERS = {
+    'ticket': lambda p: str(p.get('ticket', '')),
+    'symbol': lambda p: p.get('symbol', ''),
+    'type': lambda p: 'Buy' if p.get('type', 0) == 0 else 'Sell',
+    'volume': lambda p: f"{p.get('volume', 0):.2f}",
+    'price_open': lambda p: f"{p.get('price_open', 0):.5f}",
+    'price_current': lambda p: f"{p.get('price_current', 0):.5f}",
+    'sl': lambda p: f"{p.get('sl', 0):.5f}",
+    'tp': lambda p: f"{p.get('tp', 0):.5f}",
+    'swap': lambda p: f"{p.get('swap', 0):.2f}",
+    'time': lambda p: datetime.fromtimestamp(p.get('time', 0)).strftime('%H:%M:%S'),
+    'action': lambda p: 'Close'
+}
+
+class PositionsTableModel(QAbstractTableModel):
+    """Open positions keyed by ticket
+
+    ``update_positions`` diffs a fresh position list against the rows on
+    display: closed tickets are removed, new tickets appended, and
+    ``dataChanged`` is emitted only for the cells whose text changed, so
+    views keep their items, selection and scroll position.
+    """
+
+    def __init__(self, columns: List[Tuple[str, str]], profit_format: str = "{:.2f}",
+                 profit_colors: Tuple[str, str] = ('green', 'red'), parent=None):
+        super().__init__(parent)
+        self.headers = [header for header, _ in columns]
+        self.keys = [key for _, key in columns]
+        self.profit_format = profit_format
+        self.profit_colors = (QColor(profit_colors[0]), QColor(profit_colors[1]))
+
+        self.tickets: List[int] = []
+        self.cells: Dict[int, List[str]] = {}
+        self.profits: Dict[int, float] = {}
+
+        # Change counters
+        self.rows_inserted = 0
+        self.rows_removed = 0
+        self.cells_changed = 0
+
+    def _format(self, position: Dict[str, Any]) -> List[str]:
+        cells = []
+        for key in self.keys:
+            if key == 'profit':
+                cells.append(self.profit_format.format(position.get('profit', 0)))
+            else:
+                cells.append(COLUMN_FORMATTERS[key](position))
+        return cells
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.tickets)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.keys)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return QVariant()
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        ticket = self.tickets[index.row()]
+        if role == Qt.DisplayRole:
+            return self.cells[ticket][index.column()]
+
+        if role == Qt.ForegroundRole and self.keys[index.column()] == 'profit':
+            profit = self.profits.get(ticket, 0)
+            if profit > 0:
+                return self.profit_colors[0]
+            if profit < 0:
+                return self.profit_colors[1]
+
+        return QVariant()
+
+    def ticket_at(self, row: int) -> Optional[int]:
+        """Ticket shown in a row"""
+        return self.tickets[row] if 0 <= row < len(self.tickets) else None
+
+    def column_of(self, key: str) -> int:
+        """Column index of a column key, or -1"""
+        return self.keys.index(key) if key in self.keys else -1
+
+    def update_positions(self, positions: List[Dict[str, Any]]):
+        """Apply a full position list as row removals, cell changes and row inserts"""
+        latest = {p['ticket']: p for p in positions if 'ticket' in p}
+
+        # Closed positions, removed bottom-up in contiguous runs
+        rows = [row for row, ticket in enumerate(self.tickets) if ticket not in latest]
+        while rows:
+            last = rows.pop()
+            first = last
+            while rows and rows[-1] == first - 1:
+                first = rows.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for ticket in self.tickets[first:last + 1]:
+                del self.cells[ticket]
+                self.profits.pop(ticket, None)
+            del self.tickets[first:last + 1]
+            self.endRemoveRows()
+            self.rows_removed += last - first + 1
+
+        # Still-open positions: signal only the cells that changed
+        for row, ticket in enumerate(self.tickets):
+            position = latest[ticket]
+            cells = self._format(position)
+            previous = self.cells[ticket]
+            changed = [col for col, (new, old) in enumerate(zip(cells, previous)) if new != old]
+            self.profits[ticket] = position.get('profit', 0)
+            if changed:
+                self.cells[ticket] = cells
+                start = changed[0]
+                for prev, col in zip(changed, changed[1:] + [None]):
+                    if col != prev + 1:
+                        self.dataChanged.emit(self.index(row, start), self.index(row, prev))
+                        start = col
+                self.cells_changed += len(changed)
+
+        # New positions
+        added = [ticket for ticket in latest if ticket not in self.cells]
+        if added:
+            start = len(self.tickets)
+            self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+            for ticket in added:
+                self.tickets.append(ticket)
+                self.cells[ticket] = self._format(latest[ticket])
+                self.profits[ticket] = latest[ticket].get('profit', 0)
+            self.endInsertRows()
+            self.rows_inserted += len(added)
+
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self.tickets.clear()
+        self.cells.clear()
+        self.profits.clear()
+        self.endResetModel()
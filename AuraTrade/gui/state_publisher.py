@@ -0,0 +1,219 @@
+"""
+GUI State Publisher for AuraTrade Bot
+Collects broker and engine state off the GUI thread and publishes it via Qt signals
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+from PyQt5.QtCore import QObject, pyqtSignal
+from utils.logger import Logger
+
+@dataclass
+class StateSnapshot:
+    """Broker and engine state collected in one publisher pass"""
+    timestamp: datetime
+    connected: bool = False
+    account: Optional[Dict[str, Any]] = None
+    positions: List[Dict[str, Any]] = field(default_factory=list)
+    ticks: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    engine_running: bool = False
+    engine_status: Dict[str, Any] = field(default_factory=dict)
+    analysis: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    collect_ms: float = 0.0
+
+class StatePublisher(QObject):
+    """Background collector of GUI state
+
+    A worker thread polls the terminal and the trading engine, each part at
+    its own interval, and emits one ``StateSnapshot`` per pass through
+    ``snapshot_ready``. Widgets connected to the signal only render, so a
+    slow terminal call never blocks the GUI thread, and every widget shares
+    the same broker calls.
+
+    With a ``data_manager``, ticks are not requested from the terminal:
+    the publisher keeps the latest tick from the data manager's tick
+    callbacks (fed by the trading engine's own polling) and asks its
+    watched-symbol feed to cover only symbols nobody else polls.
+    """
+
+    snapshot_ready = pyqtSignal(object)
+
+    def __init__(self, mt5_connector, trading_engine=None, interval_ms: int = 500, data_manager=None):
+        super().__init__()
+        self.logger = Logger().get_logger()
+        self.mt5_connector = mt5_connector
+        self.trading_engine = trading_engine
+        self.data_manager = data_manager
+        self.interval = interval_ms / 1000.0
+
+        # Seconds between refreshes of each part of the snapshot
+        self.intervals = {
+            'connection': 1.0,
+            'ticks': 0.5,
+            'account': 1.0,
+            'positions': 1.0,
+            'engine': 1.0
+        }
+        self.last_refresh: Dict[str, float] = {}
+
+        self.symbols: List[str] = []
+        self.latest_ticks: Dict[str, Dict[str, Any]] = {}
+        self.snapshot = StateSnapshot(timestamp=datetime.now())
+        self.snapshots_published = 0
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self.running = False
+        self.worker_thread = None
+
+    def set_symbols(self, symbols: List[str]):
+        """Symbols whose ticks and analysis are collected"""
+        with self._lock:
+            previous = self.symbols
+            self.symbols = list(dict.fromkeys(symbols))
+        self._watch(previous, self.symbols)
+
+    def add_symbols(self, symbols: List[str]):
+        with self._lock:
+            previous = self.symbols
+            self.symbols = list(dict.fromkeys(self.symbols + list(symbols)))
+        self._watch(previous, self.symbols)
+
+    def _watch(self, previous: List[str], current: List[str]):
+        """Keep the data manager's tick feed on the published symbols"""
+        if self.data_manager is None or not self.running:
+            return
+        self.data_manager.unwatch_symbols([s for s in previous if s not in current])
+        self.data_manager.watch_symbols(current)
+
+    def on_tick(self, symbol: str, tick: Dict[str, Any]):
+        """Tick callback (data thread): remember the newest tick"""
+        self.latest_ticks[symbol] = tick
+
+    def set_interval(self, part: str, seconds: float):
+        """Change the refresh interval of one snapshot part"""
+        if part in self.intervals:
+            self.intervals[part] = seconds
+
+    def start(self):
+        """Start the collector thread"""
+        if self.running:
+            return
+        self.running = True
+        if self.data_manager is not None:
+            self.data_manager.register_tick_callback(self.on_tick)
+            self._watch([], self.symbols)
+        self.worker_thread = threading.Thread(target=self._run, daemon=True)
+        self.worker_thread.start()
+        self.logger.info("GUI state publisher started")
+
+    def stop(self):
+        """Stop the collector thread"""
+        self.running = False
+        self._wake.set()
+        if self.worker_thread and self.worker_thread.is_alive():
+            self.worker_thread.join(timeout=5)
+        if self.data_manager is not None:
+            self.data_manager.unregister_tick_callback(self.on_tick)
+            self.data_manager.unwatch_symbols(self.symbols)
+
+    def request_refresh(self):
+        """Collect everything now (e.g. after the user closed a position)"""
+        self.last_refresh.clear()
+        self._wake.set()
+
+    def _run(self):
+        while self.running:
+            try:
+                snapshot = self.collect()
+                self.snapshot_ready.emit(snapshot)
+                self.snapshots_published += 1
+            except Exception as e:
+                self.logger.error(f"Error publishing GUI state: {e}")
+
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def _due(self, part: str, now: float) -> bool:
+        if now - self.last_refresh.get(part, 0.0) < self.intervals[part]:
+            return False
+        self.last_refresh[part] = now
+        return True
+
+    def collect(self) -> StateSnapshot:
+        """Build a snapshot, refreshing only the parts that are due"""
+        started = time.perf_counter()
+        now = time.time()
+        previous = self.snapshot
+        with self._lock:
+            symbols = list(self.symbols)
+
+        snapshot = StateSnapshot(
+            timestamp=datetime.now(),
+            connected=previous.connected,
+            account=previous.account,
+            positions=previous.positions,
+            ticks=previous.ticks,
+            engine_running=previous.engine_running,
+            engine_status=previous.engine_status,
+            analysis=previous.analysis
+        )
+
+        if self._due('connection', now):
+            try:
+                snapshot.connected = bool(self.mt5_connector.check_connection())
+            except Exception as e:
+                self.logger.error(f"Error checking connection: {e}")
+                snapshot.connected = False
+
+        # Skip terminal calls entirely while disconnected
+        if snapshot.connected:
+            if self._due('account', now):
+                try:
+                    snapshot.account = self.mt5_connector.get_account_info()
+                except Exception as e:
+                    self.logger.error(f"Error getting account info: {e}")
+
+            if self._due('positions', now):
+                try:
+                    snapshot.positions = self.mt5_connector.get_positions() or []
+                except Exception as e:
+                    self.logger.error(f"Error getting positions: {e}")
+
+            if self._due('ticks', now) and self.data_manager is None:
+                ticks = {}
+                for symbol in symbols:
+                    try:
+                        tick = self.mt5_connector.get_tick(symbol)
+                    except Exception as e:
+                        self.logger.error(f"Error getting tick for {symbol}: {e}")
+                        tick = None
+                    if tick:
+                        ticks[symbol] = tick
+                snapshot.ticks = ticks
+
+        if self.data_manager is not None:
+            latest = self.latest_ticks
+            snapshot.ticks = {symbol: latest[symbol] for symbol in symbols if symbol in latest}
+
+        if self.trading_engine is not None and self._due('engine', now):
+            try:
+                snapshot.engine_running = bool(getattr(self.trading_engine, 'running', False))
+                if hasattr(self.trading_engine, 'get_status'):
+                    snapshot.engine_status = self.trading_engine.get_status()
+                if hasattr(self.trading_engine, 'get_latest_analysis'):
+                    analysis = {}
+                    for symbol in symbols:
+                        result = self.trading_engine.get_latest_analysis(symbol)
+                        if result:
+                            analysis[symbol] = result
+                    snapshot.analysis = analysis
+            except Exception as e:
+                self.logger.error(f"Error getting engine status: {e}")
+
+        snapshot.collect_ms = (time.perf_counter() - started) * 1000
+        self.snapshot = snapshot
+        return snapshot
@@ -2,28 +2,24 @@
 """
 Trading strategies for AuraTrade Bot
 Multiple strategy implementations for different market conditions
+
+Strategy classes are imported on first access, so importing one strategy
+module does not load the others.
 """
 
-from .scalping_strategy import ScalpingStrategy
-from .hft_strategy import HFTStrategy
-from .pattern_strategy import PatternStrategy
+import importlib
 
-__all__ = ['ScalpingStrategy', 'HFTStrategy', 'PatternStrategy']
-"""
-Trading strategies for AuraTrade Bot
-Multiple strategy implementations for different market conditions
-"""
+_STRATEGY_MODULES = {
+    'ScalpingStrategy': '.scalping_strategy',
+    'HFTStrategy': '.hft_strategy',
+    'PatternStrategy': '.pattern_strategy',
+    'SwingStrategy': '.swing_strategy',
+    'ArbitrageStrategy': '.arbitrage_strategy'
+}
 
-from .scalping_strategy import ScalpingStrategy
-from .hft_strategy import HFTStrategy
-from .pattern_strategy import PatternStrategy
-from .swing_strategy import SwingStrategy
-from .arbitrage_strategy import ArbitrageStrategy
+__all__ = list(_STRATEGY_MODULES)
 
-__all__ = [
-    'ScalpingStrategy',
-    'HFTStrategy', 
-    'PatternStrategy',
-    'SwingStrategy',
-    'ArbitrageStrategy'
-]
+def __getattr__(name):
+    if name in _STRATEGY_MODULES:
+        return getattr(importlib.import_module(_STRATEGY_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,13 +8,18 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+import time
+from analysis.correlation_engine import CorrelationEngine
+from analysis.triangular_scanner import TriangularArbitrageScanner
 from utils.logger import Logger
+from utils.ring_buffer import TickRing
 
 class ArbitrageStrategy:
     """Arbitrage strategy for price differences exploitation"""
     
     def __init__(self, params: Dict = None):
         self.name = "Arbitrage"
+        self.trigger = {'type': 'tick'}
         self.logger = Logger().get_logger()
         
         # Default parameters
@@ -22,12 +27,17 @@ class ArbitrageStrategy:
             'min_spread_pips': 2.0,
             'max_spread_pips': 10.0,
             'correlation_threshold': 0.8,
+            'correlation_window': 20,
+            'cointegration_window': 100,
+            'zscore_threshold': 2.0,
             'price_difference_threshold': 0.0001,
+            'max_cycle_legs': 4,
             'max_hold_time': 300,  # 5 minutes
             'symbols_pair': ['EURUSD', 'GBPUSD'],
             'volume': 0.01,
             'stop_loss_pips': 10,
-            'take_profit_pips': 5
+            'take_profit_pips': 5,
+            'history_size': 1000
         }
         
         if params:
@@ -35,10 +45,22 @@ class ArbitrageStrategy:
             
         self.active_opportunities = []
         self.correlation_data = {}
-        self.price_history = {}
+        self.price_history: Dict[str, TickRing] = {}
+        self.correlation_engine = CorrelationEngine(
+            window=self.params['correlation_window'],
+            cointegration_window=self.params['cointegration_window']
+        )
+        self.cycle_scanner = TriangularArbitrageScanner(
+            min_profit=self.params['price_difference_threshold'],
+            max_legs=self.params['max_cycle_legs']
+        )
         
         self.logger.info(f"Arbitrage strategy initialized with params: {self.params}")
     
+    def set_symbol_universe(self, symbols: List[str]):
+        """Build the currency graph for cross-pair arbitrage from all symbols"""
+        self.cycle_scanner.build(symbols)
+    
     def analyze_market(self, market_data: Dict) -> Dict[str, any]:
         """Analyze market for arbitrage opportunities"""
         try:
@@ -47,6 +69,10 @@ class ArbitrageStrategy:
             
             # Update price history
             self._update_price_history(market_data)
+            self.correlation_engine.update({
+                symbol: (data.get('bid', 0) + data.get('ask', 0)) / 2
+                for symbol, data in market_data.items()
+            })
             
             # Check for price discrepancies
             price_discrepancies = self._detect_price_discrepancies(market_data)
@@ -92,23 +118,16 @@ class ArbitrageStrategy:
     def _update_price_history(self, market_data: Dict):
         """Update price history for analysis"""
         try:
-            timestamp = datetime.now()
+            timestamp = time.time()
             
             for symbol, data in market_data.items():
-                if symbol not in self.price_history:
-                    self.price_history[symbol] = []
-                
-                # Add current price data
-                self.price_history[symbol].append({
-                    'timestamp': timestamp,
-                    'bid': data.get('bid', 0),
-                    'ask': data.get('ask', 0),
-                    'spread': data.get('ask', 0) - data.get('bid', 0)
-                })
+                history = self.price_history.get(symbol)
+                if history is None:
+                    history = TickRing(self.params['history_size'])
+                    self.price_history[symbol] = history
                 
-                # Keep only last 1000 entries
-                if len(self.price_history[symbol]) > 1000:
-                    self.price_history[symbol] = self.price_history[symbol][-1000:]
+                # O(1) write into the preallocated ring
+                history.append(timestamp, data.get('bid', 0), data.get('ask', 0))
                     
         except Exception as e:
             self.logger.error(f"Error updating price history: {e}")
@@ -122,10 +141,10 @@ class ArbitrageStrategy:
             for symbol, data in market_data.items():
                 current_spread = data.get('ask', 0) - data.get('bid', 0)
                 
-                if symbol in self.price_history and len(self.price_history[symbol]) > 10:
-                    # Calculate average spread
-                    recent_spreads = [h['spread'] for h in self.price_history[symbol][-10:]]
-                    avg_spread = np.mean(recent_spreads)
+                history = self.price_history.get(symbol)
+                if history is not None and len(history) > 10:
+                    # Calculate average spread over a zero-copy window
+                    avg_spread = history.window(history.spreads, 10).mean()
                     
                     # If current spread is unusually wide, it might be an opportunity
                     if current_spread > avg_spread * 2:
@@ -150,25 +169,22 @@ class ArbitrageStrategy:
         opportunities = []
         
         try:
-            symbols = list(market_data.keys())
-            
-            # Check pairs for correlation arbitrage
-            for i in range(len(symbols)):
-                for j in range(i + 1, len(symbols)):
-                    symbol1, symbol2 = symbols[i], symbols[j]
-                    
-                    # Calculate correlation if enough history
-                    if (symbol1 in self.price_history and symbol2 in self.price_history and
-                        len(self.price_history[symbol1]) > 20 and len(self.price_history[symbol2]) > 20):
-                        
-                        correlation = self._calculate_correlation(symbol1, symbol2)
-                        
-                        if abs(correlation) > self.params['correlation_threshold']:
-                            # Check if prices are diverging from correlation
-                            divergence = self._check_correlation_divergence(symbol1, symbol2, market_data)
-                            
-                            if divergence:
-                                opportunities.append(divergence)
+            # One vectorized pass over all pairs in the correlation engine
+            divergent = self.correlation_engine.divergent_pairs(
+                self.params['correlation_threshold'],
+                self.params['zscore_threshold']
+            )
+            
+            for symbol1, symbol2, correlation, zscore, hedge_ratio in divergent:
+                if symbol1 not in market_data or symbol2 not in market_data:
+                    continue
+                
+                divergence = self._check_correlation_divergence(
+                    symbol1, symbol2, market_data, correlation, zscore, hedge_ratio
+                )
+                
+                if divergence:
+                    opportunities.append(divergence)
                                 
         except Exception as e:
             self.logger.error(f"Error detecting correlation arbitrage: {e}")
@@ -176,50 +192,44 @@ class ArbitrageStrategy:
         return opportunities
     
     def _detect_cross_pair_arbitrage(self, market_data: Dict) -> List[Dict]:
-        """Detect triangular arbitrage opportunities"""
+        """Detect triangular (and 4-leg) arbitrage opportunities"""
         opportunities = []
         
         try:
-            # Example: EURUSD, GBPUSD, EURGBP
-            required_pairs = ['EURUSD', 'GBPUSD', 'EURGBP']
-            
-            if all(pair in market_data for pair in required_pairs):
-                eur_usd = market_data['EURUSD']
-                gbp_usd = market_data['GBPUSD']
-                eur_gbp = market_data['EURGBP']
-                
-                # Calculate synthetic EURGBP from EURUSD/GBPUSD
-                synthetic_eur_gbp = eur_usd.get('bid', 0) / gbp_usd.get('ask', 0)
-                actual_eur_gbp = eur_gbp.get('bid', 0)
-                
-                # Check for arbitrage opportunity
-                price_diff = abs(synthetic_eur_gbp - actual_eur_gbp)
+            # Fall back to the symbols we are fed if no universe was set
+            if not self.cycle_scanner.symbols:
+                self.cycle_scanner.build(list(market_data.keys()))
+            
+            changed = [
+                symbol for symbol, data in market_data.items()
+                if self.cycle_scanner.update(symbol, data.get('bid', 0), data.get('ask', 0))
+            ]
+            
+            # Several cycles can price the same leg; keep the most profitable
+            seen = set()
+            cycles = sorted(self.cycle_scanner.scan(changed), key=lambda c: c['profit'], reverse=True)
+            
+            for cycle in cycles:
+                symbol = cycle['symbol']
+                if (symbol, cycle['action']) in seen:
+                    continue
+                seen.add((symbol, cycle['action']))
+                entry_price = cycle['entry_price']
+                fair_price = cycle['fair_price']
+                pip_size = 0.01 if 'JPY' in symbol else 0.0001
+                sl_distance = self.params['stop_loss_pips'] * pip_size
                 
-                if price_diff > self.params['price_difference_threshold']:
-                    if synthetic_eur_gbp > actual_eur_gbp:
-                        # Buy EURGBP, sell synthetic
-                        opportunities.append({
-                            'type': 'triangular_arbitrage',
-                            'symbol': 'EURGBP',
-                            'action': 'buy',
-                            'confidence': 0.8,
-                            'entry_price': actual_eur_gbp,
-                            'stop_loss': actual_eur_gbp - (self.params['stop_loss_pips'] * 0.0001),
-                            'take_profit': synthetic_eur_gbp,
-                            'expected_profit_pips': price_diff * 10000
-                        })
-                    else:
-                        # Sell EURGBP, buy synthetic
-                        opportunities.append({
-                            'type': 'triangular_arbitrage',
-                            'symbol': 'EURGBP',
-                            'action': 'sell',
-                            'confidence': 0.8,
-                            'entry_price': actual_eur_gbp,
-                            'stop_loss': actual_eur_gbp + (self.params['stop_loss_pips'] * 0.0001),
-                            'take_profit': synthetic_eur_gbp,
-                            'expected_profit_pips': price_diff * 10000
-                        })
+                opportunities.append({
+                    'type': 'triangular_arbitrage',
+                    'symbol': symbol,
+                    'action': cycle['action'],
+                    'confidence': 0.8,
+                    'entry_price': entry_price,
+                    'stop_loss': entry_price - sl_distance if cycle['action'] == 'buy' else entry_price + sl_distance,
+                    'take_profit': fair_price,
+                    'expected_profit_pips': abs(fair_price - entry_price) / pip_size,
+                    'legs': cycle['legs']
+                })
                         
         except Exception as e:
             self.logger.error(f"Error detecting cross pair arbitrage: {e}")
@@ -228,67 +238,32 @@ class ArbitrageStrategy:
     
     def _calculate_correlation(self, symbol1: str, symbol2: str) -> float:
         """Calculate price correlation between two symbols"""
-        try:
-            if (symbol1 not in self.price_history or symbol2 not in self.price_history or
-                len(self.price_history[symbol1]) < 20 or len(self.price_history[symbol2]) < 20):
-                return 0.0
-            
-            # Get last 20 mid prices for each symbol
-            prices1 = [(h['bid'] + h['ask']) / 2 for h in self.price_history[symbol1][-20:]]
-            prices2 = [(h['bid'] + h['ask']) / 2 for h in self.price_history[symbol2][-20:]]
-            
-            # Calculate percentage changes
-            changes1 = np.diff(prices1) / prices1[:-1]
-            changes2 = np.diff(prices2) / prices2[:-1]
-            
-            # Calculate correlation
-            correlation = np.corrcoef(changes1, changes2)[0, 1]
-            
-            return correlation if not np.isnan(correlation) else 0.0
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating correlation: {e}")
-            return 0.0
+        return self.correlation_engine.correlation(symbol1, symbol2)
     
-    def _check_correlation_divergence(self, symbol1: str, symbol2: str, market_data: Dict) -> Optional[Dict]:
-        """Check if correlated pairs are diverging"""
+    def _check_correlation_divergence(self, symbol1: str, symbol2: str, market_data: Dict,
+                                      correlation: float, zscore: float,
+                                      hedge_ratio: float) -> Optional[Dict]:
+        """Build an opportunity from a diverged spread between correlated pairs"""
         try:
-            correlation = self._calculate_correlation(symbol1, symbol2)
-            
-            if abs(correlation) < self.params['correlation_threshold']:
-                return None
+            # Positive z-score: symbol1 is rich against its hedge in symbol2
+            action = 'sell' if zscore > 0 else 'buy'
+            data = market_data[symbol1]
+            entry_price = data['bid'] if action == 'sell' else data['ask']
+            direction = -1 if action == 'sell' else 1
             
-            # Get current price changes
-            if (len(self.price_history[symbol1]) > 1 and len(self.price_history[symbol2]) > 1):
-                
-                # Calculate recent price movements
-                price1_change = ((market_data[symbol1]['bid'] + market_data[symbol1]['ask']) / 2 - 
-                               (self.price_history[symbol1][-2]['bid'] + self.price_history[symbol1][-2]['ask']) / 2)
-                
-                price2_change = ((market_data[symbol2]['bid'] + market_data[symbol2]['ask']) / 2 - 
-                               (self.price_history[symbol2][-2]['bid'] + self.price_history[symbol2][-2]['ask']) / 2)
-                
-                # Check if movements are diverging from expected correlation
-                expected_direction = 1 if correlation > 0 else -1
-                actual_direction = 1 if (price1_change * price2_change) > 0 else -1
-                
-                if expected_direction != actual_direction and abs(price1_change) > self.params['price_difference_threshold']:
-                    # Arbitrage opportunity detected
-                    stronger_symbol = symbol1 if abs(price1_change) > abs(price2_change) else symbol2
-                    weaker_symbol = symbol2 if stronger_symbol == symbol1 else symbol1
-                    
-                    return {
-                        'type': 'correlation_divergence',
-                        'symbol': weaker_symbol,
-                        'action': 'buy' if price1_change < 0 else 'sell',
-                        'confidence': min(0.9, abs(correlation)),
-                        'entry_price': market_data[weaker_symbol]['ask' if price1_change < 0 else 'bid'],
-                        'stop_loss': market_data[weaker_symbol]['ask' if price1_change < 0 else 'bid'] * (1 + (self.params['stop_loss_pips'] * 0.0001)),
-                        'take_profit': market_data[weaker_symbol]['ask' if price1_change < 0 else 'bid'] * (1 + (self.params['take_profit_pips'] * 0.0001)),
-                        'expected_profit_pips': self.params['take_profit_pips']
-                    }
-                    
-            return None
+            return {
+                'type': 'correlation_divergence',
+                'symbol': symbol1,
+                'hedge_symbol': symbol2,
+                'hedge_ratio': hedge_ratio,
+                'zscore': zscore,
+                'action': action,
+                'confidence': min(0.9, abs(correlation)),
+                'entry_price': entry_price,
+                'stop_loss': entry_price - direction * (self.params['stop_loss_pips'] * 0.0001),
+                'take_profit': entry_price + direction * (self.params['take_profit_pips'] * 0.0001),
+                'expected_profit_pips': self.params['take_profit_pips']
+            }
             
         except Exception as e:
             self.logger.error(f"Error checking correlation divergence: {e}")
@@ -386,54 +361,7 @@ class ArbitrageStrategy:
             'profit_target': f"{self.params['take_profit_pips']} pips",
             'stop_loss': f"{self.params['stop_loss_pips']} pips",
             'active_opportunities': len(self.active_opportunities),
-            'pairs_monitored': self.params['symbols_pair']
-        }
-"""
-Arbitrage Strategy for AuraTrade Bot
-Price difference exploitation strategy
-"""
-
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Any, Optional
-from utils.logger import Logger
-
-class ArbitrageStrategy:
-    """Arbitrage trading strategy"""
-    
-    def __init__(self):
-        self.logger = Logger().get_logger()
-        self.name = "Arbitrage"
-        self.timeframe = "M1"
-        
-        # Strategy parameters
-        self.max_spread = 2.0
-        self.tp_pips = 5
-        self.sl_pips = 10
-        
-        self.logger.info("Arbitrage Strategy initialized")
-    
-    def analyze(self, symbol: str, rates: pd.DataFrame, tick: Dict) -> Optional[Dict]:
-        """Analyze arbitrage opportunities"""
-        try:
-            if len(rates) < 10:
-                return None
-            
-            # Basic arbitrage logic placeholder
-            return None  # Requires multiple brokers
-            
-        except Exception as e:
-            self.logger.error(f"Error in arbitrage analysis: {e}")
-            return None
-    
-    def get_strategy_info(self) -> Dict[str, Any]:
-        """Get strategy information"""
-        return {
-            'name': self.name,
-            'timeframe': self.timeframe,
-            'tp_pips': self.tp_pips,
-            'sl_pips': self.sl_pips,
-            'max_spread': self.max_spread,
-            'risk_level': 'Low',
-            'description': 'Arbitrage trading strategy'
+            'pairs_monitored': self.params['symbols_pair'],
+            'correlation_engine': self.correlation_engine.get_status(),
+            'cycle_scanner': self.cycle_scanner.get_status()
         }
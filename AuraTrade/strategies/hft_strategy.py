@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import time
 from utils.logger import Logger
+from utils.ring_buffer import TickRing
 
 class HFTStrategy:
     """High-Frequency Trading Strategy with ultra-fast execution"""
@@ -16,6 +17,7 @@ class HFTStrategy:
     def __init__(self):
         self.logger = Logger().get_logger()
         self.name = "HFT"
+        self.trigger = {'type': 'tick', 'timeframe': 'M1'}
 
         # Strategy parameters
         self.min_price_movement = 0.00005  # 0.5 pips minimum movement
@@ -23,9 +25,13 @@ class HFTStrategy:
         self.scalp_target = 0.0001  # 1 pip target
         self.stop_loss = 0.00005   # 0.5 pip stop loss
 
-        # Tick analysis
-        self.tick_buffer = []
+        # Tick analysis (one preallocated ring per symbol)
+        self.tick_states: Dict[str, TickRing] = {}
         self.max_buffer_size = 100
+        self.velocity_window = 10
+
+        # EMA weight vectors keyed by (period, length)
+        self._ema_weights: Dict[tuple, np.ndarray] = {}
 
         # Performance tracking
         self.trades_count = 0
@@ -40,13 +46,13 @@ class HFTStrategy:
                 return None
 
             # Add current tick to buffer
-            self._update_tick_buffer(tick)
+            self._update_tick_buffer(symbol, tick)
 
             # Quick momentum analysis
             momentum_signal = self._analyze_momentum(rates)
 
             # Tick velocity analysis
-            velocity_signal = self._analyze_tick_velocity()
+            velocity_signal = self._analyze_tick_velocity(symbol)
 
             # Spread analysis
             spread_ok = self._check_spread(tick, symbol)
@@ -66,21 +72,16 @@ class HFTStrategy:
             self.logger.error(f"Error in HFT analysis for {symbol}: {e}")
             return None
 
-    def _update_tick_buffer(self, tick: Dict):
-        """Update tick buffer for velocity analysis"""
+    def _update_tick_buffer(self, symbol: str, tick: Dict):
+        """Update the symbol's tick ring for velocity analysis"""
         try:
-            tick_data = {
-                'timestamp': datetime.now(),
-                'bid': tick.get('bid', 0),
-                'ask': tick.get('ask', 0),
-                'spread': tick.get('ask', 0) - tick.get('bid', 0)
-            }
+            state = self.tick_states.get(symbol)
+            if state is None:
+                state = TickRing(self.max_buffer_size)
+                self.tick_states[symbol] = state
 
-            self.tick_buffer.append(tick_data)
-
-            # Keep buffer size manageable
-            if len(self.tick_buffer) > self.max_buffer_size:
-                self.tick_buffer.pop(0)
+            timestamp = tick.get('time') or time.time()
+            state.append(float(timestamp), tick.get('bid', 0), tick.get('ask', 0))
 
         except Exception as e:
             self.logger.error(f"Error updating tick buffer: {e}")
@@ -92,16 +93,13 @@ class HFTStrategy:
                 return {'action': 'hold', 'confidence': 0}
 
             # Calculate short-term EMAs
-            closes = rates['close'].values
-            ema_3 = self._calculate_ema(closes, 3)
-            ema_5 = self._calculate_ema(closes, 5)
-            ema_8 = self._calculate_ema(closes, 8)
+            closes = rates['close'].values.astype(np.float64, copy=False)
+            current_ema3 = self._calculate_ema(closes, 3)
+            current_ema5 = self._calculate_ema(closes, 5)
+            current_ema8 = self._calculate_ema(closes, 8)
 
             # Current values
             current_price = closes[-1]
-            current_ema3 = ema_3[-1]
-            current_ema5 = ema_5[-1]
-            current_ema8 = ema_8[-1]
 
             # Momentum signals
             momentum_up = (current_ema3 > current_ema5 > current_ema8 and 
@@ -131,34 +129,23 @@ class HFTStrategy:
             self.logger.error(f"Error in momentum analysis: {e}")
             return {'action': 'hold', 'confidence': 0}
 
-    def _analyze_tick_velocity(self) -> Dict:
+    def _analyze_tick_velocity(self, symbol: str) -> Dict:
         """Analyze tick-by-tick velocity"""
         try:
-            if len(self.tick_buffer) < 10:
+            state = self.tick_states.get(symbol)
+            if state is None or len(state) < self.velocity_window:
                 return {'action': 'hold', 'confidence': 0}
 
-            # Calculate price changes
-            recent_ticks = self.tick_buffer[-10:]
-            price_changes = []
-
-            for i in range(1, len(recent_ticks)):
-                mid_price_prev = (recent_ticks[i-1]['bid'] + recent_ticks[i-1]['ask']) / 2
-                mid_price_curr = (recent_ticks[i]['bid'] + recent_ticks[i]['ask']) / 2
-                change = mid_price_curr - mid_price_prev
-                price_changes.append(change)
-
-            if not price_changes:
-                return {'action': 'hold', 'confidence': 0}
+            # Mid-price changes over the recent window (view, no copy)
+            mids = state.window(state.mids, self.velocity_window)
+            price_changes = np.diff(mids)
 
             # Velocity metrics
-            avg_change = np.mean(price_changes)
-            velocity = np.std(price_changes)
-
-            # Direction consistency
-            positive_moves = sum(1 for x in price_changes if x > 0)
-            negative_moves = sum(1 for x in price_changes if x < 0)
+            avg_change = price_changes.mean()
+            velocity = price_changes.std()
 
-            direction_strength = abs(positive_moves - negative_moves) / len(price_changes)
+            # Direction consistency: |#up - #down| / #changes
+            direction_strength = abs(np.sign(price_changes).sum()) / price_changes.size
 
             # Strong upward velocity
             if avg_change > self.min_price_movement and direction_strength > 0.6:
@@ -266,21 +253,27 @@ class HFTStrategy:
             self.logger.error(f"Error generating trade signal: {e}")
             return None
 
-    def _calculate_ema(self, data: np.ndarray, period: int) -> np.ndarray:
-        """Calculate Exponential Moving Average"""
-        try:
-            alpha = 2 / (period + 1)
-            ema = np.zeros_like(data)
-            ema[0] = data[0]
+    def _calculate_ema(self, data: np.ndarray, period: int) -> float:
+        """Calculate the latest Exponential Moving Average value
 
-            for i in range(1, len(data)):
-                ema[i] = alpha * data[i] + (1 - alpha) * ema[i-1]
+        Equivalent to the recursive EMA seeded with ``data[0]``, expressed
+        as a single dot product with a cached weight vector.
+        """
+        try:
+            n = len(data)
+            key = (period, n)
+            weights = self._ema_weights.get(key)
+            if weights is None:
+                alpha = 2 / (period + 1)
+                weights = alpha * (1 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+                weights[0] = (1 - alpha) ** (n - 1)
+                self._ema_weights[key] = weights
 
-            return ema
+            return float(np.dot(weights, data))
 
         except Exception as e:
             self.logger.error(f"Error calculating EMA: {e}")
-            return np.zeros_like(data)
+            return 0.0
 
     def get_signals(self, rates: pd.DataFrame, indicators: Dict, tick: Dict) -> List[Dict]:
         """Get trading signals (interface compatibility)"""
@@ -311,129 +304,5 @@ class HFTStrategy:
         """Reset strategy statistics"""
         self.trades_count = 0
         self.winning_trades = 0
-        self.tick_buffer.clear()
+        self.tick_states.clear()
         self.logger.info("HFT strategy statistics reset")
-"""
-High Frequency Trading Strategy for AuraTrade Bot
-Ultra-fast trading strategy for quick profits
-"""
-
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-from utils.logger import Logger
-
-class HFTStrategy:
-    """High Frequency Trading strategy"""
-    
-    def __init__(self):
-        self.logger = Logger().get_logger()
-        self.name = "HFT"
-        self.timeframe = "M1"
-        
-        # Strategy parameters
-        self.max_spread = 1.5  # Very tight spread requirement
-        self.tp_pips = 3       # Quick profit target
-        self.sl_pips = 5       # Tight stop loss
-        
-        # Momentum parameters
-        self.momentum_period = 5
-        self.volatility_threshold = 0.001
-        
-        self.logger.info("HFT Strategy initialized")
-    
-    def analyze(self, symbol: str, rates: pd.DataFrame, tick: Dict) -> Optional[Dict]:
-        """Analyze market for HFT opportunities"""
-        try:
-            if len(rates) < 20:
-                return None
-            
-            # Check spread first
-            spread = self._calculate_spread(tick, symbol)
-            if spread > self.max_spread:
-                return None
-            
-            # Check volatility
-            volatility = self._calculate_volatility(rates)
-            if volatility < self.volatility_threshold:
-                return None
-            
-            # Look for momentum signals
-            signal = self._detect_momentum(rates, tick)
-            
-            return signal
-            
-        except Exception as e:
-            self.logger.error(f"Error in HFT analysis: {e}")
-            return None
-    
-    def _calculate_spread(self, tick: Dict, symbol: str) -> float:
-        """Calculate spread in pips"""
-        try:
-            spread = tick['ask'] - tick['bid']
-            if 'JPY' in symbol:
-                return spread * 100
-            else:
-                return spread * 10000
-        except:
-            return 999
-    
-    def _calculate_volatility(self, rates: pd.DataFrame) -> float:
-        """Calculate recent volatility"""
-        try:
-            returns = rates['close'].pct_change().tail(10)
-            return returns.std()
-        except:
-            return 0
-    
-    def _detect_momentum(self, rates: pd.DataFrame, tick: Dict) -> Optional[Dict]:
-        """Detect momentum for HFT"""
-        try:
-            close_prices = rates['close'].tail(self.momentum_period)
-            
-            # Check for strong momentum
-            if len(close_prices) < self.momentum_period:
-                return None
-            
-            price_change = (close_prices.iloc[-1] - close_prices.iloc[0]) / close_prices.iloc[0]
-            
-            # Strong upward momentum
-            if price_change > 0.0005:  # 0.05% move
-                return {
-                    'action': 'buy',
-                    'confidence': 0.7,
-                    'tp_pips': self.tp_pips,
-                    'sl_pips': self.sl_pips,
-                    'volume': 0.01,
-                    'reason': f'Strong upward momentum: {price_change:.4%}'
-                }
-            
-            # Strong downward momentum
-            elif price_change < -0.0005:
-                return {
-                    'action': 'sell',
-                    'confidence': 0.7,
-                    'tp_pips': self.tp_pips,
-                    'sl_pips': self.sl_pips,
-                    'volume': 0.01,
-                    'reason': f'Strong downward momentum: {price_change:.4%}'
-                }
-            
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error detecting momentum: {e}")
-            return None
-    
-    def get_strategy_info(self) -> Dict[str, Any]:
-        """Get strategy information"""
-        return {
-            'name': self.name,
-            'timeframe': self.timeframe,
-            'tp_pips': self.tp_pips,
-            'sl_pips': self.sl_pips,
-            'max_spread': self.max_spread,
-            'risk_level': 'Very High',
-            'description': 'High frequency trading with momentum detection'
-        }
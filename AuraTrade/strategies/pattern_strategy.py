@@ -9,6 +9,7 @@ import numpy as np
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from utils.logger import Logger
+from analysis.swing_points import swing_detector
 
 class PatternStrategy:
     """Advanced pattern recognition strategy"""
@@ -504,14 +505,9 @@ class PatternStrategy:
             if len(rates) < 30:
                 return None
             
-            highs = rates['high'].tail(30)
-            
             # Find local maxima
-            peaks = []
-            for i in range(2, len(highs) - 2):
-                if (highs.iloc[i] > highs.iloc[i-1] and highs.iloc[i] > highs.iloc[i-2] and
-                    highs.iloc[i] > highs.iloc[i+1] and highs.iloc[i] > highs.iloc[i+2]):
-                    peaks.append((i, highs.iloc[i]))
+            points = swing_detector.swings(rates, order=2, lookback=30)
+            peaks = list(zip(points.high_indices, points.high_values))
             
             if len(peaks) >= 3:
                 # Check if middle peak is highest (head)
@@ -548,11 +544,9 @@ class PatternStrategy:
             max_high = highs.max()
             peak_threshold = max_high * 0.98
             
-            peaks = []
-            for i in range(2, len(highs) - 2):
-                if (highs.iloc[i] > highs.iloc[i-1] and highs.iloc[i] > highs.iloc[i+1] and
-                    highs.iloc[i] >= peak_threshold):
-                    peaks.append((i, highs.iloc[i]))
+            points = swing_detector.swings(rates, order=1, lookback=20, edge=2)
+            near_max = points.high_values >= peak_threshold
+            peaks = list(zip(points.high_indices[near_max], points.high_values[near_max]))
             
             if len(peaks) == 2:
                 peak1, peak2 = peaks
@@ -802,6 +796,7 @@ class PatternStrategy:
         self.logger = Logger().get_logger()
         self.name = "Pattern"
         self.timeframe = "M5"
+        self.trigger = {'type': 'bar_close', 'timeframe': 'M5'}
         
         # Strategy parameters
         self.max_spread = 4.0
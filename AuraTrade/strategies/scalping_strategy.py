@@ -383,6 +383,8 @@ class ScalpingStrategy:
         self.logger = Logger().get_logger()
         self.name = "Scalping"
         self.timeframe = "M1"
+        # Re-evaluated when price moves 0.3 x ATR(M1) since the last run
+        self.trigger = {'type': 'atr_move', 'timeframe': 'M1', 'atr_multiple': 0.3}
         self.min_spread = 0.5  # Max spread in pips
         self.max_spread = 3.0
         
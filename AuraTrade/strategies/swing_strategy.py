@@ -486,6 +486,7 @@ class SwingStrategy:
         self.logger = Logger().get_logger()
         self.name = "Swing"
         self.timeframe = "H1"
+        self.trigger = {'type': 'bar_close', 'timeframe': 'H1'}
         
         # Strategy parameters
         self.max_spread = 5.0
@@ -0,0 +1,9 @@
+"""
+Test configuration for AuraTrade Bot
+Puts the AuraTrade directory on sys.path so tests import modules the way bot.py does
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
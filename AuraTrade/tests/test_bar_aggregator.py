@@ -0,0 +1,120 @@
+"""
+Tests for local multi-timeframe bars against pandas resampling
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.bar_aggregator import BAR_FIELDS, MultiTimeframeAggregator
+
+AGG = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'tick_volume': 'sum',
+    'spread': 'last',
+    'real_volume': 'sum'
+}
+
+def make_m1(start: str, minutes: int, seed: int = 3) -> pd.DataFrame:
+    """Random-walk M1 rates in MT5 layout (time index, BAR_FIELDS columns)"""
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-4, minutes))
+    open_ = np.concatenate([[1.1], close[:-1]])
+    wick = np.abs(rng.normal(0, 5e-5, (2, minutes)))
+    rates = pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + wick[0],
+        'low': np.minimum(open_, close) - wick[1],
+        'close': close,
+        'tick_volume': rng.integers(10, 200, minutes),
+        'spread': rng.integers(5, 20, minutes),
+        'real_volume': np.zeros(minutes, dtype=np.int64)
+    }, index=pd.date_range(start, periods=minutes, freq='min'))
+    rates.index.name = 'time'
+    return rates
+
+def resample(m1: pd.DataFrame, rule: str) -> pd.DataFrame:
+    return m1.resample(rule).agg(AGG).dropna()
+
+def assert_bars_equal(actual: pd.DataFrame, expected: pd.DataFrame):
+    assert list(actual.index) == list(expected.index)
+    np.testing.assert_allclose(actual[list(BAR_FIELDS)].values, expected[list(BAR_FIELDS)].values.astype(np.float64))
+
+@pytest.mark.parametrize('timeframe,rule', [('M5', '5min'), ('H1', '60min')])
+def test_streamed_bars_match_resample(timeframe, rule):
+    m1 = make_m1('2024-03-04 00:00', 4 * 60 + 17)
+    aggregator = MultiTimeframeAggregator()
+    aggregator.sync_m1('EURUSD', m1)
+
+    expected = resample(m1, rule)
+    actual = aggregator.get_rates('EURUSD', timeframe, len(expected))
+
+    # Closed buckets and the forming one (which includes the forming M1 bar)
+    assert_bars_equal(actual, expected)
+
+@pytest.mark.parametrize('timeframe,rule', [('M5', '5min'), ('H1', '60min')])
+def test_mid_bucket_start_skips_incomplete_first_bucket(timeframe, rule):
+    m1 = make_m1('2024-03-04 00:02', 3 * 60 + 30)
+    aggregator = MultiTimeframeAggregator()
+    aggregator.sync_m1('EURUSD', m1)
+
+    expected = resample(m1, rule).iloc[1:]
+    actual = aggregator.get_rates('EURUSD', timeframe, len(expected))
+
+    assert_bars_equal(actual, expected)
+    assert aggregator.get_rates('EURUSD', timeframe, len(expected) + 1) is None
+
+def test_bucket_rollover_emits_each_closed_bar_once():
+    m1 = make_m1('2024-03-04 00:00', 31)
+    aggregator = MultiTimeframeAggregator(('M1', 'M5'))
+
+    events = []
+    for bar_time, row in m1.iterrows():
+        events += aggregator.update_bar('EURUSD', bar_time, *row[list(BAR_FIELDS)], closed=True)
+        # Repeating a closed bar is ignored
+        events += aggregator.update_bar('EURUSD', bar_time, *row[list(BAR_FIELDS)], closed=True)
+
+    m5_times = [pd.to_datetime(t, unit='s') for _, tf, t, _ in events if tf == 'M5']
+    # 00:30 has opened, so 00:00..00:25 are closed
+    assert m5_times == list(pd.date_range('2024-03-04 00:00', periods=6, freq='5min'))
+    assert sum(1 for _, tf, _, _ in events if tf == 'M1') == len(m1)
+
+def test_forming_bar_is_merged_not_double_counted():
+    m1 = make_m1('2024-03-04 00:00', 12)
+    aggregator = MultiTimeframeAggregator(('M1', 'M5'))
+    aggregator.sync_m1('EURUSD', m1.iloc[:-1])   # 00:10 is forming
+
+    forming_time = m1.index[-2]
+    first = m1.iloc[-2]
+    # A later tick-built update of the same minute extends the bar
+    aggregator.update_bar('EURUSD', forming_time, first['close'], first['high'] + 1e-4, first['low'],
+                          first['close'] + 5e-5, 3, first['spread'], closed=False)
+
+    bars = aggregator.get_rates('EURUSD', 'M5', 3)
+    assert bars.index[-1] == pd.Timestamp('2024-03-04 00:10')
+    assert bars['open'].iloc[-1] == first['open']
+    assert bars['high'].iloc[-1] == pytest.approx(first['high'] + 1e-4)
+    assert bars['tick_volume'].iloc[-1] == first['tick_volume']
+
+    # Closing the minute folds it into M5 exactly once
+    aggregator.sync_m1('EURUSD', m1)
+    expected = resample(m1, '5min')
+    assert_bars_equal(aggregator.get_rates('EURUSD', 'M5', len(expected)), expected)
+
+def test_backfill_takes_only_bars_before_the_current_bucket():
+    m1 = make_m1('2024-03-04 00:00', 10 * 60)
+    streamed = m1.loc['2024-03-04 07:20':]     # local stream starts mid-hour
+    aggregator = MultiTimeframeAggregator()
+    aggregator.sync_m1('EURUSD', streamed)
+
+    # Broker H1 history overlaps the locally built 08:00 and 09:00 buckets
+    broker_h1 = resample(m1, '60min')
+    broker_h1.loc['2024-03-04 09:00', 'tick_volume'] = -1   # must not be taken
+    aggregator.backfill('EURUSD', 'H1', broker_h1)
+
+    expected = resample(m1, '60min')
+    actual = aggregator.get_rates('EURUSD', 'H1', len(expected))
+    assert_bars_equal(actual, expected)
@@ -0,0 +1,56 @@
+"""
+Parity tests for flat tree-ensemble inference against sklearn
+"""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+
+from utils.tree_inference import FlatTreeEnsemble, compile_ensemble
+
+def make_data(n_classes: int, n_rows: int = 600, n_features: int = 12, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, n_features))
+    score = X[:, 0] + 0.5 * X[:, 1] * X[:, 2] - 0.3 * X[:, 3] + rng.normal(scale=0.5, size=n_rows)
+    edges = np.quantile(score, np.linspace(0, 1, n_classes + 1)[1:-1])
+    y = np.digitize(score, edges)
+    return X, y
+
+MODELS = [
+    ('random_forest', 2, lambda: RandomForestClassifier(n_estimators=50, max_depth=8, random_state=0)),
+    ('random_forest_3class', 3, lambda: RandomForestClassifier(n_estimators=30, random_state=0)),
+    ('gbm_binary', 2, lambda: GradientBoostingClassifier(n_estimators=60, max_depth=3, random_state=0)),
+    ('gbm_3class', 3, lambda: GradientBoostingClassifier(n_estimators=40, max_depth=3, random_state=0)),
+]
+
+@pytest.mark.parametrize('name,n_classes,factory', MODELS, ids=[m[0] for m in MODELS])
+def test_predict_proba_matches_sklearn(name, n_classes, factory):
+    X, y = make_data(n_classes)
+    model = factory().fit(X[:400], y[:400])
+    X_test = X[400:]
+
+    flat = FlatTreeEnsemble(model)
+
+    expected = model.predict_proba(X_test)
+    actual = flat.predict_proba(X_test)
+    assert actual.shape == expected.shape
+    assert np.allclose(actual, expected)
+    assert np.array_equal(flat.predict(X_test), model.predict(X_test))
+
+def test_single_row_matches_sklearn():
+    X, y = make_data(2)
+    model = GradientBoostingClassifier(n_estimators=20, random_state=0).fit(X, y)
+
+    flat = FlatTreeEnsemble(model)
+
+    assert np.allclose(flat.predict_proba(X[0]), model.predict_proba(X[:1]))
+
+def test_compile_ensemble_rejects_unsupported_model():
+    X, y = make_data(2)
+
+    class NotATree:
+        classes_ = np.array([0, 1])
+        n_features_in_ = X.shape[1]
+
+    assert compile_ensemble(None, X[:5]) is None
+    assert compile_ensemble(NotATree(), X[:5]) is None
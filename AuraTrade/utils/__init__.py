@@ -1,18 +1,17 @@
 
-"""
-Utility modules for AuraTrade Bot
-Logger, notifier, and helper functions
-"""
-
-from .logger import Logger
-from .notifier import TelegramNotifier
-
-__all__ = ['Logger', 'TelegramNotifier']
 """
 Utility modules for AuraTrade Bot
 Logger, ML engine, notifications, and helper functions
 """
 
-from .logger import Logger, log_trade, log_error, log_system
+from .logger import Logger, configure_logging, log_trade, log_error, log_info, log_system
+
+__all__ = ['Logger', 'configure_logging', 'log_trade', 'log_error', 'log_info', 'log_system',
+           'TelegramNotifier']
 
-__all__ = ['Logger', 'log_trade', 'log_error', 'log_system']
+def __getattr__(name):
+    # The notifier pulls in requests/smtplib; load it only when used
+    if name == 'TelegramNotifier':
+        from .notifier import TelegramNotifier
+        return TelegramNotifier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
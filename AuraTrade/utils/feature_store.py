@@ -0,0 +1,221 @@
+"""
+Incremental Feature Store for AuraTrade Bot
+Streaming indicator state and fixed-size feature matrices per symbol/timeframe
+"""
+
+import numpy as np
+import pandas as pd
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+class StreamingFeatures:
+    """Streaming indicator state producing one MLEngine feature row per bar
+
+    Mirrors ``MLEngine.prepare_features`` (pandas adjusted EWMs, simple
+    rolling windows, sample standard deviations) but only touches the newest
+    bar, so each update costs O(features) instead of O(bars x features).
+    """
+
+    def __init__(self, rsi_period: int = 14, bb_period: int = 20, volume_period: int = 20,
+                 volatility_period: int = 20, momentum_period: int = 10):
+        self.rsi_period = rsi_period
+        self.bb_period = bb_period
+        self.volume_period = volume_period
+        self.volatility_period = volatility_period
+        self.momentum_period = momentum_period
+
+        self.closes = deque(maxlen=max(bb_period, momentum_period + 1))
+        self.gains = deque(maxlen=rsi_period)
+        self.losses = deque(maxlen=rsi_period)
+        self.volumes = deque(maxlen=volume_period)
+        self.price_changes = deque(maxlen=volatility_period)
+
+        # Adjusted EWM state: (numerator, denominator) per span
+        self.ewm_state: Dict[int, Tuple[float, float]] = {12: (0.0, 0.0), 26: (0.0, 0.0)}
+        self.bars = 0
+
+    def _ewm(self, span: int, value: float) -> float:
+        """Update an adjusted EWM (pandas ``adjust=True``) and return it"""
+        decay = 1 - 2 / (span + 1)
+        num, den = self.ewm_state[span]
+        num = value + decay * num
+        den = 1.0 + decay * den
+        self.ewm_state[span] = (num, den)
+        return num / den
+
+    @staticmethod
+    def _rolling_mean(values: deque, period: int) -> float:
+        if len(values) < period:
+            return np.nan
+        return float(np.mean(values))
+
+    @staticmethod
+    def _rolling_std(values: deque, period: int) -> float:
+        if len(values) < period:
+            return np.nan
+        return float(np.std(np.fromiter(values, dtype=np.float64), ddof=1))
+
+    def update(self, close: float, tick_volume: float) -> Dict[str, float]:
+        """Consume one closed bar and return its feature values"""
+        prev_close = self.closes[-1] if self.closes else None
+
+        # RSI inputs (the first bar contributes a zero gain/loss, as in pandas)
+        delta = close - prev_close if prev_close is not None else 0.0
+        self.gains.append(delta if delta > 0 else 0.0)
+        self.losses.append(-delta if delta < 0 else 0.0)
+
+        price_change = close / prev_close - 1 if prev_close else np.nan
+        if prev_close is not None:
+            self.price_changes.append(price_change)
+
+        momentum_base = (self.closes[-self.momentum_period]
+                         if len(self.closes) >= self.momentum_period else None)
+        momentum = close / momentum_base - 1 if momentum_base else np.nan
+
+        self.closes.append(close)
+        self.volumes.append(tick_volume)
+        self.bars += 1
+
+        avg_gain = self._rolling_mean(self.gains, self.rsi_period)
+        avg_loss = self._rolling_mean(self.losses, self.rsi_period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - 100 / (1 + np.float64(avg_gain) / np.float64(avg_loss))
+
+        ema_fast = self._ewm(12, close)
+        ema_slow = self._ewm(26, close)
+
+        bb_window = list(self.closes)[-self.bb_period:]
+        if len(bb_window) < self.bb_period:
+            bb_middle = bb_std = np.nan
+        else:
+            bb_middle = float(np.mean(bb_window))
+            bb_std = float(np.std(bb_window, ddof=1))
+
+        return {
+            'rsi': float(rsi),
+            'macd': ema_fast - ema_slow,
+            'bb_upper': bb_middle + 2 * bb_std,
+            'bb_lower': bb_middle - 2 * bb_std,
+            'ema_fast': ema_fast,
+            'ema_slow': ema_slow,
+            'volume_ma': self._rolling_mean(self.volumes, self.volume_period),
+            'price_change': price_change,
+            'volatility': self._rolling_std(self.price_changes, self.volatility_period),
+            'momentum': momentum,
+            'close': close
+        }
+
+class FeatureStore:
+    """Per-(symbol, timeframe) store of ready-to-use feature rows
+
+    Rows are kept in a fixed-size matrix written twice (at ``i`` and
+    ``i + capacity``) so the latest ``n`` rows are always a contiguous,
+    zero-copy view for inference or retraining.
+    """
+
+    def __init__(self, features: List[str], capacity: int = 1000, min_bars: int = 50):
+        self.features = list(features)
+        self.capacity = capacity
+        self.min_bars = min_bars  # same warm-up as MLEngine.prepare_features
+
+        self.states: Dict[Tuple[str, str], StreamingFeatures] = {}
+        self.matrices: Dict[Tuple[str, str], np.ndarray] = {}
+        self.closes: Dict[Tuple[str, str], np.ndarray] = {}
+        self.times: Dict[Tuple[str, str], np.ndarray] = {}
+        self.heads: Dict[Tuple[str, str], int] = {}
+        self.counts: Dict[Tuple[str, str], int] = {}
+        self.last_bar_time: Dict[Tuple[str, str], pd.Timestamp] = {}
+
+    def _ensure(self, key: Tuple[str, str]):
+        if key not in self.states:
+            self.states[key] = StreamingFeatures()
+            self.matrices[key] = np.zeros((2 * self.capacity, len(self.features)))
+            self.closes[key] = np.zeros(2 * self.capacity)
+            self.times[key] = np.zeros(2 * self.capacity, dtype='datetime64[ns]')
+            self.heads[key] = 0
+            self.counts[key] = 0
+
+    def push_bar(self, symbol: str, timeframe: str, bar_time, close: float, tick_volume: float) -> bool:
+        """Append the feature row of one closed bar; returns True if a row was stored"""
+        key = (symbol, timeframe)
+        self._ensure(key)
+
+        bar_time = pd.Timestamp(bar_time)
+        last_time = self.last_bar_time.get(key)
+        if last_time is not None and bar_time <= last_time:
+            return False
+        self.last_bar_time[key] = bar_time
+
+        state = self.states[key]
+        values = state.update(float(close), float(tick_volume))
+        row = np.array([values[name] for name in self.features], dtype=np.float64)
+
+        # Rows are only stored once every window is warm (prepare_features' dropna)
+        if state.bars < self.min_bars or not np.isfinite(row).all():
+            return False
+
+        i = self.heads[key]
+        j = i + self.capacity
+        self.matrices[key][i] = self.matrices[key][j] = row
+        self.closes[key][i] = self.closes[key][j] = values['close']
+        self.times[key][i] = self.times[key][j] = bar_time.to_datetime64()
+        self.heads[key] = (i + 1) % self.capacity
+        self.counts[key] = min(self.counts[key] + 1, self.capacity)
+        return True
+
+    def sync(self, symbol: str, timeframe: str, rates: pd.DataFrame, exclude_last: bool = True) -> int:
+        """Append all bars in ``rates`` newer than the last stored bar
+
+        With ``exclude_last`` the final row is treated as the still-forming
+        bar and skipped. Returns the number of bars consumed.
+        """
+        if rates is None or len(rates) == 0:
+            return 0
+
+        bars = rates.iloc[:-1] if exclude_last else rates
+        last_time = self.last_bar_time.get((symbol, timeframe))
+        if last_time is not None:
+            bars = bars[bars.index > last_time]
+
+        for bar_time, close, volume in zip(bars.index, bars['close'].values, bars['tick_volume'].values):
+            self.push_bar(symbol, timeframe, bar_time, close, volume)
+
+        return len(bars)
+
+    def latest(self, symbol: str, timeframe: str) -> Optional[np.ndarray]:
+        """Latest feature row, or None while the store is warming up"""
+        key = (symbol, timeframe)
+        if not self.counts.get(key):
+            return None
+        return self.matrices[key][self.heads[key] + self.capacity - 1]
+
+    def matrix(self, symbol: str, timeframe: str, n: Optional[int] = None) -> np.ndarray:
+        """Zero-copy view over the last ``n`` feature rows (oldest first)"""
+        key = (symbol, timeframe)
+        count = self.counts.get(key, 0)
+        if count == 0:
+            return np.zeros((0, len(self.features)))
+        n = count if n is None else min(n, count)
+        end = self.heads[key] + self.capacity
+        return self.matrices[key][end - n:end]
+
+    def frame(self, symbol: str, timeframe: str, n: Optional[int] = None) -> pd.DataFrame:
+        """Feature rows with close prices as a DataFrame (for retraining)"""
+        key = (symbol, timeframe)
+        count = self.counts.get(key, 0)
+        if count == 0:
+            return pd.DataFrame(columns=self.features + ['close'])
+        n = count if n is None else min(n, count)
+        end = self.heads[key] + self.capacity
+        df = pd.DataFrame(self.matrices[key][end - n:end], columns=self.features,
+                          index=pd.DatetimeIndex(self.times[key][end - n:end]))
+        df['close'] = self.closes[key][end - n:end]
+        return df
+
+    def reset(self, symbol: Optional[str] = None, timeframe: Optional[str] = None):
+        """Drop stored state for one key or for everything"""
+        keys = list(self.states) if symbol is None else [(symbol, timeframe)]
+        for key in keys:
+            for store in (self.states, self.matrices, self.closes, self.times,
+                          self.heads, self.counts, self.last_bar_time):
+                store.pop(key, None)
@@ -0,0 +1,182 @@
+"""
+Latency instrumentation for AuraTrade Bot
+Per-stage latency histograms of the tick -> analyze -> risk -> send_order -> fill path
+"""
+
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+# Pipeline stages in path order
+STAGES = (
+    'queue',         # tick receipt -> strategy analyze starts
+    'analyze',       # strategy.analyze / analyze_market
+    'risk',          # risk manager trade check
+    'tick_to_send',  # tick receipt -> order handed to the terminal
+    'send_order',    # terminal order_send round trip (per attempt)
+    'tick_to_fill'   # tick receipt -> fill confirmed
+)
+
+def bucket_index(value: int) -> int:
+    """Log-linear bucket of a non-negative integer (8 sub-buckets per power of two)"""
+    if value < 16:
+        return value
+    shift = value.bit_length() - 4
+    return (shift << 3) + (value >> shift)
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """Smallest and largest value that fall into a bucket"""
+    if index < 16:
+        return index, index
+    shift = (index >> 3) - 1
+    lower = ((index & 7) + 8) << shift
+    return lower, lower + (1 << shift) - 1
+
+class LatencyHistogram:
+    """Microsecond latency histogram with ~12% bucket resolution
+
+    Recording is a bucket lookup and a few integer updates, so it can sit
+    on the order path; percentiles are computed only when summarized.
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def record(self, micros: int):
+        if micros < 0:
+            micros = 0
+        index = bucket_index(micros)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += micros
+        if self.min_us is None or micros < self.min_us:
+            self.min_us = micros
+        if micros > self.max_us:
+            self.max_us = micros
+
+    def merge(self, other: 'LatencyHistogram'):
+        for index, count in list(other.counts.items()):
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile in microseconds (bucket midpoint)"""
+        if not self.count:
+            return 0.0
+        target = max(1, int(round(self.count * pct / 100.0)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                lower, upper = bucket_bounds(index)
+                return min((lower + upper) / 2.0, float(self.max_us))
+        return float(self.max_us)
+
+    def summary(self) -> Dict[str, float]:
+        """Count and latency statistics in milliseconds"""
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_us / self.count / 1000.0, 3),
+            'p50_ms': round(self.percentile(50) / 1000.0, 3),
+            'p90_ms': round(self.percentile(90) / 1000.0, 3),
+            'p99_ms': round(self.percentile(99) / 1000.0, 3),
+            'min_ms': round((self.min_us or 0) / 1000.0, 3),
+            'max_ms': round(self.max_us / 1000.0, 3)
+        }
+
+class LatencyRecorder:
+    """Histograms per (stage, symbol, strategy)
+
+    Disabled by default; instrumented code checks ``enabled`` before taking
+    any timestamps, so the cost when off is one attribute read. The engine
+    opens a trace (symbol, strategy, tick receipt time) on the thread that
+    places an order, which lets the order manager attribute its stages
+    without changing its call signatures.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+            self.started_at = time.time()
+
+    def record(self, stage: str, elapsed_ns: int, symbol: Optional[str] = None, strategy: Optional[str] = None):
+        """Record one stage duration (nanoseconds)"""
+        trace = getattr(self._local, 'trace', None)
+        if trace is not None:
+            symbol = symbol or trace[0]
+            strategy = strategy or trace[1]
+        key = (stage, symbol or '-', strategy or 'manual')
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(key, LatencyHistogram())
+        histogram.record(elapsed_ns // 1000)
+
+    def start_trace(self, symbol: str, strategy: str, origin_ns: Optional[int] = None):
+        """Attribute stages recorded on this thread to a symbol/strategy"""
+        self._local.trace = (symbol, strategy, origin_ns)
+
+    def end_trace(self):
+        self._local.trace = None
+
+    def trace_origin(self) -> Optional[int]:
+        """Tick receipt time (perf_counter_ns) of the current trace"""
+        trace = getattr(self._local, 'trace', None)
+        return trace[2] if trace is not None else None
+
+    def record_since_origin(self, stage: str, now_ns: int, symbol: Optional[str] = None):
+        """Record the time since the traced tick was received"""
+        origin = self.trace_origin()
+        if origin is not None:
+            self.record(stage, now_ns - origin, symbol)
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-stage statistics overall, by symbol and by strategy"""
+        with self._lock:
+            items = list(self.histograms.items())
+
+        stages: Dict[str, Dict[str, Any]] = {}
+        for (stage, symbol, strategy), histogram in items:
+            entry = stages.setdefault(stage, {'all': LatencyHistogram(), 'by_symbol': {}, 'by_strategy': {}})
+            entry['all'].merge(histogram)
+            entry['by_symbol'].setdefault(symbol, LatencyHistogram()).merge(histogram)
+            entry['by_strategy'].setdefault(strategy, LatencyHistogram()).merge(histogram)
+
+        ordered = [s for s in STAGES if s in stages] + sorted(s for s in stages if s not in STAGES)
+        return {
+            stage: {
+                'all': stages[stage]['all'].summary(),
+                'by_symbol': {k: h.summary() for k, h in sorted(stages[stage]['by_symbol'].items())},
+                'by_strategy': {k: h.summary() for k, h in sorted(stages[stage]['by_strategy'].items())}
+            }
+            for stage in ordered
+        }
+
+    def format_report(self) -> str:
+        """Per-stage overall latencies as a text table"""
+        summary = self.summary()
+        lines = [f"{'Stage':<14} {'Count':>8} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+        for stage, entry in summary.items():
+            stats = entry['all']
+            if not stats.get('count'):
+                continue
+            lines.append(f"{stage:<14} {stats['count']:>8} {stats['p50_ms']:>9.3f} {stats['p90_ms']:>9.3f} "
+                         f"{stats['p99_ms']:>9.3f} {stats['max_ms']:>9.3f}")
+        return "\n".join(lines)
@@ -1,180 +1,209 @@
 """
-Logging utilities for AuraTrade Bot
-Enhanced logging with trade tracking and system monitoring
+Logger utility for AuraTrade Bot
+Queue-based logging: callers only enqueue records, a listener thread formats
+and writes them to the console, rotating log files and a JSON-lines trade log
 """
 
+import atexit
+import json
 import logging
-import colorlog
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
-from typing import Any, Dict, Optional
-
-# Create logs directory
-os.makedirs('logs', exist_ok=True)
-
-class Logger:
-    """Enhanced logger with color output and file logging"""
-
-    _instance = None
+from typing import Any, Dict, List, Optional
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+try:
+    import colorlog
+except ImportError:
+    colorlog = None
 
-    def __init__(self):
-        if self._initialized:
-            return
-
-        self.logger = logging.getLogger('AuraTrade')
-        self.logger.setLevel(logging.INFO)
-
-        # Clear existing handlers
-        self.logger.handlers.clear()
-
-        # Console handler with colors
-        console_handler = colorlog.StreamHandler()
-        console_formatter = colorlog.ColoredFormatter(
-            '%(log_color)s%(asctime)s | %(levelname)-8s | %(message)s',
-            datefmt='%H:%M:%S',
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
-        )
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
-
-        # File handler
-        file_handler = logging.FileHandler(
-            f'logs/auratrade_{datetime.now().strftime("%Y%m%d")}.log'
-        )
-        file_formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
-
-        # Trade logger
-        self.trade_logger = logging.getLogger('AuraTrade.Trades')
-        trade_handler = logging.FileHandler(
-            f'logs/trades_{datetime.now().strftime("%Y%m%d")}.log'
-        )
-        trade_handler.setFormatter(file_formatter)
-        self.trade_logger.addHandler(trade_handler)
-        self.trade_logger.setLevel(logging.INFO)
+LOGS_DIR = 'logs'
 
-        self._initialized = True
+# Defaults mirror Config.LOGGING_CONFIG; configure_logging() applies the real config
+DEFAULT_LOGGING_CONFIG = {
+    'LEVEL': 'INFO',
+    'FILE_LOGGING': True,
+    'CONSOLE_LOGGING': True,
+    'LOG_ROTATION': True,
+    'MAX_LOG_SIZE_MB': 10,
+    'BACKUP_COUNT': 5,
+    'LOG_FORMAT': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    'DATE_FORMAT': '%Y-%m-%d %H:%M:%S',
+}
 
-    def get_logger(self):
-        """Get main logger instance"""
-        return self.logger
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread
 
-    def get_trade_logger(self):
-        """Get trade logger instance"""
-        return self.trade_logger
+    The stock ``QueueHandler.prepare`` formats every record on the calling
+    thread; records stay in-process here, so they are queued untouched.
+    """
 
-def log_trade(action: str, symbol: str, volume: float, price: float, **kwargs):
-    """Log trade execution"""
-    logger = Logger().get_trade_logger()
-    trade_info = f"TRADE | {action.upper()} {volume} {symbol} @ {price:.5f}"
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
-    if kwargs:
-        extras = " | ".join([f"{k}: {v}" for k, v in kwargs.items()])
-        trade_info += f" | {extras}"
+class TradeRecordFilter(logging.Filter):
+    """Pass only structured trade records"""
 
-    logger.info(trade_info)
+    def filter(self, record: logging.LogRecord) -> bool:
+        return hasattr(record, 'trade')
 
-def log_error(message: str, **kwargs):
-    """Log error with context"""
-    logger = Logger().get_logger()
-    if kwargs:
-        extras = " | ".join([f"{k}: {v}" for k, v in kwargs.items()])
-        message += f" | {extras}"
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per trade record"""
 
-    logger.error(message)
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds')}
+        entry.update(record.trade)
+        return json.dumps(entry, default=str)
 
-def log_system(message: str, level: str = "info"):
-    """Log system events"""
-    logger = Logger().get_logger()
-    if level.lower() == "warning":
-        logger.warning(f"SYSTEM | {message}")
-    elif level.lower() == "error":
-        logger.error(f"SYSTEM | {message}")
-    else:
-        logger.info(f"SYSTEM | {message}")
-"""
-Logger utility for AuraTrade Bot
-Centralized logging with different levels and file output
-"""
+class _Pipeline:
+    """Process-wide queue, listener and output handlers"""
 
-import logging
-import os
-from datetime import datetime
-from typing import Optional
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.handlers: List[logging.Handler] = []
+        self.config: Dict[str, Any] = dict(DEFAULT_LOGGING_CONFIG)
+        self.ready = False
+
+    def setup(self):
+        if self.ready:
+            return
+        with self.lock:
+            if self.ready:
+                return
+
+            logger = logging.getLogger('AuraTrade')
+            logger.handlers.clear()
+            logger.addHandler(LazyQueueHandler(self.queue))
+            logger.propagate = False
+            logging.getLogger('AuraTrade.Trades').setLevel(logging.INFO)
+
+            self._start()
+            atexit.register(self.stop)
+            self.ready = True
+
+    def _build_handlers(self) -> List[logging.Handler]:
+        config = self.config
+        formatter = logging.Formatter(config['LOG_FORMAT'], datefmt=config['DATE_FORMAT'])
+        date_tag = datetime.now().strftime('%Y%m%d')
+        max_bytes = int(config['MAX_LOG_SIZE_MB'] * 1024 * 1024) if config['LOG_ROTATION'] else 0
+        handlers = []
+
+        if config['CONSOLE_LOGGING']:
+            if colorlog is not None:
+                console = colorlog.StreamHandler()
+                console.setFormatter(colorlog.ColoredFormatter(
+                    '%(log_color)s' + config['LOG_FORMAT'], datefmt=config['DATE_FORMAT']
+                ))
+            else:
+                console = logging.StreamHandler()
+                console.setFormatter(formatter)
+            handlers.append(console)
+
+        if config['FILE_LOGGING']:
+            os.makedirs(LOGS_DIR, exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                os.path.join(LOGS_DIR, f'auratrade_{date_tag}.log'),
+                maxBytes=max_bytes, backupCount=config['BACKUP_COUNT'], encoding='utf-8'
+            )
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+
+            trade_handler = logging.handlers.RotatingFileHandler(
+                os.path.join(LOGS_DIR, f'trades_{date_tag}.jsonl'),
+                maxBytes=max_bytes, backupCount=config['BACKUP_COUNT'], encoding='utf-8'
+            )
+            trade_handler.addFilter(TradeRecordFilter())
+            trade_handler.setFormatter(JsonLinesFormatter())
+            handlers.append(trade_handler)
+
+        return handlers
+
+    def _start(self):
+        level = getattr(logging, str(self.config['LEVEL']).upper(), logging.INFO)
+        logging.getLogger('AuraTrade').setLevel(level)
+        self.handlers = self._build_handlers()
+        self.listener = logging.handlers.QueueListener(self.queue, *self.handlers,
+                                                       respect_handler_level=True)
+        self.listener.start()
+
+    def stop(self):
+        """Flush queued records and close the output handlers"""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        for handler in self.handlers:
+            handler.close()
+        self.handlers = []
+
+    def reconfigure(self, logging_config: Dict[str, Any]):
+        self.setup()
+        with self.lock:
+            self.stop()
+            self.config.update({k: v for k, v in logging_config.items() if k in DEFAULT_LOGGING_CONFIG})
+            self._start()
+
+_pipeline = _Pipeline()
+
+def configure_logging(logging_config: Dict[str, Any]):
+    """Apply a LOGGING_CONFIG section (level, outputs, rotation size/count, format)"""
+    _pipeline.reconfigure(logging_config)
 
 class Logger:
     """Centralized logger for AuraTrade Bot"""
-    
+
     def __init__(self):
-        self.logger = None
-        self.setup_logger()
-    
-    def setup_logger(self):
-        """Setup logger with file and console handlers"""
-        # Create logs directory if it doesn't exist
-        os.makedirs("logs", exist_ok=True)
-        
-        # Create logger
-        self.logger = logging.getLogger("AuraTrade")
-        self.logger.setLevel(logging.INFO)
-        
-        # Clear existing handlers
-        if self.logger.handlers:
-            self.logger.handlers.clear()
-        
-        # Create formatters
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # File handler
-        log_filename = f"logs/auratrade_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(formatter)
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-    
+        _pipeline.setup()
+        self.logger = logging.getLogger('AuraTrade')
+        self.trade_logger = logging.getLogger('AuraTrade.Trades')
+
     def get_logger(self):
         """Get logger instance"""
         return self.logger
 
-# Global logger functions
-def log_trade(action: str, symbol: str, volume: float, price: float):
-    """Log trade execution"""
-    logger = Logger().get_logger()
-    logger.info(f"TRADE: {action.upper()} {volume} {symbol} @ {price:.5f}")
+    def get_trade_logger(self):
+        """Get trade logger instance"""
+        return self.trade_logger
 
-def log_error(message: str):
-    """Log error message"""
+# Global logger functions (arguments are formatted by the listener, not the caller)
+def log_trade(action: str, symbol: str, volume: float, price: float, **fields):
+    """Log trade execution as a text line and a JSON-lines trade record"""
+    logger = Logger().get_trade_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    trade = {'action': action.upper(), 'symbol': symbol, 'volume': volume, 'price': price}
+    trade.update(fields)
+    logger.info("TRADE: %s %s %s @ %.5f", trade['action'], volume, symbol, price, extra={'trade': trade})
+
+def log_error(*parts: Any, **context):
+    """Log an error: ``log_error(message)`` or ``log_error(component, message, exception)``"""
+    logger = Logger().get_logger()
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    parts = [part for part in parts if part is not None]
+    fmt = "ERROR: " + ": ".join(["%s"] * len(parts))
+    args = list(parts)
+    for key, value in context.items():
+        fmt += f" | {key}: %s"
+        args.append(value)
+    logger.error(fmt, *args)
+
+def log_info(component: str, message: Optional[str] = None):
+    """Log an informational message, optionally tagged with its component"""
     logger = Logger().get_logger()
-    logger.error(f"ERROR: {message}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    if message is None:
+        logger.info("%s", component)
+    else:
+        logger.info("%s: %s", component, message)
 
-def log_system(message: str):
+def log_system(message: str, level: str = "info"):
     """Log system message"""
     logger = Logger().get_logger()
-    logger.info(f"SYSTEM: {message}")
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    if logger.isEnabledFor(log_level):
+        logger.log(log_level, "SYSTEM: %s", message)
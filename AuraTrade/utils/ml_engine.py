@@ -5,29 +5,140 @@ Advanced ML predictions and signal generation
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from datetime import datetime, timedelta
+from dataclasses import dataclass, replace
+from concurrent.futures import ProcessPoolExecutor, Future, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+import threading
+import tempfile
 import pickle
+import shutil
+import json
+import time
 import os
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, classification_report
 import warnings
 warnings.filterwarnings('ignore')
 
 from utils.logger import Logger
+from utils.feature_store import FeatureStore
+from utils.tree_inference import compile_ensemble
+
+@dataclass(frozen=True)
+class ModelBundle:
+    """Immutable set of models that are always published together"""
+    version: int = 0
+    direction_model: Any = None
+    volatility_model: Any = None
+    scaler: Any = None
+    trained_at: Optional[datetime] = None
+    direction_flat: Any = None   # compiled inference backend (optional)
+    volatility_flat: Any = None
+    evaluation: Any = None       # walk-forward CV report from training
+
+def _build_model(kind: str, n_jobs: int = 1):
+    """Untrained 'direction' or 'volatility' classifier"""
+    from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+
+    if kind == 'direction':
+        return RandomForestClassifier(
+            n_estimators=100,
+            max_depth=10,
+            random_state=42,
+            class_weight='balanced',
+            n_jobs=n_jobs
+        )
+    return GradientBoostingClassifier(
+        n_estimators=50,
+        max_depth=5,
+        random_state=42
+    )
+
+def walk_forward_folds(n_samples: int, n_folds: int = 5, purge: int = 10,
+                       min_train: int = 100) -> List[Tuple[int, int, int]]:
+    """Expanding-window folds as (train_end, test_start, test_end) indices
+
+    Samples are split into ``n_folds + 1`` chronological blocks; fold k tests
+    on block k and trains on everything before it, minus the last ``purge``
+    samples whose forward-looking labels overlap the test block.
+    """
+    block = n_samples // (n_folds + 1)
+    folds = []
+    for k in range(1, n_folds + 1):
+        test_start = k * block
+        test_end = n_samples if k == n_folds else (k + 1) * block
+        train_end = test_start - purge
+        if train_end >= min_train and test_end > test_start:
+            folds.append((train_end, test_start, test_end))
+    return folds
+
+def _cv_fold_worker(data_dir: str, kind: str, fold: int, train_end: int,
+                    test_start: int, test_end: int) -> Dict[str, Any]:
+    """Fit and score one walk-forward fold on memory-mapped arrays"""
+    from sklearn.preprocessing import StandardScaler
+
+    X = np.load(os.path.join(data_dir, 'X.npy'), mmap_mode='r')
+    y = np.load(os.path.join(data_dir, f'y_{kind}.npy'), mmap_mode='r')
+
+    result = {'fold': fold, 'train_size': train_end, 'test_size': test_end - test_start}
+    y_train = np.asarray(y[:train_end])
+    if len(np.unique(y_train)) < 2:
+        result['skipped'] = True
+        return result
+
+    scaler = StandardScaler().fit(X[:train_end])
+    X_train = scaler.transform(X[:train_end])
+    X_test = scaler.transform(X[test_start:test_end])
+    model = _build_model(kind, n_jobs=1)
+
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    result['fit_time'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_pred = model.predict(X_test)
+    result['predict_time'] = time.perf_counter() - start
+
+    # Latency of a single live prediction (what the ML gate pays per signal)
+    row = X_test[-1:]
+    start = time.perf_counter()
+    for _ in range(10):
+        model.predict_proba(row)
+    result['single_predict_ms'] = (time.perf_counter() - start) * 100
+
+    result['accuracy'] = float(np.mean(y_pred == np.asarray(y[test_start:test_end])))
+    result['skipped'] = False
+    return result
+
+def _terminate_pool(executor: ProcessPoolExecutor):
+    """Shut a process pool down without waiting for running tasks"""
+    # shutdown() cannot interrupt tasks that already started, so the worker
+    # processes are terminated directly
+    processes = list((getattr(executor, '_processes', None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    for process in processes:
+        process.join(timeout=5)
+
+def _retrain_worker(df: pd.DataFrame, model_dir: str, version: int, n_jobs: int) -> bool:
+    """Train and publish a model bundle (runs in a child process)"""
+    engine = MLEngine(model_dir=model_dir)
+    engine.n_jobs = n_jobs
+    return engine.train_models(df, version=version)
 
 class MLEngine:
     """Machine Learning prediction engine"""
 
-    def __init__(self):
+    def __init__(self, model_dir: str = 'AuraTrade/data/models'):
         self.logger = Logger().get_logger()
 
-        # Models
-        self.direction_model = None
-        self.volatility_model = None
-        self.scaler = StandardScaler()
+        # Models (swapped as a whole; readers take one snapshot per call).
+        # Saved models are loaded lazily on first use.
+        self.models = ModelBundle()
+        self._models_loaded = False
+        self._load_lock = threading.Lock()
 
         # Model parameters
         self.lookback_period = 100
@@ -39,9 +150,33 @@ class MLEngine:
             'rsi', 'macd', 'bb_upper', 'bb_lower', 'ema_fast', 'ema_slow',
             'volume_ma', 'price_change', 'volatility', 'momentum'
         ]
+        self.feature_store = FeatureStore(self.features)
+
+        # Inference backend: 'sklearn' or 'flat' (compiled NumPy trees)
+        self.inference_backend = 'sklearn'
+
+        # Training parameters
+        self.n_jobs = -1          # parallel tree fitting
+        self.cv_folds = 5         # purged walk-forward folds (0 disables CV)
+        self.cv_workers = None    # CV processes (None: one per fold, up to CPUs)
+        self.cv_time_budget = None  # seconds before unfinished folds are abandoned
+
+        # Background retraining
+        self.retrain_interval = 24 * 3600  # seconds between scheduled retrains
+        self.drift_check_interval = 300    # seconds between drift checks
+        self.drift_threshold = 1.0         # max |mean| of scaled recent features
+        self.drift_window = 100            # bars used for drift checks
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._retrain_future: Optional[Future] = None
+        self._retrain_lock = threading.Lock()
+        self._scheduler_thread: Optional[threading.Thread] = None
+        self._scheduler_active = False
+        self.last_retrain_time = 0.0
 
         # Model paths
-        self.model_dir = 'AuraTrade/data/models'
+        self.model_dir = model_dir
+        self.manifest_path = os.path.join(self.model_dir, 'manifest.json')
+        self.keep_versions = 2  # model version directories kept on disk
         os.makedirs(self.model_dir, exist_ok=True)
 
         self.logger.info("MLEngine initialized")
@@ -147,86 +282,228 @@ class MLEngine:
             self.logger.error(f"Error creating labels: {e}")
             return pd.Series()
 
-    def train_models(self, df: pd.DataFrame) -> bool:
-        """Train ML models"""
-        try:
-            self.logger.info("Training ML models...")
-
-            # Prepare features
-            features_df = self.prepare_features(df)
-            if features_df.empty:
-                self.logger.error("No features prepared for training")
-                return False
+    def _current_models(self) -> ModelBundle:
+        """Current model bundle, loading saved models on first use"""
+        if not self._models_loaded:
+            with self._load_lock:
+                if not self._models_loaded:
+                    self._models_loaded = True
+                    self.load_models()
+        return self.models
+
+    @property
+    def direction_model(self):
+        return self._current_models().direction_model
+
+    @property
+    def volatility_model(self):
+        return self._current_models().volatility_model
+
+    @property
+    def scaler(self):
+        return self._current_models().scaler
+
+    @property
+    def model_version(self) -> int:
+        return self._current_models().version
+
+    def set_inference_backend(self, backend: str):
+        """Select 'sklearn' or 'flat' (compiled NumPy tree traversal) inference"""
+        if backend not in ('sklearn', 'flat'):
+            raise ValueError(f"Unknown inference backend: {backend}")
+        self.inference_backend = backend
+        if self._models_loaded:
+            self._set_models(self.models)
+
+    def _set_models(self, bundle: ModelBundle):
+        """Publish a bundle in memory, compiling it for the flat backend if enabled"""
+        if self.inference_backend == 'flat' and bundle.scaler is not None:
+            # Parity probe: random rows in the scaled feature space
+            sample = np.random.default_rng(0).normal(size=(256, len(bundle.scaler.mean_)))
+            direction_flat = compile_ensemble(bundle.direction_model, sample)
+            volatility_flat = compile_ensemble(bundle.volatility_model, sample)
+
+            for name, model, flat in (('direction', bundle.direction_model, direction_flat),
+                                      ('volatility', bundle.volatility_model, volatility_flat)):
+                if model is not None and flat is None:
+                    self.logger.warning(f"Compiled {name} model failed parity check; using sklearn")
+
+            bundle = replace(bundle, direction_flat=direction_flat, volatility_flat=volatility_flat)
+        elif bundle.direction_flat is not None or bundle.volatility_flat is not None:
+            bundle = replace(bundle, direction_flat=None, volatility_flat=None)
+
+        self.models = bundle
+
+    @staticmethod
+    def _predict_proba(models: ModelBundle, model, flat, X: np.ndarray) -> np.ndarray:
+        """Scale raw feature rows and return class probabilities"""
+        if flat is not None:
+            # Same arithmetic as StandardScaler.transform, without validation overhead
+            return flat.predict_proba((X - models.scaler.mean_) / models.scaler.scale_)
+        return model.predict_proba(models.scaler.transform(X))
+
+    def _prepare_training_data(self, df: pd.DataFrame) -> Optional[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]]:
+        """Chronological feature matrix with direction and volatility labels"""
+        # Prepare features
+        features_df = self.prepare_features(df)
+        if features_df.empty:
+            self.logger.error("No features prepared for training")
+            return None
+
+        # Create labels
+        labels = self.create_labels(features_df, self.prediction_horizon)
+
+        # Align features and labels; the last bars have no future price yet
+        min_length = min(len(features_df), len(labels)) - self.prediction_horizon
+        features_df = features_df.iloc[:min_length]
+        labels = labels.iloc[:min_length]
+
+        # Remove NaN values
+        mask = ~(features_df.isnull().any(axis=1) | labels.isnull())
+        features_df = features_df[mask]
+        labels = labels[mask]
+
+        if len(features_df) < 100:
+            self.logger.warning("Insufficient data for training")
+            return None
+
+        # Select features
+        feature_columns = [col for col in self.features if col in features_df.columns]
+        X = features_df[feature_columns].values
+        y = labels.values
+
+        volatility_labels = self._create_volatility_labels(features_df)
+        y_vol = None
+        if len(volatility_labels) == len(features_df) and volatility_labels.nunique() > 1:
+            y_vol = volatility_labels.values
+
+        return X, y, y_vol
+
+    def cross_validate(self, X: np.ndarray, labels: Dict[str, np.ndarray],
+                       n_folds: Optional[int] = None) -> Dict[str, Any]:
+        """Evaluate models on purged walk-forward folds in parallel processes
+
+        ``labels`` maps model kind ('direction'/'volatility') to a label
+        vector aligned with ``X``. Arrays are written once to a temporary
+        directory and memory-mapped by every worker instead of being pickled
+        per fold. Folds still running when ``cv_time_budget`` expires are
+        abandoned and their worker processes terminated. Returns per-fold
+        fit/predict times and accuracy plus per-model summaries.
+        """
+        n_folds = n_folds or self.cv_folds
+        report: Dict[str, Any] = {'n_folds': n_folds, 'samples': len(X)}
+        folds = walk_forward_folds(len(X), n_folds, purge=self.prediction_horizon)
+        if not folds:
+            return report
+
+        data_dir = tempfile.mkdtemp(prefix='auratrade_cv_')
+        start = time.perf_counter()
 
-            # Create labels
-            labels = self.create_labels(features_df, self.prediction_horizon)
+        try:
+            np.save(os.path.join(data_dir, 'X.npy'), np.ascontiguousarray(X, dtype=np.float64))
+            for kind, y in labels.items():
+                np.save(os.path.join(data_dir, f'y_{kind}.npy'), np.asarray(y))
+
+            jobs = [(kind, i, fold) for kind in labels for i, fold in enumerate(folds)]
+            max_workers = self.cv_workers or min(len(jobs), os.cpu_count() or 1)
+            results: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in labels}
+
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            timed_out = False
+            try:
+                futures = {
+                    executor.submit(_cv_fold_worker, data_dir, kind, i, *fold): kind
+                    for kind, i, fold in jobs
+                }
+                for future in as_completed(futures, timeout=self.cv_time_budget):
+                    results[futures[future]].append(future.result())
+            except FuturesTimeoutError:
+                timed_out = True
+                self.logger.warning("Cross-validation time budget exceeded; stopping unfinished folds")
+            finally:
+                if timed_out:
+                    _terminate_pool(executor)
+                else:
+                    executor.shutdown(wait=True)
+            report['timed_out'] = timed_out
+
+            for kind, fold_results in results.items():
+                fold_results.sort(key=lambda r: r['fold'])
+                scored = [r for r in fold_results if not r.get('skipped')]
+                report[kind] = {
+                    'folds': fold_results,
+                    'accuracy': float(np.mean([r['accuracy'] for r in scored])) if scored else None,
+                    'accuracy_std': float(np.std([r['accuracy'] for r in scored])) if scored else None,
+                    'fit_time': float(sum(r['fit_time'] for r in scored)),
+                    'predict_time': float(sum(r['predict_time'] for r in scored)),
+                    'single_predict_ms': float(np.median([r['single_predict_ms'] for r in scored])) if scored else None
+                }
 
-            # Align features and labels
-            min_length = min(len(features_df), len(labels))
-            features_df = features_df.iloc[:min_length]
-            labels = labels.iloc[:min_length]
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
 
-            # Remove NaN values
-            mask = ~(features_df.isnull().any(axis=1) | labels.isnull())
-            features_df = features_df[mask]
-            labels = labels[mask]
+        report['wall_time'] = time.perf_counter() - start
+        return report
 
-            if len(features_df) < 100:
-                self.logger.warning("Insufficient data for training")
-                return False
+    def train_models(self, df: pd.DataFrame, version: Optional[int] = None) -> bool:
+        """Train ML models and publish them as a new bundle
 
-            # Select features
-            feature_columns = [col for col in self.features if col in features_df.columns]
-            X = features_df[feature_columns].values
-            y = labels.values
+        Models are scored on purged walk-forward folds (no shuffling, so no
+        look-ahead) and then refit on the full history.
+        """
+        try:
+            from sklearn.preprocessing import StandardScaler
 
-            # Scale features
-            X_scaled = self.scaler.fit_transform(X)
+            self.logger.info("Training ML models...")
 
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(
-                X_scaled, y, test_size=0.2, random_state=42, stratify=y
-            )
+            data = self._prepare_training_data(df)
+            if data is None:
+                return False
+            X, y, y_vol = data
+
+            # Honest out-of-sample scores before the final fit
+            evaluation = None
+            if self.cv_folds:
+                labels = {'direction': y}
+                if y_vol is not None:
+                    labels['volatility'] = y_vol
+                evaluation = self.cross_validate(X, labels)
+
+                for kind in labels:
+                    summary = evaluation.get(kind)
+                    if summary and summary['accuracy'] is not None:
+                        self.logger.info(f"{kind.capitalize()} model walk-forward accuracy: "
+                                         f"{summary['accuracy']:.3f} +/- {summary['accuracy_std']:.3f} "
+                                         f"(fit {summary['fit_time']:.2f}s, "
+                                         f"predict {summary['single_predict_ms']:.2f}ms/row)")
+
+            # Scale features (fresh scaler; the live one is never mutated)
+            scaler = StandardScaler()
+            X_scaled = scaler.fit_transform(X)
 
             # Train direction model
-            self.direction_model = RandomForestClassifier(
-                n_estimators=100,
-                max_depth=10,
-                random_state=42,
-                class_weight='balanced'
-            )
-            self.direction_model.fit(X_train, y_train)
-
-            # Evaluate model
-            y_pred = self.direction_model.predict(X_test)
-            accuracy = accuracy_score(y_test, y_pred)
-
-            self.logger.info(f"Direction model accuracy: {accuracy:.3f}")
+            direction_model = _build_model('direction', n_jobs=self.n_jobs)
+            direction_model.fit(X_scaled, y)
 
             # Train volatility model (predict if next period will be high volatility)
-            volatility_labels = self._create_volatility_labels(features_df)
-            if len(volatility_labels) > 0:
-                vol_mask = ~volatility_labels.isnull()
-                X_vol = X_scaled[vol_mask]
-                y_vol = volatility_labels[vol_mask].values
-
-                if len(np.unique(y_vol)) > 1:
-                    X_vol_train, X_vol_test, y_vol_train, y_vol_test = train_test_split(
-                        X_vol, y_vol, test_size=0.2, random_state=42
-                    )
-
-                    self.volatility_model = GradientBoostingClassifier(
-                        n_estimators=50,
-                        max_depth=5,
-                        random_state=42
-                    )
-                    self.volatility_model.fit(X_vol_train, y_vol_train)
-
-                    vol_accuracy = accuracy_score(y_vol_test, self.volatility_model.predict(X_vol_test))
-                    self.logger.info(f"Volatility model accuracy: {vol_accuracy:.3f}")
-
-            # Save models
-            self._save_models()
+            volatility_model = None
+            if y_vol is not None:
+                volatility_model = _build_model('volatility')
+                volatility_model.fit(X_scaled, y_vol)
+
+            bundle = ModelBundle(
+                version=version if version is not None else self._current_models().version + 1,
+                direction_model=direction_model,
+                volatility_model=volatility_model,
+                scaler=scaler,
+                trained_at=datetime.now(),
+                evaluation=evaluation
+            )
+
+            # Publish on disk first, then swap in memory
+            self._save_models(bundle)
+            self._set_models(bundle)
+            self._models_loaded = True
 
             return True
 
@@ -243,83 +520,162 @@ class MLEngine:
         except:
             return pd.Series()
 
-    def predict_direction(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def update_features(self, symbol: str, timeframe: str, df: pd.DataFrame) -> int:
+        """Feed closed bars into the incremental feature store"""
+        try:
+            return self.feature_store.sync(symbol, timeframe, df)
+        except Exception as e:
+            self.logger.error(f"Error updating features for {symbol} {timeframe}: {e}")
+            return 0
+
+    def _latest_feature_row(self, df: pd.DataFrame, symbol: Optional[str] = None,
+                            timeframe: str = 'M1') -> Optional[np.ndarray]:
+        """Get the latest unscaled feature row for a rates DataFrame
+
+        With a symbol, only bars newer than the feature store's last closed
+        bar are processed and the stored row is returned; otherwise the
+        full feature frame is rebuilt from ``df``.
+        """
+        if symbol is not None:
+            self.update_features(symbol, timeframe, df)
+            return self.feature_store.latest(symbol, timeframe)
+
+        features_df = self.prepare_features(df)
+        if features_df.empty:
+            return None
+
+        feature_columns = [col for col in self.features if col in features_df.columns]
+        return features_df[feature_columns].values[-1]
+
+    def _direction_result(self, model, probabilities: np.ndarray) -> Dict[str, Any]:
+        """Build a direction prediction from class probabilities"""
+        prediction = model.classes_[int(np.argmax(probabilities))]
+        confidence = max(probabilities)
+
+        # Generate signal
+        if confidence >= self.min_confidence:
+            signal = 'BUY' if prediction == 1 else 'SELL'
+        else:
+            signal = 'HOLD'
+
+        return {
+            'prediction': int(prediction),
+            'confidence': float(confidence),
+            'signal': signal,
+            'probabilities': {
+                'down': float(probabilities[0]),
+                'up': float(probabilities[1])
+            }
+        }
+
+    def _volatility_result(self, model, probabilities: np.ndarray) -> Dict[str, Any]:
+        """Build a volatility prediction from class probabilities"""
+        prediction = model.classes_[int(np.argmax(probabilities))]
+
+        return {
+            'high_volatility': bool(prediction),
+            'confidence': float(max(probabilities)),
+            'volatility_prob': float(probabilities[1])
+        }
+
+    def predict_direction(self, df: pd.DataFrame, symbol: Optional[str] = None,
+                          timeframe: str = 'M1') -> Dict[str, Any]:
         """Predict price direction"""
         try:
-            if self.direction_model is None:
+            models = self._current_models()
+            if models.direction_model is None:
                 return {'prediction': 0, 'confidence': 0.0, 'signal': 'HOLD'}
 
-            # Prepare features
-            features_df = self.prepare_features(df)
-            if features_df.empty:
+            # Get latest features
+            row = self._latest_feature_row(df, symbol, timeframe)
+            if row is None:
                 return {'prediction': 0, 'confidence': 0.0, 'signal': 'HOLD'}
 
-            # Get latest features
-            latest_features = features_df.iloc[-1]
-            feature_columns = [col for col in self.features if col in features_df.columns]
-            X = latest_features[feature_columns].values.reshape(1, -1)
-
-            # Scale features
-            X_scaled = self.scaler.transform(X)
-
-            # Make prediction
-            prediction = self.direction_model.predict(X_scaled)[0]
-            probabilities = self.direction_model.predict_proba(X_scaled)[0]
-            confidence = max(probabilities)
-
-            # Generate signal
-            if confidence >= self.min_confidence:
-                signal = 'BUY' if prediction == 1 else 'SELL'
-            else:
-                signal = 'HOLD'
-
-            return {
-                'prediction': int(prediction),
-                'confidence': float(confidence),
-                'signal': signal,
-                'probabilities': {
-                    'down': float(probabilities[0]),
-                    'up': float(probabilities[1])
-                }
-            }
+            # Scale features and predict
+            probabilities = self._predict_proba(
+                models, models.direction_model, models.direction_flat, row.reshape(1, -1)
+            )[0]
+
+            return self._direction_result(models.direction_model, probabilities)
 
         except Exception as e:
             self.logger.error(f"Error predicting direction: {e}")
             return {'prediction': 0, 'confidence': 0.0, 'signal': 'HOLD'}
 
-    def predict_volatility(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def predict_volatility(self, df: pd.DataFrame, symbol: Optional[str] = None,
+                           timeframe: str = 'M1') -> Dict[str, Any]:
         """Predict volatility level"""
         try:
-            if self.volatility_model is None:
+            models = self._current_models()
+            if models.volatility_model is None:
                 return {'high_volatility': False, 'confidence': 0.0}
 
-            # Prepare features
-            features_df = self.prepare_features(df)
-            if features_df.empty:
+            # Get latest features
+            row = self._latest_feature_row(df, symbol, timeframe)
+            if row is None:
                 return {'high_volatility': False, 'confidence': 0.0}
 
-            # Get latest features
-            latest_features = features_df.iloc[-1]
-            feature_columns = [col for col in self.features if col in features_df.columns]
-            X = latest_features[feature_columns].values.reshape(1, -1)
+            # Scale features and predict
+            probabilities = self._predict_proba(
+                models, models.volatility_model, models.volatility_flat, row.reshape(1, -1)
+            )[0]
 
-            # Scale features
-            X_scaled = self.scaler.transform(X)
+            return self._volatility_result(models.volatility_model, probabilities)
 
-            # Make prediction
-            prediction = self.volatility_model.predict(X_scaled)[0]
-            probabilities = self.volatility_model.predict_proba(X_scaled)[0]
-            confidence = max(probabilities)
+        except Exception as e:
+            self.logger.error(f"Error predicting volatility: {e}")
+            return {'high_volatility': False, 'confidence': 0.0}
 
-            return {
-                'high_volatility': bool(prediction),
-                'confidence': float(confidence),
-                'volatility_prob': float(probabilities[1])
+    def predict_batch(self, data: Dict[Any, pd.DataFrame]) -> Dict[Any, Dict[str, Any]]:
+        """Predict direction and volatility for many symbols/timeframes at once
+
+        ``data`` maps a symbol or a (symbol, timeframe) key to a rates
+        DataFrame (timeframe defaults to M1). Rows come from the incremental
+        feature store, and the latest rows are stacked into one matrix so the
+        scaler and each model run a single vectorized call for the whole
+        batch instead of one call per symbol.
+        """
+        results = {
+            key: {
+                'direction': {'prediction': 0, 'confidence': 0.0, 'signal': 'HOLD'},
+                'volatility': {'high_volatility': False, 'confidence': 0.0}
             }
+            for key in data
+        }
+
+        try:
+            models = self._current_models()
+            if models.direction_model is None and models.volatility_model is None:
+                return results
+
+            keys = []
+            rows = []
+            for key, df in data.items():
+                symbol, timeframe = key if isinstance(key, tuple) else (key, 'M1')
+                row = self._latest_feature_row(df, symbol, timeframe)
+                if row is not None:
+                    keys.append(key)
+                    rows.append(row)
+
+            if not rows:
+                return results
+
+            X = np.vstack(rows)
+
+            if models.direction_model is not None:
+                probabilities = self._predict_proba(models, models.direction_model, models.direction_flat, X)
+                for key, proba in zip(keys, probabilities):
+                    results[key]['direction'] = self._direction_result(models.direction_model, proba)
+
+            if models.volatility_model is not None:
+                probabilities = self._predict_proba(models, models.volatility_model, models.volatility_flat, X)
+                for key, proba in zip(keys, probabilities):
+                    results[key]['volatility'] = self._volatility_result(models.volatility_model, proba)
 
         except Exception as e:
-            self.logger.error(f"Error predicting volatility: {e}")
-            return {'high_volatility': False, 'confidence': 0.0}
+            self.logger.error(f"Error in batch prediction: {e}")
+
+        return results
 
     def get_feature_importance(self) -> Dict[str, float]:
         """Get feature importance from direction model"""
@@ -336,67 +692,230 @@ class MLEngine:
             self.logger.error(f"Error getting feature importance: {e}")
             return {}
 
-    def _save_models(self):
-        """Save trained models"""
+    def _save_models(self, bundle: ModelBundle):
+        """Save a model bundle as joblib files plus an atomically renamed manifest
+
+        Each version gets its own directory of uncompressed joblib files so
+        arrays can be memory-mapped on load; the manifest (feature list,
+        version, file names) is only replaced once every file is complete.
+        """
         try:
-            if self.direction_model is not None:
-                with open(os.path.join(self.model_dir, 'direction_model.pkl'), 'wb') as f:
-                    pickle.dump(self.direction_model, f)
+            import joblib
+
+            version_dir = f"v{bundle.version}"
+            os.makedirs(os.path.join(self.model_dir, version_dir), exist_ok=True)
+
+            files = {}
+            for name in ('direction_model', 'volatility_model', 'scaler'):
+                model = getattr(bundle, name)
+                if model is None:
+                    continue
+                files[name] = os.path.join(version_dir, f'{name}.joblib')
+                joblib.dump(model, os.path.join(self.model_dir, files[name]))
+
+            manifest = {
+                'format': 'joblib',
+                'version': bundle.version,
+                'trained_at': bundle.trained_at.isoformat() if bundle.trained_at else None,
+                'features': self.features,
+                'files': files,
+                'evaluation': bundle.evaluation
+            }
 
-            if self.volatility_model is not None:
-                with open(os.path.join(self.model_dir, 'volatility_model.pkl'), 'wb') as f:
-                    pickle.dump(self.volatility_model, f)
+            tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(manifest, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
 
-            with open(os.path.join(self.model_dir, 'scaler.pkl'), 'wb') as f:
-                pickle.dump(self.scaler, f)
+            # Readers see either the old or the new manifest, never a mix
+            os.replace(tmp_path, self.manifest_path)
+            self._prune_versions(bundle.version)
 
-            self.logger.info("Models saved successfully")
+            self.logger.info(f"Models saved successfully (version {bundle.version})")
 
         except Exception as e:
             self.logger.error(f"Error saving models: {e}")
 
+    def _prune_versions(self, current_version: int):
+        """Remove model version directories older than keep_versions"""
+        for entry in os.listdir(self.model_dir):
+            if entry.startswith('v') and entry[1:].isdigit():
+                if int(entry[1:]) <= current_version - self.keep_versions:
+                    # Memory-mapped files may still be open on some platforms
+                    shutil.rmtree(os.path.join(self.model_dir, entry), ignore_errors=True)
+
+    def _read_manifest_bundle(self) -> Optional[ModelBundle]:
+        """Load the bundle described by the manifest with memory-mapped arrays"""
+        if not os.path.exists(self.manifest_path):
+            return None
+
+        import joblib
+
+        with open(self.manifest_path, 'r') as f:
+            manifest = json.load(f)
+
+        if manifest.get('features') != self.features:
+            self.logger.warning("Saved models use a different feature list; ignoring them")
+            return None
+
+        loaded = {
+            name: joblib.load(os.path.join(self.model_dir, path), mmap_mode='r')
+            for name, path in manifest.get('files', {}).items()
+        }
+        trained_at = manifest.get('trained_at')
+
+        return ModelBundle(
+            version=manifest.get('version', 0),
+            trained_at=datetime.fromisoformat(trained_at) if trained_at else None,
+            evaluation=manifest.get('evaluation'),
+            **loaded
+        )
+
     def load_models(self) -> bool:
         """Load saved models"""
         try:
-            direction_model_path = os.path.join(self.model_dir, 'direction_model.pkl')
-            volatility_model_path = os.path.join(self.model_dir, 'volatility_model.pkl')
-            scaler_path = os.path.join(self.model_dir, 'scaler.pkl')
+            bundle = self._read_manifest_bundle()
+
+            if bundle is None:
+                # Legacy layout: one pickle per model
+                loaded = {}
+                for name in ('direction_model', 'volatility_model', 'scaler'):
+                    path = os.path.join(self.model_dir, f'{name}.pkl')
+                    if os.path.exists(path):
+                        with open(path, 'rb') as f:
+                            loaded[name] = pickle.load(f)
+                if not loaded:
+                    return False
+                bundle = ModelBundle(version=self.models.version, **loaded)
+
+            self._set_models(bundle)
+            self._models_loaded = True
+
+            self.logger.info(f"Models loaded successfully (version {bundle.version})")
+            return True
 
-            if os.path.exists(direction_model_path):
-                with open(direction_model_path, 'rb') as f:
-                    self.direction_model = pickle.load(f)
+        except Exception as e:
+            self.logger.error(f"Error loading models: {e}")
+            return False
 
-            if os.path.exists(volatility_model_path):
-                with open(volatility_model_path, 'rb') as f:
-                    self.volatility_model = pickle.load(f)
+    def retrain_with_new_data(self, df: pd.DataFrame, wait: bool = False) -> bool:
+        """Retrain models with new data in a background process
 
-            if os.path.exists(scaler_path):
-                with open(scaler_path, 'rb') as f:
-                    self.scaler = pickle.load(f)
+        The new bundle is written by the child process and hot-swapped in
+        once it has been published, so live predictions keep using the
+        current models in the meantime. Returns True if a retrain was
+        started (or, with ``wait=True``, if it completed successfully).
+        """
+        try:
+            with self._retrain_lock:
+                if self._retrain_future is not None and not self._retrain_future.done():
+                    self.logger.info("Retraining already in progress")
+                    return False
+
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=1)
+
+                self.logger.info("Retraining models with new data...")
+                self.last_retrain_time = time.time()
+                self._retrain_future = self._executor.submit(
+                    _retrain_worker, df, self.model_dir, self._current_models().version + 1, self.n_jobs
+                )
+                self._retrain_future.add_done_callback(self._on_retrain_done)
+                future = self._retrain_future
+
+            if wait:
+                # Swap here too so the caller sees the new models on return
+                self._on_retrain_done(future)
+                return bool(future.result())
 
-            self.logger.info("Models loaded successfully")
             return True
 
         except Exception as e:
-            self.logger.error(f"Error loading models: {e}")
+            self.logger.error(f"Error retraining models: {e}")
             return False
 
-    def retrain_with_new_data(self, df: pd.DataFrame) -> bool:
-        """Retrain models with new data"""
+    def _on_retrain_done(self, future: Future):
+        """Swap in the bundle published by a finished retrain"""
         try:
-            self.logger.info("Retraining models with new data...")
-            return self.train_models(df)
+            if not future.result():
+                self.logger.warning("Background retraining did not produce new models")
+                return
+
+            bundle = self._read_manifest_bundle()
+
+            if bundle is not None and bundle.version > self.models.version:
+                self._set_models(bundle)
+                self.logger.info(f"Hot-swapped models to version {bundle.version}")
 
         except Exception as e:
-            self.logger.error(f"Error retraining models: {e}")
+            self.logger.error(f"Error swapping retrained models: {e}")
+
+    def detect_drift(self, df: pd.DataFrame) -> bool:
+        """Check whether recent features drifted away from the training scaler"""
+        try:
+            models = self._current_models()
+            if not hasattr(models.scaler, 'mean_'):
+                return False
+
+            features_df = self.prepare_features(df.tail(self.drift_window + 50))
+            if features_df.empty:
+                return False
+
+            feature_columns = [col for col in self.features if col in features_df.columns]
+            X_scaled = models.scaler.transform(features_df[feature_columns].values[-self.drift_window:])
+            drift = float(np.abs(X_scaled.mean(axis=0)).max())
+
+            return drift > self.drift_threshold
+
+        except Exception as e:
+            self.logger.error(f"Error detecting drift: {e}")
             return False
 
+    def start_retraining_scheduler(self, data_provider: Callable[[], Optional[pd.DataFrame]]):
+        """Retrain on a schedule or on data drift, without blocking callers"""
+        if self._scheduler_active:
+            return
+
+        def scheduler():
+            while self._scheduler_active:
+                try:
+                    df = data_provider()
+                    if df is not None and len(df) > 0:
+                        due = time.time() - self.last_retrain_time >= self.retrain_interval
+                        if due or self._current_models().direction_model is None or self.detect_drift(df):
+                            self.retrain_with_new_data(df)
+                except Exception as e:
+                    self.logger.error(f"Error in retraining scheduler: {e}")
+
+                time.sleep(self.drift_check_interval)
+
+        self._scheduler_active = True
+        self._scheduler_thread = threading.Thread(target=scheduler, daemon=True, name="MLRetrainScheduler")
+        self._scheduler_thread.start()
+        self.logger.info("ML retraining scheduler started")
+
+    def stop_retraining_scheduler(self):
+        """Stop the retraining scheduler and worker process"""
+        self._scheduler_active = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self.logger.info("ML retraining scheduler stopped")
+
     def get_model_status(self) -> Dict[str, Any]:
         """Get model status information"""
         return {
             'direction_model_loaded': self.direction_model is not None,
             'volatility_model_loaded': self.volatility_model is not None,
             'scaler_loaded': hasattr(self.scaler, 'mean_'),
+            'model_version': self.models.version,
+            'trained_at': self.models.trained_at,
+            'models_loaded': self._models_loaded,
+            'inference_backend': self.inference_backend,
+            'compiled_models': self.models.direction_flat is not None,
+            'evaluation': self.models.evaluation,
+            'retraining': self._retrain_future is not None and not self._retrain_future.done(),
             'min_confidence': self.min_confidence,
             'prediction_horizon': self.prediction_horizon,
             'features_count': len(self.features)
@@ -4,19 +4,33 @@ Notification System for AuraTrade Bot
 Telegram and email notifications
 """
 
-import asyncio
+import heapq
 import requests
+import requests.adapters
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import threading
 import time
 from utils.logger import Logger
 
 class TelegramNotifier:
-    """Telegram notification system"""
+    """Telegram notification system
+
+    Callers never block: messages go into a bounded priority queue that a
+    single sender thread drains over a pooled HTTP session, honouring the
+    rate limit there. Trade notifications arriving within ``trade_window``
+    seconds are combined into one message.
+    """
+    
+    # Queue priorities (lower is sent first)
+    PRIORITY_URGENT = 0
+    PRIORITY_TRADE = 1
+    PRIORITY_NORMAL = 2
+    
+    MAX_MESSAGE_LENGTH = 4000  # Telegram limit is 4096
     
     def __init__(self, credentials: Dict[str, Any]):
         self.logger = Logger().get_logger()
@@ -26,10 +40,30 @@ class TelegramNotifier:
         self.chat_id = credentials.get('telegram_chat_id', '')
         self.enabled = bool(self.bot_token and self.chat_id)
         
-        # Rate limiting
+        # Rate limiting (applied on the sender thread only)
         self.last_message_time = 0
-        self.min_interval = 5  # Minimum 5 seconds between messages
-        self.message_queue = []
+        self.min_interval = 1.0  # Telegram allows about one message per second per chat
+        self.request_timeout = 10
+        
+        # Bounded priority queue of (priority, seq, message)
+        self.max_queue_size = 100
+        self.message_queue: List[Tuple[int, int, str]] = []
+        self._seq = 0
+        self._condition = threading.Condition()
+        
+        # Trade notification coalescing
+        self.trade_window = 2.0
+        self.max_trades_per_message = 10
+        self.pending_trades: List[str] = []
+        self.trade_deadline = 0.0
+        
+        # Statistics
+        self.messages_sent = 0
+        self.messages_failed = 0
+        self.messages_dropped = 0
+        self.trades_coalesced = 0
+        
+        self.session = None
         self.queue_thread = None
         self.queue_active = False
         
@@ -46,36 +80,89 @@ class TelegramNotifier:
             self.queue_thread = threading.Thread(target=self._process_queue, daemon=True)
             self.queue_thread.start()
     
+    def _create_session(self) -> requests.Session:
+        """HTTP session with a small keep-alive pool for api.telegram.org"""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        session.mount('https://', adapter)
+        return session
+    
+    def _enqueue(self, message: str, priority: int):
+        """Add a message without blocking; drops the lowest-priority one when full"""
+        with self._condition:
+            self._seq += 1
+            heapq.heappush(self.message_queue, (priority, self._seq, message))
+            if len(self.message_queue) > self.max_queue_size:
+                worst = max(self.message_queue)
+                self.message_queue.remove(worst)
+                heapq.heapify(self.message_queue)
+                self.messages_dropped += 1
+            self._condition.notify()
+    
+    def _next_message(self) -> Optional[str]:
+        """Wait for the next message to send (None when stopping with nothing left)"""
+        with self._condition:
+            while True:
+                now = time.time()
+                if self.pending_trades and (now >= self.trade_deadline or not self.queue_active):
+                    self._flush_trades()
+                if self.message_queue:
+                    return heapq.heappop(self.message_queue)[2]
+                if not self.queue_active:
+                    return None
+                timeout = max(0.0, self.trade_deadline - now) if self.pending_trades else 1.0
+                self._condition.wait(timeout)
+    
+    def _flush_trades(self):
+        """Combine buffered trade notifications into messages (condition held)"""
+        trades, self.pending_trades = self.pending_trades, []
+        for start in range(0, len(trades), self.max_trades_per_message):
+            batch = trades[start:start + self.max_trades_per_message]
+            if len(batch) == 1:
+                message = batch[0]
+            else:
+                message = f"📦 **{len(batch)} TRADES**\n\n" + "\n\n".join(batch)
+                self.trades_coalesced += len(batch) - 1
+            self._seq += 1
+            heapq.heappush(self.message_queue, (self.PRIORITY_TRADE, self._seq, message))
+    
     def _process_queue(self):
         """Process message queue"""
-        while self.queue_active:
+        self.session = self._create_session()
+        while True:
             try:
-                if self.message_queue:
-                    message = self.message_queue.pop(0)
-                    self._send_immediate(message)
-                    time.sleep(self.min_interval)
-                else:
-                    time.sleep(1)
+                message = self._next_message()
+                if message is None:
+                    break
+                self._send_immediate(message)
             except Exception as e:
                 self.logger.error(f"Error processing message queue: {e}")
-                time.sleep(5)
+                time.sleep(1)
+        self.session.close()
     
     def send_message(self, message: str, urgent: bool = False):
-        """Send message via Telegram"""
+        """Queue a message for Telegram (never blocks the caller)"""
         try:
             if not self.enabled:
                 return
             
-            if urgent:
-                self._send_immediate(message)
-            else:
-                self.message_queue.append(message)
+            self._enqueue(message, self.PRIORITY_URGENT if urgent else self.PRIORITY_NORMAL)
                 
         except Exception as e:
             self.logger.error(f"Error queuing Telegram message: {e}")
     
+    def _queue_trade(self, message: str):
+        """Buffer a trade notification for the current coalescing window"""
+        if not self.enabled:
+            return
+        with self._condition:
+            if not self.pending_trades:
+                self.trade_deadline = time.time() + self.trade_window
+            self.pending_trades.append(message)
+            self._condition.notify()
+    
     def _send_immediate(self, message: str):
-        """Send message immediately"""
+        """Send one message (sender thread only)"""
         try:
             if not self.enabled:
                 return
@@ -89,6 +176,8 @@ class TelegramNotifier:
             
             # Format message
             formatted_message = f"🤖 **AuraTrade Bot**\n\n{message}"
+            if len(formatted_message) > self.MAX_MESSAGE_LENGTH:
+                formatted_message = formatted_message[:self.MAX_MESSAGE_LENGTH - 3] + "..."
             
             data = {
                 'chat_id': self.chat_id,
@@ -97,16 +186,30 @@ class TelegramNotifier:
                 'disable_web_page_preview': True
             }
             
-            response = requests.post(url, data=data, timeout=10)
+            session = self.session or requests
+            response = session.post(url, data=data, timeout=self.request_timeout)
+            self.last_message_time = time.time()
             
             if response.status_code == 200:
+                self.messages_sent += 1
                 self.logger.debug("Telegram message sent successfully")
+            elif response.status_code == 429:
+                # Flood control: wait as instructed, then retry once
+                retry_after = response.json().get('parameters', {}).get('retry_after', self.min_interval)
+                self.logger.warning(f"Telegram rate limit hit, retrying in {retry_after}s")
+                time.sleep(retry_after)
+                response = session.post(url, data=data, timeout=self.request_timeout)
+                self.last_message_time = time.time()
+                if response.status_code == 200:
+                    self.messages_sent += 1
+                else:
+                    self.messages_failed += 1
             else:
+                self.messages_failed += 1
                 self.logger.error(f"Failed to send Telegram message: {response.status_code}")
             
-            self.last_message_time = time.time()
-            
         except Exception as e:
+            self.messages_failed += 1
             self.logger.error(f"Error sending Telegram message: {e}")
     
     def send_trade_notification(self, action: str, symbol: str, order_type: str, 
@@ -140,7 +243,7 @@ class TelegramNotifier:
             
             message += f"⏰ {datetime.now().strftime('%H:%M:%S')}"
             
-            self.send_message(message)
+            self._queue_trade(message)
             
         except Exception as e:
             self.logger.error(f"Error sending trade notification: {e}")
@@ -259,12 +362,29 @@ class TelegramNotifier:
         except Exception as e:
             self.logger.error(f"Error sending daily summary: {e}")
     
-    def stop(self):
-        """Stop the notifier"""
+    def get_stats(self) -> Dict[str, Any]:
+        """Notifier statistics"""
+        with self._condition:
+            queued = len(self.message_queue)
+            pending_trades = len(self.pending_trades)
+        return {
+            'enabled': self.enabled,
+            'queued': queued,
+            'pending_trades': pending_trades,
+            'sent': self.messages_sent,
+            'failed': self.messages_failed,
+            'dropped': self.messages_dropped,
+            'trades_coalesced': self.trades_coalesced
+        }
+    
+    def stop(self, timeout: float = 10.0):
+        """Stop the notifier after sending what is still queued (up to ``timeout``)"""
         try:
-            self.queue_active = False
+            with self._condition:
+                self.queue_active = False
+                self._condition.notify()
             if self.queue_thread:
-                self.queue_thread.join(timeout=5)
+                self.queue_thread.join(timeout=timeout)
             self.logger.info("Telegram notifier stopped")
             
         except Exception as e:
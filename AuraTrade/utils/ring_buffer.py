@@ -0,0 +1,55 @@
+"""
+Ring buffers for AuraTrade Bot
+Fixed-size structure-of-arrays storage for tick streams
+"""
+
+import numpy as np
+
+class TickRing:
+    """Preallocated structure-of-arrays tick ring buffer
+
+    Every value is written twice, at ``i`` and ``i + capacity``, so the
+    most recent ``n`` ticks are always one contiguous slice and windows
+    are returned as views without copying.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self.bids = np.zeros(2 * capacity, dtype=np.float64)
+        self.asks = np.zeros(2 * capacity, dtype=np.float64)
+        self.mids = np.zeros(2 * capacity, dtype=np.float64)
+        self.spreads = np.zeros(2 * capacity, dtype=np.float64)
+        self.head = 0
+        self.count = 0
+
+    def append(self, timestamp: float, bid: float, ask: float):
+        """Append a tick in O(1)"""
+        i = self.head
+        j = i + self.capacity
+        self.timestamps[i] = self.timestamps[j] = timestamp
+        self.bids[i] = self.bids[j] = bid
+        self.asks[i] = self.asks[j] = ask
+        self.mids[i] = self.mids[j] = (bid + ask) / 2
+        self.spreads[i] = self.spreads[j] = ask - bid
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def window(self, array: np.ndarray, n: int) -> np.ndarray:
+        """Return a view over the last ``n`` values of ``array``"""
+        n = min(n, self.count)
+        end = self.head + self.capacity
+        return array[end - n:end]
+
+    def latest(self, array: np.ndarray) -> float:
+        """Return the most recent value of ``array``"""
+        return float(array[self.head + self.capacity - 1])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self):
+        """Forget all stored ticks"""
+        self.head = 0
+        self.count = 0
@@ -0,0 +1,66 @@
+"""
+Startup Timer for AuraTrade Bot
+Per-component import and initialization timing for the startup report
+"""
+
+import importlib
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional
+
+class StartupTimer:
+    """Records how long each component takes to import and to initialize"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.order: List[str] = []
+        self.skipped: List[str] = []
+
+    @contextmanager
+    def measure(self, component: str, phase: str = 'init'):
+        """Time a block as ``phase`` ('import' or 'init') of ``component``"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(component, phase, (time.perf_counter() - started) * 1000)
+
+    def record(self, component: str, phase: str, elapsed_ms: float):
+        if component not in self.timings:
+            self.timings[component] = {'import': 0.0, 'init': 0.0}
+            self.order.append(component)
+        self.timings[component][phase] = self.timings[component].get(phase, 0.0) + elapsed_ms
+
+    def load(self, component: str, module: str, attribute: Optional[str] = None) -> Any:
+        """Import ``module`` (and return ``attribute`` from it), timed as an import"""
+        with self.measure(component, 'import'):
+            loaded = importlib.import_module(module)
+            return getattr(loaded, attribute) if attribute else loaded
+
+    def skip(self, component: str):
+        """Note a component that was not loaded because it is disabled"""
+        if component not in self.skipped:
+            self.skipped.append(component)
+
+    def get_report(self) -> Dict[str, Any]:
+        """Timings per component plus the total since the timer was created"""
+        return {
+            'components': {name: {phase: round(ms, 1) for phase, ms in self.timings[name].items()}
+                           for name in self.order},
+            'skipped': list(self.skipped),
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 1)
+        }
+
+    def format_report(self) -> str:
+        """Startup report as a text table"""
+        lines = [f"{'Component':<22} {'Import ms':>10} {'Init ms':>10} {'Total ms':>10}"]
+        for name in self.order:
+            timing = self.timings[name]
+            lines.append(f"{name:<22} {timing['import']:>10.1f} {timing['init']:>10.1f} "
+                         f"{timing['import'] + timing['init']:>10.1f}")
+        lines.append(f"{'startup total':<22} {'':>10} {'':>10} "
+                     f"{(time.perf_counter() - self.started) * 1000:>10.1f}")
+        if self.skipped:
+            lines.append(f"Not loaded (disabled): {', '.join(self.skipped)}")
+        return "\n".join(lines)
@@ -0,0 +1,351 @@
+"""
+Status Server for AuraTrade Bot
+Headless asyncio HTTP/WebSocket endpoint streaming bot state as JSON
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Optional, Set
+from utils.logger import Logger
+
+WS_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+SECTIONS = ('account', 'positions', 'status', 'analysis')
+
+def to_jsonable(value: Any) -> Any:
+    """Convert a state value to plain JSON types (datetimes, numpy scalars, enums)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if hasattr(value, 'tolist'):  # numpy arrays and scalars
+        return to_jsonable(value.tolist())
+    if hasattr(value, 'value') and hasattr(value, 'name'):  # enums
+        return to_jsonable(value.value)
+    return str(value)
+
+def diff_section(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Keys whose value changed and keys that disappeared"""
+    changed = {k: v for k, v in new.items() if old.get(k) != v}
+    removed = [k for k in old if k not in new]
+    result = {}
+    if changed:
+        result['set'] = changed
+    if removed:
+        result['remove'] = removed
+    return result
+
+def ws_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """Encode a single unmasked server frame"""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return header + payload
+
+class StatusServer:
+    """Read-only JSON status service for headless deployments
+
+    One collector polls the terminal and the trading engine at a fixed
+    interval, whatever the number of viewers. ``GET /status`` serves the
+    cached state; WebSocket clients on ``/ws`` receive a full snapshot on
+    connect and then only the per-section changes of each poll, encoded
+    once and written to every client. Uses only the standard library.
+
+    Endpoints: ``/status``, ``/status/<section>``, ``/health``, ``/ws``.
+    """
+
+    def __init__(self, mt5_connector, trading_engine=None, host: str = '127.0.0.1',
+                 port: int = 8765, interval: float = 1.0):
+        self.logger = Logger().get_logger()
+        self.mt5_connector = mt5_connector
+        self.trading_engine = trading_engine
+        self.host = host
+        self.port = port
+        self.interval = interval
+
+        # Slow WebSocket clients are dropped above this many unsent bytes
+        self.max_client_buffer = 1024 * 1024
+        self.max_request_size = 8192
+
+        self.state: Dict[str, Any] = {section: {} for section in SECTIONS}
+        self.state['connected'] = False
+        self.state['timestamp'] = None
+        self.seq = 0
+        self.clients: Set[asyncio.StreamWriter] = set()
+        self.handlers: Set[asyncio.Task] = set()
+
+        # Statistics
+        self.polls = 0
+        self.updates_sent = 0
+        self.http_requests = 0
+        self.collect_ms = 0.0
+
+        self.running = False
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.server = None
+        self.server_thread = None
+        self._ready = threading.Event()
+
+    def start(self) -> bool:
+        """Start serving on a background thread"""
+        if self.running:
+            return True
+        self.running = True
+        self._ready.clear()
+        self.server_thread = threading.Thread(target=self._run, daemon=True)
+        self.server_thread.start()
+        self._ready.wait(timeout=5)
+        return self.server is not None
+
+    def stop(self):
+        """Stop serving and disconnect all clients"""
+        self.running = False
+        if self.server_thread and self.server_thread.is_alive():
+            self.server_thread.join(timeout=5)
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._serve())
+        except Exception as e:
+            self.logger.error(f"Error in status server: {e}")
+        finally:
+            self.running = False
+            self._ready.set()
+            self.loop.close()
+
+    async def _serve(self):
+        try:
+            self.server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        except OSError as e:
+            self.logger.error(f"Error starting status server on {self.host}:{self.port}: {e}")
+            self.server = None
+            return
+        finally:
+            self._ready.set()
+
+        self.logger.info(f"Status server listening on http://{self.host}:{self.port}")
+        poller = asyncio.ensure_future(self._poll_loop())
+        try:
+            while self.running:
+                await asyncio.sleep(0.1)
+        finally:
+            poller.cancel()
+            self.server.close()
+            # Closing the transports ends the handlers' pending reads
+            for writer in list(self.clients):
+                writer.close()
+            if self.handlers:
+                await asyncio.wait(list(self.handlers), timeout=2)
+
+    async def _poll_loop(self):
+        loop = asyncio.get_event_loop()
+        while self.running:
+            started = time.perf_counter()
+            try:
+                # Terminal calls block, so they run off the event loop
+                state = await loop.run_in_executor(None, self.collect)
+                self._publish(state)
+            except Exception as e:
+                self.logger.error(f"Error collecting status: {e}")
+            elapsed = time.perf_counter() - started
+            await asyncio.sleep(max(0.0, self.interval - elapsed))
+
+    def collect(self) -> Dict[str, Any]:
+        """Gather the current state as JSON-ready sections"""
+        started = time.perf_counter()
+        state: Dict[str, Any] = {section: {} for section in SECTIONS}
+
+        try:
+            state['connected'] = bool(self.mt5_connector.check_connection())
+        except Exception as e:
+            self.logger.error(f"Error checking connection: {e}")
+            state['connected'] = False
+
+        if state['connected']:
+            try:
+                state['account'] = to_jsonable(self.mt5_connector.get_account_info() or {})
+            except Exception as e:
+                self.logger.error(f"Error getting account info: {e}")
+                state['account'] = self.state.get('account', {})
+            try:
+                positions = self.mt5_connector.get_positions() or []
+                state['positions'] = {str(p['ticket']): to_jsonable(p) for p in positions if 'ticket' in p}
+            except Exception as e:
+                self.logger.error(f"Error getting positions: {e}")
+                state['positions'] = self.state.get('positions', {})
+
+        if self.trading_engine is not None:
+            try:
+                if hasattr(self.trading_engine, 'get_status'):
+                    state['status'] = to_jsonable(self.trading_engine.get_status())
+                if hasattr(self.trading_engine, 'get_latest_analysis'):
+                    for symbol in getattr(self.trading_engine, 'symbols', []):
+                        analysis = self.trading_engine.get_latest_analysis(symbol)
+                        if analysis:
+                            state['analysis'][symbol] = to_jsonable(analysis)
+            except Exception as e:
+                self.logger.error(f"Error getting engine status: {e}")
+
+        self.polls += 1
+        self.collect_ms = (time.perf_counter() - started) * 1000
+        return state
+
+    def _publish(self, state: Dict[str, Any]):
+        """Merge a collected state and push its changes to WebSocket clients"""
+        changes: Dict[str, Any] = {}
+        for section in SECTIONS:
+            section_diff = diff_section(self.state.get(section, {}), state[section])
+            if section_diff:
+                changes[section] = section_diff
+        if state['connected'] != self.state['connected']:
+            changes['connected'] = state['connected']
+
+        state['timestamp'] = datetime.now().isoformat()
+        self.state = state
+        if not changes:
+            return
+
+        self.seq += 1
+        if not self.clients:
+            return
+
+        message = {'type': 'update', 'seq': self.seq, 'timestamp': state['timestamp'], 'changes': changes}
+        self._broadcast(ws_frame(json.dumps(message).encode('utf-8')))
+        self.updates_sent += 1
+
+    def _broadcast(self, frame: bytes):
+        for writer in list(self.clients):
+            if writer.transport.get_write_buffer_size() > self.max_client_buffer:
+                self.logger.warning("Dropping slow status client")
+                self.clients.discard(writer)
+                writer.close()
+                continue
+            writer.write(frame)
+
+    def snapshot_message(self) -> Dict[str, Any]:
+        """Full state as sent to a new WebSocket client"""
+        return {'type': 'snapshot', 'seq': self.seq, 'timestamp': self.state.get('timestamp'), 'state': self.state}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self.handlers.add(task)
+        try:
+            request = await reader.readuntil(b'\r\n\r\n')
+            if len(request) > self.max_request_size:
+                await self._respond(writer, 431, {'error': 'request too large'})
+                return
+
+            lines = request.decode('latin-1').split('\r\n')
+            parts = lines[0].split(' ')
+            if len(parts) < 2 or parts[0] != 'GET':
+                await self._respond(writer, 405, {'error': 'only GET is supported'})
+                return
+
+            headers = {}
+            for line in lines[1:]:
+                if ':' in line:
+                    key, value = line.split(':', 1)
+                    headers[key.strip().lower()] = value.strip()
+
+            path = parts[1].split('?', 1)[0].rstrip('/') or '/'
+            self.http_requests += 1
+
+            if path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                await self._websocket(reader, writer, headers)
+            elif path in ('/', '/status'):
+                await self._respond(writer, 200, {'seq': self.seq, **self.state})
+            elif path.startswith('/status/') and path[8:] in self.state:
+                await self._respond(writer, 200, {'seq': self.seq, path[8:]: self.state[path[8:]]})
+            elif path == '/health':
+                await self._respond(writer, 200, self.get_stats())
+            else:
+                await self._respond(writer, 404, {'error': f'unknown path {path}'})
+
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        except Exception as e:
+            self.logger.error(f"Error handling status request: {e}")
+        finally:
+            self.handlers.discard(task)
+            self.clients.discard(writer)
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, code: int, body: Dict[str, Any]):
+        reasons = {200: 'OK', 404: 'Not Found', 405: 'Method Not Allowed', 431: 'Request Header Fields Too Large'}
+        payload = json.dumps(body).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {code} {reasons.get(code, 'Error')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Access-Control-Allow-Origin: *\r\n"
+            f"Connection: close\r\n\r\n".encode('latin-1') + payload
+        )
+        await writer.drain()
+
+    async def _websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                         headers: Dict[str, str]):
+        key = headers.get('sec-websocket-key')
+        if not key:
+            await self._respond(writer, 404, {'error': 'missing Sec-WebSocket-Key'})
+            return
+
+        accept = base64.b64encode(hashlib.sha1(key.encode('latin-1') + WS_GUID).digest()).decode('latin-1')
+        writer.write(
+            ("HTTP/1.1 101 Switching Protocols\r\n"
+             "Upgrade: websocket\r\n"
+             "Connection: Upgrade\r\n"
+             f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode('latin-1')
+        )
+        writer.write(ws_frame(json.dumps(self.snapshot_message()).encode('utf-8')))
+        await writer.drain()
+        self.clients.add(writer)
+
+        # Clients only send control frames; answer pings and stop on close
+        while self.running:
+            header = await reader.readexactly(2)
+            opcode = header[0] & 0x0F
+            length = header[1] & 0x7F
+            if length == 126:
+                length = struct.unpack('!H', await reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack('!Q', await reader.readexactly(8))[0]
+            if length > self.max_request_size:
+                break
+            mask = await reader.readexactly(4) if header[1] & 0x80 else b'\x00\x00\x00\x00'
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(await reader.readexactly(length)))
+
+            if opcode == 0x8:
+                writer.write(ws_frame(payload[:2], opcode=0x8))
+                break
+            if opcode == 0x9:
+                writer.write(ws_frame(payload, opcode=0xA))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Server statistics"""
+        return {
+            'running': self.running,
+            'clients': len(self.clients),
+            'seq': self.seq,
+            'polls': self.polls,
+            'updates_sent': self.updates_sent,
+            'http_requests': self.http_requests,
+            'collect_ms': round(self.collect_ms, 2)
+        }
@@ -0,0 +1,139 @@
+"""
+Flat Tree-Ensemble Inference for AuraTrade Bot
+NumPy node arrays and vectorized traversal for trained sklearn forests/GBMs
+"""
+
+import numpy as np
+from typing import Any, List
+
+class FlatTreeEnsemble:
+    """Tree ensemble compiled into flat NumPy node arrays
+
+    All trees are concatenated into shared ``feature``/``threshold``/
+    ``left``/``right``/``value`` arrays. Leaves point to themselves, so a
+    batch is evaluated by stepping every (row, tree) cursor ``max_depth``
+    times with pure array indexing and no Python per-node work.
+
+    Supports ``RandomForestClassifier`` (mean of per-tree leaf class
+    fractions) and ``GradientBoostingClassifier`` (initial raw score plus
+    learning-rate scaled tree sums, then sigmoid/softmax).
+    """
+
+    def __init__(self, model: Any):
+        self.classes_ = model.classes_
+        self.n_features_in_ = model.n_features_in_
+
+        if hasattr(model, 'learning_rate'):
+            self.kind = 'gbm'
+            trees = [est.tree_ for est in np.asarray(model.estimators_).ravel()]
+            self.n_outputs = model.estimators_.shape[1]
+            self.learning_rate = model.learning_rate
+        else:
+            self.kind = 'forest'
+            trees = [est.tree_ for est in model.estimators_]
+            self.n_outputs = len(self.classes_)
+
+        self._flatten(trees)
+
+        if self.kind == 'gbm':
+            # Constant initial raw score: decision_function minus tree sums
+            probe = np.zeros((1, self.n_features_in_))
+            raw = np.asarray(model.decision_function(probe), dtype=np.float64).reshape(1, -1)
+            self.init_raw = (raw - self.learning_rate * self._tree_sums(probe))[0]
+
+    def _flatten(self, trees: List[Any]):
+        """Concatenate sklearn tree node arrays into global flat arrays"""
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+
+        for tree in trees:
+            n = tree.node_count
+            node_ids = np.arange(n, dtype=np.int64) + offset
+            is_leaf = tree.children_left == -1
+
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.int64))
+            thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset))
+            rights.append(np.where(is_leaf, node_ids, tree.children_right + offset))
+
+            value = np.asarray(tree.value, dtype=np.float64)[:, 0, :]
+            if self.kind == 'forest':
+                # Leaf class counts/weights -> class fractions
+                totals = value.sum(axis=1, keepdims=True)
+                value = np.divide(value, totals, out=np.zeros_like(value), where=totals > 0)
+            else:
+                value = value[:, :1]
+            values.append(value)
+
+            roots.append(offset)
+            offset += n
+            max_depth = max(max_depth, tree.max_depth)
+
+        self.feature = np.concatenate(features)
+        self.threshold = np.concatenate(thresholds)
+        self.left = np.concatenate(lefts)
+        self.right = np.concatenate(rights)
+        self.value = np.concatenate(values)
+        self.roots = np.asarray(roots, dtype=np.int64)
+        self.max_depth = max_depth
+
+    def _leaves(self, X: np.ndarray) -> np.ndarray:
+        """Leaf node index for every (row, tree) pair"""
+        # sklearn compares float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], self.roots.size)).copy()
+
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        return nodes
+
+    def _tree_sums(self, X: np.ndarray) -> np.ndarray:
+        """Sum of GBM tree outputs per class column, shape (rows, n_outputs)"""
+        leaf_values = self.value[self._leaves(X), 0]  # (rows, trees)
+        n_rows = leaf_values.shape[0]
+        return leaf_values.reshape(n_rows, -1, self.n_outputs).sum(axis=1)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Class probabilities, matching the source sklearn model"""
+        X = np.atleast_2d(X)
+
+        if self.kind == 'forest':
+            return self.value[self._leaves(X)].mean(axis=1)
+
+        raw = self.init_raw + self.learning_rate * self._tree_sums(X)
+        if self.n_outputs == 1:
+            p = 1.0 / (1.0 + np.exp(-raw[:, 0]))
+            return np.column_stack([1.0 - p, p])
+
+        raw = raw - raw.max(axis=1, keepdims=True)
+        exp = np.exp(raw)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predicted classes"""
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+def compile_ensemble(model: Any, sample: np.ndarray, tolerance: float = 1e-9):
+    """Compile ``model`` and verify parity with sklearn on ``sample``
+
+    Returns the compiled ensemble, or None if the model is unsupported or its
+    probabilities differ from sklearn's by more than ``tolerance``.
+    """
+    if model is None:
+        return None
+
+    try:
+        flat = FlatTreeEnsemble(model)
+    except (AttributeError, ValueError, IndexError):
+        return None
+
+    expected = model.predict_proba(sample)
+    actual = flat.predict_proba(sample)
+    if actual.shape != expected.shape or np.abs(actual - expected).max() > tolerance:
+        return None
+
+    return flat